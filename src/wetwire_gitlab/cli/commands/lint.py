@@ -16,7 +16,12 @@ def run_lint(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0=no issues, 1=issues found, 2=error).
     """
-    from wetwire_gitlab.linter import fix_file, lint_directory, lint_file
+    from wetwire_gitlab.linter import (
+        fix_file,
+        iter_python_files,
+        lint_directory,
+        lint_file,
+    )
 
     path = Path(args.path)
 
@@ -33,12 +38,8 @@ def run_lint(args: argparse.Namespace) -> int:
                 fixed_count += 1
                 print(f"Fixed: {path}")
         else:
-            for py_file in path.rglob("*.py"):
-                # Skip __pycache__ and hidden directories
-                if "__pycache__" in str(py_file) or any(
-                    p.startswith(".") for p in py_file.parts
-                ):
-                    continue
+            # Same files lint_directory checks below
+            for py_file in iter_python_files(path):
                 original = py_file.read_text()
                 fixed = fix_file(str(py_file), write=True)
                 if fixed != original:
@@ -48,10 +49,12 @@ def run_lint(args: argparse.Namespace) -> int:
             print(f"\nFixed {fixed_count} file(s)")
 
     # Lint the path
+    cache_dir = getattr(args, "cache_dir", None)
+    cache_dir = Path(cache_dir) if cache_dir else None
     if path.is_file():
-        result = lint_file(path)
+        result = lint_file(path, cache_dir=cache_dir)
     else:
-        result = lint_directory(path)
+        result = lint_directory(path, cache_dir=cache_dir)
 
     # Output results
     if args.format == "json":
@@ -156,6 +156,11 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Automatically fix issues where possible",
     )
+    lint_parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Reuse results for unchanged files from this directory",
+    )
     lint_parser.add_argument(
         "-f",
         "--format",
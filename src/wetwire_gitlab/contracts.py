@@ -1,7 +1,8 @@
 """Contracts and protocols for wetwire-gitlab."""
 
 import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from typing import Any, Protocol, runtime_checkable
 
 
@@ -143,7 +144,7 @@ class BuildManifest:
         return json.dumps(self.to_dict(), indent=indent)
 
 
-@dataclass
+@dataclass(slots=True)
 class LintIssue:
     """A single lint issue.
 
@@ -171,6 +172,18 @@ class LintIssue:
     fix_imports: list[str] | None = None
     insert_after_line: int | None = None
 
+    def __reduce__(self) -> tuple[type["LintIssue"], tuple[Any, ...]]:
+        """Pickle as the positional field values.
+
+        lint_directory's worker processes send issues back pickled; the
+        default slots state repeats every field name per issue, roughly
+        doubling the payload.
+        """
+        return type(self), _lint_issue_values(self)
+
+
+_lint_issue_values = attrgetter(*(f.name for f in fields(LintIssue)))
+
 
 @dataclass
 class LintResult:
@@ -186,6 +199,18 @@ class LintResult:
     issues: list[LintIssue]
     files_checked: int
 
+    def issues_by_code(self) -> dict[str, list[LintIssue]]:
+        """Group the issues by rule code in a single pass.
+
+        Returns:
+            Mapping of rule code to its issues, in the order they were
+            reported. Codes without issues are absent.
+        """
+        grouped: dict[str, list[LintIssue]] = {}
+        for issue in self.issues:
+            grouped.setdefault(issue.code, []).append(issue)
+        return grouped
+
 
 @dataclass
 class ValidateResult:
@@ -2,7 +2,7 @@
 
 from .codegen import generate_python_code
 from .ir import IRInclude, IRJob, IRPipeline, IRRule
-from .parser import parse_gitlab_ci, parse_gitlab_ci_file
+from .parser import parse_gitlab_ci, parse_gitlab_ci_dict, parse_gitlab_ci_file
 
 __all__ = [
     "IRInclude",
@@ -11,5 +11,6 @@ __all__ = [
     "IRRule",
     "generate_python_code",
     "parse_gitlab_ci",
+    "parse_gitlab_ci_dict",
     "parse_gitlab_ci_file",
 ]
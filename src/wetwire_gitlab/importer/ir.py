@@ -7,10 +7,11 @@ conversion to typed Python objects.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from operator import methodcaller
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from wetwire_gitlab.pipeline import Pipeline
+    from wetwire_gitlab.pipeline import Job, Pipeline
 
 
 @dataclass
@@ -204,6 +205,14 @@ class IRPipeline:
     cache: dict[str, Any] | list[dict[str, Any]] | None = None
     services: list[str | dict[str, Any]] | None = None
 
+    def to_jobs(self) -> list[Job]:
+        """Convert all IRJobs to typed Job objects, in order.
+
+        Returns:
+            List of Job instances.
+        """
+        return list(map(methodcaller("to_job"), self.jobs))
+
     def to_pipeline(self) -> Pipeline:
         """Convert IRPipeline to typed Pipeline object.
 
@@ -9,6 +9,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 from .ir import IRInclude, IRJob, IRPipeline, IRRule
 
 # Reserved keys that are not job definitions
@@ -124,8 +129,21 @@ def parse_gitlab_ci(yaml_content: str) -> IRPipeline:
     Returns:
         IRPipeline instance.
     """
-    data = yaml.safe_load(yaml_content)
+    return parse_gitlab_ci_dict(yaml.load(yaml_content, Loader=SafeLoader))
+
+
+def parse_gitlab_ci_dict(data: dict[str, Any] | None) -> IRPipeline:
+    """Parse a GitLab CI configuration dictionary into intermediate representation.
 
+    Use this when the configuration is available as a dictionary (for example
+    loaded from JSON) to skip YAML parsing.
+
+    Args:
+        data: Configuration dictionary as produced by loading .gitlab-ci.yml.
+
+    Returns:
+        IRPipeline instance.
+    """
     if not data:
         return IRPipeline()
 
@@ -1,6 +1,14 @@
 """Linter module for wetwire-gitlab."""
 
-from .linter import fix_code, fix_file, lint_code, lint_directory, lint_file
+from .linter import (
+    fix_code,
+    fix_file,
+    iter_python_files,
+    lint_code,
+    lint_directory,
+    lint_file,
+    lint_source,
+)
 from .rules import (
     ALL_RULES,
     RULE_REGISTRY,
@@ -70,7 +78,9 @@ __all__ = [
     # Functions
     "fix_code",
     "fix_file",
+    "iter_python_files",
     "lint_code",
     "lint_directory",
     "lint_file",
+    "lint_source",
 ]
@@ -5,14 +5,32 @@ pipeline definitions.
 """
 
 import ast
+import functools
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from collections.abc import Iterator
+from dataclasses import asdict
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from .. import __version__
 from ..contracts import LintIssue, LintResult
 from .rules import (
     RULE_REGISTRY,
     WGL008FileTooLarge,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# Directories with fewer Python files than this are linted without a
+# process pool
+_PARALLEL_MIN_FILES = 256
+
 
 def _should_skip_directory(name: str) -> bool:
     """Check if a directory should be skipped during linting.
@@ -26,12 +44,110 @@ def _should_skip_directory(name: str) -> bool:
     return name == "__pycache__" or name.startswith(".")
 
 
+def _executor_class() -> "type[Executor]":
+    """Pick the pool type for linting files in parallel.
+
+    Free-threaded builds (3.13t) run threads in parallel, so a thread pool
+    avoids starting worker processes; with the GIL, only processes help.
+
+    concurrent.futures is imported here rather than at module level: it
+    pulls in multiprocessing and logging, which would otherwise be paid on
+    every CLI start even though only large directories use a pool.
+
+    Returns:
+        ThreadPoolExecutor without the GIL, else ProcessPoolExecutor.
+    """
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is not None and not is_gil_enabled():
+        return ThreadPoolExecutor
+    return ProcessPoolExecutor
+
+
+def iter_python_files(directory: Path) -> Iterator[Path]:
+    """Yield the Python files under a directory, recursively.
+
+    Skipped directories (see _should_skip_directory) are pruned rather than
+    walked and filtered afterwards, so trees such as .git or .venv are never
+    listed. Symlinked directories are not followed, and directories that
+    cannot be read (no permission, removed during the walk) are skipped.
+
+    Args:
+        directory: Directory to search.
+
+    Yields:
+        Paths of the .py files found.
+    """
+    stack = [directory]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not _should_skip_directory(entry.name):
+                        stack.append(Path(entry.path))
+                elif entry.name.endswith(".py") and entry.is_file():
+                    yield Path(entry.path)
+
+
+def _run_rules(
+    tree: ast.Module,
+    file_path: Path,
+    *,
+    rules: list[str] | None,
+    exclude_rules: list[str] | None,
+    max_jobs: int,
+) -> list[LintIssue]:
+    """Run the selected rules over a parsed module.
+
+    Every rule receives the same tree, so the source is parsed once however
+    many rules run.
+
+    Args:
+        tree: Parsed module to check.
+        file_path: Path reported in the issues.
+        rules: List of rule codes to run (None = all rules).
+        exclude_rules: List of rule codes to exclude.
+        max_jobs: Maximum number of jobs allowed per file.
+
+    Returns:
+        List of LintIssue objects.
+    """
+    # Determine which rules to run
+    rules_to_run = rules if rules is not None else list(RULE_REGISTRY.keys())
+
+    if exclude_rules:
+        rules_to_run = [r for r in rules_to_run if r not in exclude_rules]
+
+    all_issues: list[LintIssue] = []
+    for rule_code in rules_to_run:
+        if rule_code not in RULE_REGISTRY:
+            continue
+
+        rule_class = RULE_REGISTRY[rule_code]
+
+        # Handle rules with special initialization
+        if rule_class == WGL008FileTooLarge:
+            rule = rule_class(max_jobs=max_jobs)
+        else:
+            rule = rule_class()
+
+        all_issues.extend(rule.check(tree, file_path))
+
+    return all_issues
+
+
 def lint_file(
     file_path: Path,
     *,
     rules: list[str] | None = None,
     exclude_rules: list[str] | None = None,
     max_jobs: int = 10,
+    cache_dir: Path | None = None,
 ) -> LintResult:
     """Lint a single Python file.
 
@@ -40,6 +156,9 @@ def lint_file(
         rules: List of rule codes to run (None = all rules).
         exclude_rules: List of rule codes to exclude.
         max_jobs: Maximum number of jobs allowed per file.
+        cache_dir: Directory for persistent results. When set, a file whose
+            content, path and lint options are unchanged since an earlier
+            run is answered from the cache without parsing it.
 
     Returns:
         LintResult with lint issues and status.
@@ -49,36 +168,200 @@ def lint_file(
 
     try:
         source = file_path.read_text()
-        tree = ast.parse(source)
-    except (SyntaxError, OSError):
+    except OSError:
         return LintResult(success=True, issues=[], files_checked=0)
 
-    # Determine which rules to run
-    rules_to_run: list[str] = []
-    if rules is not None:
-        rules_to_run = rules
-    else:
-        rules_to_run = list(RULE_REGISTRY.keys())
+    entry = digest = None
+    if cache_dir is not None:
+        entry = _result_cache_entry(
+            cache_dir, file_path, rules, exclude_rules, max_jobs
+        )
+        digest = hashlib.sha256(source.encode()).hexdigest()
+        cached = _read_cache_entry(entry, digest)
+        if cached is not None:
+            return cached
+
+    result = lint_source(
+        source,
+        filename=str(file_path),
+        rules=rules,
+        exclude_rules=exclude_rules,
+        max_jobs=max_jobs,
+    )
 
-    if exclude_rules:
-        rules_to_run = [r for r in rules_to_run if r not in exclude_rules]
+    if entry is not None and digest is not None:
+        _write_cache_entry(entry, digest, result)
 
-    # Run each rule
-    all_issues = []
-    for rule_code in rules_to_run:
-        if rule_code not in RULE_REGISTRY:
-            continue
+    return result
 
-        rule_class = RULE_REGISTRY[rule_code]
 
-        # Handle rules with special initialization
-        if rule_class == WGL008FileTooLarge:
-            rule = rule_class(max_jobs=max_jobs)
-        else:
-            rule = rule_class()
+@functools.cache
+def _linter_fingerprint() -> str:
+    """Fingerprint the code that produces and stores lint results.
+
+    Covers the package version, the linter modules and contracts.py (the
+    shape of the cached LintResult/LintIssue), so cached results are not
+    reused after an upgrade or a local edit.
+
+    Returns:
+        Hex digest over the version and the names, sizes and mtimes of the
+        source files.
+    """
+    digest = hashlib.sha256(__version__.encode())
+    linter_dir = Path(__file__).parent
+    paths = [*sorted(linter_dir.rglob("*.py")), linter_dir.parent / "contracts.py"]
+    for path in paths:
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()
 
-        issues = rule.check(tree, file_path)
-        all_issues.extend(issues)
+
+# Subdirectory of the caller's cache directory that the linter owns; only
+# its contents are ever removed
+_CACHE_SUBDIR = "wetwire-gitlab-lint"
+
+
+@functools.cache
+def _cache_namespace(cache_dir: Path) -> Path:
+    """Return the directory holding this linter version's cached results.
+
+    Results live under cache_dir/_CACHE_SUBDIR, one directory per linter
+    fingerprint. Results from other linter versions can never be hit again,
+    so their directories are removed the first time a process uses the
+    cache. Nothing outside _CACHE_SUBDIR is touched.
+
+    Args:
+        cache_dir: Cache directory given by the caller.
+
+    Returns:
+        Directory named after _linter_fingerprint inside _CACHE_SUBDIR.
+    """
+    root = cache_dir / _CACHE_SUBDIR
+    fingerprint = _linter_fingerprint()
+    try:
+        for stale in root.iterdir():
+            if stale.name != fingerprint and stale.is_dir():
+                shutil.rmtree(stale, ignore_errors=True)
+    except OSError:
+        pass
+    return root / fingerprint
+
+
+def _result_cache_entry(
+    cache_dir: Path,
+    file_path: Path,
+    rules: list[str] | None,
+    exclude_rules: list[str] | None,
+    max_jobs: int,
+) -> Path:
+    """Locate the result cache entry for one file.
+
+    Entries are named after the file path and lint options only; the source
+    digest is stored inside. Editing a file therefore replaces its entry
+    instead of adding one, so the cache holds at most one entry per file
+    and set of options.
+
+    Returns:
+        Path of the JSON cache entry.
+    """
+    options = (str(file_path), rules, sorted(exclude_rules or []), max_jobs)
+    name = hashlib.sha256(repr(options).encode()).hexdigest()
+    return _cache_namespace(cache_dir) / f"{name}.json"
+
+
+def _read_cache_entry(entry: Path, digest: str) -> LintResult | None:
+    """Load a cached lint result.
+
+    Entries are plain JSON, so a cache directory restored from elsewhere
+    (e.g. a CI cache) cannot run code. Anything that fails to load counts
+    as a miss.
+
+    Args:
+        entry: Cache file to read.
+        digest: SHA-256 of the current file content.
+
+    Returns:
+        The cached result, or None if there is no usable entry.
+    """
+    try:
+        data = json.loads(entry.read_bytes())
+        if data["source"] != digest:
+            return None
+        return LintResult(
+            success=data["success"],
+            issues=[LintIssue(**issue) for issue in data["issues"]],
+            files_checked=data["files_checked"],
+        )
+    except Exception:
+        return None
+
+
+def _write_cache_entry(entry: Path, digest: str, result: LintResult) -> None:
+    """Store a lint result, ignoring failures.
+
+    The entry is written to a temporary file and renamed into place, so
+    concurrent linters never read a partial entry.
+
+    Args:
+        entry: Cache file to write.
+        digest: SHA-256 of the linted file content.
+        result: Result to store.
+    """
+    data = {
+        "source": digest,
+        "success": result.success,
+        "issues": [asdict(issue) for issue in result.issues],
+        "files_checked": result.files_checked,
+    }
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_name, entry)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError:
+        pass
+
+
+def lint_source(
+    source: str,
+    *,
+    filename: str = "<string>",
+    rules: list[str] | None = None,
+    exclude_rules: list[str] | None = None,
+    max_jobs: int = 10,
+) -> LintResult:
+    """Lint Python source code held in memory.
+
+    Same result as lint_file, without touching the filesystem.
+
+    Args:
+        source: The Python source code to lint.
+        filename: Filename reported in the issues.
+        rules: List of rule codes to run (None = all rules).
+        exclude_rules: List of rule codes to exclude.
+        max_jobs: Maximum number of jobs allowed per file.
+
+    Returns:
+        LintResult with lint issues and status. Source that does not parse
+        counts as no file checked.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return LintResult(success=True, issues=[], files_checked=0)
+
+    all_issues = _run_rules(
+        tree,
+        Path(filename),
+        rules=rules,
+        exclude_rules=exclude_rules,
+        max_jobs=max_jobs,
+    )
 
     return LintResult(
         success=len(all_issues) == 0,
@@ -93,38 +376,49 @@ def lint_directory(
     rules: list[str] | None = None,
     exclude_rules: list[str] | None = None,
     max_jobs: int = 10,
+    cache_dir: Path | None = None,
 ) -> LintResult:
     """Lint all Python files in a directory recursively.
 
+    Large trees (at least _PARALLEL_MIN_FILES files) are linted in a worker
+    pool when more than one CPU is available; smaller ones are linted
+    in this process, where starting a pool would cost more than it saves.
+    Issues are reported in the same order either way.
+
     Args:
         directory: Path to the directory to lint.
         rules: List of rule codes to run (None = all rules).
         exclude_rules: List of rule codes to exclude.
         max_jobs: Maximum number of jobs allowed per file.
+        cache_dir: Directory for persistent per-file results (see lint_file).
 
     Returns:
         LintResult with all lint issues and total files checked.
     """
-    all_issues = []
-    files_checked = 0
-
-    for path in directory.rglob("*.py"):
-        # Check if any parent directory should be skipped
-        should_skip = False
-        for parent in path.relative_to(directory).parents:
-            if parent.name and _should_skip_directory(parent.name):
-                should_skip = True
-                break
+    paths = list(iter_python_files(directory))
+
+    lint_one = functools.partial(
+        lint_file,
+        rules=rules,
+        exclude_rules=exclude_rules,
+        max_jobs=max_jobs,
+        cache_dir=cache_dir,
+    )
 
-        if should_skip:
-            continue
+    workers = os.cpu_count() or 1
+    if workers == 1 or len(paths) < _PARALLEL_MIN_FILES:
+        results = list(map(lint_one, paths))
+    else:
+        with _executor_class()(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    lint_one, paths, chunksize=max(1, len(paths) // (4 * workers))
+                )
+            )
 
-        result = lint_file(
-            path,
-            rules=rules,
-            exclude_rules=exclude_rules,
-            max_jobs=max_jobs,
-        )
+    all_issues = []
+    files_checked = 0
+    for result in results:
         all_issues.extend(result.issues)
         files_checked += result.files_checked
 
@@ -155,39 +449,13 @@ def lint_code(
     Returns:
         List of LintIssue objects.
     """
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
-        return []
-
-    # Determine which rules to run
-    rules_to_run: list[str] = []
-    if rules is not None:
-        rules_to_run = rules
-    else:
-        rules_to_run = list(RULE_REGISTRY.keys())
-
-    if exclude_rules:
-        rules_to_run = [r for r in rules_to_run if r not in exclude_rules]
-
-    # Run each rule
-    all_issues: list[LintIssue] = []
-    for rule_code in rules_to_run:
-        if rule_code not in RULE_REGISTRY:
-            continue
-
-        rule_class = RULE_REGISTRY[rule_code]
-
-        # Handle rules with special initialization
-        if rule_class == WGL008FileTooLarge:
-            rule = rule_class(max_jobs=max_jobs)
-        else:
-            rule = rule_class()
-
-        issues = rule.check(tree, Path(filename))
-        all_issues.extend(issues)
-
-    return all_issues
+    return lint_source(
+        source,
+        filename=filename,
+        rules=rules,
+        exclude_rules=exclude_rules,
+        max_jobs=max_jobs,
+    ).issues
 
 
 def fix_code(
@@ -1,11 +1,24 @@
 """Base class and protocol for lint rules."""
 
 import ast
+import weakref
 from pathlib import Path
-from typing import Protocol
+from typing import Protocol, TypeVar
 
 from ...contracts import LintIssue
 
+NodeT = TypeVar("NodeT", bound=ast.AST)
+
+# Per-tree index of nodes by exact type, dropped with the tree
+_NODE_INDEX: weakref.WeakKeyDictionary[ast.AST, dict[type, list[ast.AST]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Per-tree index of calls to plain names (Job(...), Rule(...)) by name
+_CALL_INDEX: weakref.WeakKeyDictionary[ast.AST, dict[str, list[ast.Call]]] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class LintRule(Protocol):
     """Protocol for lint rules."""
@@ -24,3 +37,50 @@ class LintRule(Protocol):
             List of lint issues found.
         """
         ...
+
+
+def nodes_of_type(tree: ast.AST, node_type: type[NodeT]) -> list[NodeT]:
+    """Return the nodes of a given type in a tree, in ast.walk order.
+
+    The first call walks the tree once and indexes every node by
+    ``type(node)``; later calls for the same tree, from any rule, are a dict
+    lookup. Subclasses of ``node_type`` are not included.
+
+    Args:
+        tree: Parsed AST to search.
+        node_type: Exact node class to return, e.g. ast.Call.
+
+    Returns:
+        The matching nodes. The list is shared and must not be modified.
+    """
+    index = _NODE_INDEX.get(tree)
+    if index is None:
+        index = {}
+        for node in ast.walk(tree):
+            index.setdefault(type(node), []).append(node)
+        _NODE_INDEX[tree] = index
+    return index.get(node_type, [])  # type: ignore[return-value]
+
+
+def calls_to(tree: ast.AST, name: str) -> list[ast.Call]:
+    """Return the calls to a plain name in a tree, in ast.walk order.
+
+    Matches calls whose function is a bare name, e.g. ``Job(...)`` but not
+    ``pipeline.Job(...)``. Like nodes_of_type, the calls are indexed by
+    name on first use, so a rule only visits the calls it checks.
+
+    Args:
+        tree: Parsed AST to search.
+        name: Called name, e.g. "Job".
+
+    Returns:
+        The matching calls. The list is shared and must not be modified.
+    """
+    index = _CALL_INDEX.get(tree)
+    if index is None:
+        index = {}
+        for node in nodes_of_type(tree, ast.Call):
+            if isinstance(node.func, ast.Name):
+                index.setdefault(node.func.id, []).append(node)
+        _CALL_INDEX[tree] = index
+    return index.get(name, [])
@@ -8,6 +8,7 @@ import ast
 from pathlib import Path
 
 from ...contracts import LintIssue
+from .base import calls_to
 
 
 class WGL007DuplicateJobNames:
@@ -21,25 +22,23 @@ class WGL007DuplicateJobNames:
         issues: list[LintIssue] = []
         job_names: dict[str, int] = {}  # name -> first line number
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    for kw in node.keywords:
-                        if kw.arg == "name" and isinstance(kw.value, ast.Constant):
-                            name = kw.value.value
-                            if isinstance(name, str):
-                                if name in job_names:
-                                    issues.append(
-                                        LintIssue(
-                                            code=self.code,
-                                            message=f"{self.message}: '{name}'",
-                                            file_path=str(file_path),
-                                            line_number=node.lineno,
-                                            column=node.col_offset,
-                                        )
-                                    )
-                                else:
-                                    job_names[name] = node.lineno
+        for node in calls_to(tree, "Job"):
+            for kw in node.keywords:
+                if kw.arg == "name" and isinstance(kw.value, ast.Constant):
+                    name = kw.value.value
+                    if isinstance(name, str):
+                        if name in job_names:
+                            issues.append(
+                                LintIssue(
+                                    code=self.code,
+                                    message=f"{self.message}: '{name}'",
+                                    file_path=str(file_path),
+                                    line_number=node.lineno,
+                                    column=node.col_offset,
+                                )
+                            )
+                        else:
+                            job_names[name] = node.lineno
 
         return issues
 
@@ -63,10 +62,8 @@ class WGL008FileTooLarge:
         issues: list[LintIssue] = []
         job_count = 0
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    job_count += 1
+        for node in calls_to(tree, "Job"):
+            job_count += 1
 
         if job_count > self.max_jobs:
             issues.append(
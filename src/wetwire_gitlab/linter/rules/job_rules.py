@@ -9,6 +9,7 @@ import re
 from pathlib import Path
 
 from ...contracts import LintIssue
+from .base import calls_to, nodes_of_type
 
 
 class WGL011MissingStage:
@@ -21,24 +22,22 @@ class WGL011MissingStage:
         """Check for Job() calls without stage keyword."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    has_stage = False
-                    for kw in node.keywords:
-                        if kw.arg == "stage":
-                            has_stage = True
-                            break
-                    if not has_stage:
-                        issues.append(
-                            LintIssue(
-                                code=self.code,
-                                message=self.message,
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                column=node.col_offset,
-                            )
-                        )
+        for node in calls_to(tree, "Job"):
+            has_stage = False
+            for kw in node.keywords:
+                if kw.arg == "stage":
+                    has_stage = True
+                    break
+            if not has_stage:
+                issues.append(
+                    LintIssue(
+                        code=self.code,
+                        message=self.message,
+                        file_path=str(file_path),
+                        line_number=node.lineno,
+                        column=node.col_offset,
+                    )
+                )
 
         return issues
 
@@ -53,29 +52,27 @@ class WGL014MissingScript:
         """Check for Job() calls without script, trigger, or extends."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    has_script = False
-                    has_trigger = False
-                    has_extends = False
-                    for kw in node.keywords:
-                        if kw.arg == "script":
-                            has_script = True
-                        elif kw.arg == "trigger":
-                            has_trigger = True
-                        elif kw.arg == "extends":
-                            has_extends = True
-                    if not has_script and not has_trigger and not has_extends:
-                        issues.append(
-                            LintIssue(
-                                code=self.code,
-                                message=self.message,
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                column=node.col_offset,
-                            )
-                        )
+        for node in calls_to(tree, "Job"):
+            has_script = False
+            has_trigger = False
+            has_extends = False
+            for kw in node.keywords:
+                if kw.arg == "script":
+                    has_script = True
+                elif kw.arg == "trigger":
+                    has_trigger = True
+                elif kw.arg == "extends":
+                    has_extends = True
+            if not has_script and not has_trigger and not has_extends:
+                issues.append(
+                    LintIssue(
+                        code=self.code,
+                        message=self.message,
+                        file_path=str(file_path),
+                        line_number=node.lineno,
+                        column=node.col_offset,
+                    )
+                )
 
         return issues
 
@@ -90,24 +87,22 @@ class WGL015MissingName:
         """Check for Job() calls without name keyword."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    has_name = False
-                    for kw in node.keywords:
-                        if kw.arg == "name":
-                            has_name = True
-                            break
-                    if not has_name:
-                        issues.append(
-                            LintIssue(
-                                code=self.code,
-                                message=self.message,
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                column=node.col_offset,
-                            )
-                        )
+        for node in calls_to(tree, "Job"):
+            has_name = False
+            for kw in node.keywords:
+                if kw.arg == "name":
+                    has_name = True
+                    break
+            if not has_name:
+                issues.append(
+                    LintIssue(
+                        code=self.code,
+                        message=self.message,
+                        file_path=str(file_path),
+                        line_number=node.lineno,
+                        column=node.col_offset,
+                    )
+                )
 
         return issues
 
@@ -122,21 +117,19 @@ class WGL017EmptyRulesList:
         """Check for empty rules list in Job definitions."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    for kw in node.keywords:
-                        if kw.arg == "rules" and isinstance(kw.value, ast.List):
-                            if len(kw.value.elts) == 0:
-                                issues.append(
-                                    LintIssue(
-                                        code=self.code,
-                                        message=self.message,
-                                        file_path=str(file_path),
-                                        line_number=kw.value.lineno,
-                                        column=kw.value.col_offset,
-                                    )
-                                )
+        for node in calls_to(tree, "Job"):
+            for kw in node.keywords:
+                if kw.arg == "rules" and isinstance(kw.value, ast.List):
+                    if len(kw.value.elts) == 0:
+                        issues.append(
+                            LintIssue(
+                                code=self.code,
+                                message=self.message,
+                                file_path=str(file_path),
+                                line_number=kw.value.lineno,
+                                column=kw.value.col_offset,
+                            )
+                        )
 
         return issues
 
@@ -151,26 +144,24 @@ class WGL018NeedsWithoutStage:
         """Check for Job() calls with needs but without stage."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    has_needs = False
-                    has_stage = False
-                    for kw in node.keywords:
-                        if kw.arg == "needs":
-                            has_needs = True
-                        elif kw.arg == "stage":
-                            has_stage = True
-                    if has_needs and not has_stage:
-                        issues.append(
-                            LintIssue(
-                                code=self.code,
-                                message=self.message,
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                column=node.col_offset,
-                            )
-                        )
+        for node in calls_to(tree, "Job"):
+            has_needs = False
+            has_stage = False
+            for kw in node.keywords:
+                if kw.arg == "needs":
+                    has_needs = True
+                elif kw.arg == "stage":
+                    has_stage = True
+            if has_needs and not has_stage:
+                issues.append(
+                    LintIssue(
+                        code=self.code,
+                        message=self.message,
+                        file_path=str(file_path),
+                        line_number=node.lineno,
+                        column=node.col_offset,
+                    )
+                )
 
         return issues
 
@@ -185,41 +176,39 @@ class WGL019ManualWithoutAllowFailure:
         """Check for manual jobs without allow_failure."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    is_manual = False
-                    has_allow_failure = False
-                    when_lineno = 0
-                    when_col = 0
-
-                    for kw in node.keywords:
-                        if kw.arg == "when":
-                            # Check for string "manual"
-                            if isinstance(kw.value, ast.Constant):
-                                if kw.value.value == "manual":
-                                    is_manual = True
-                                    when_lineno = kw.value.lineno
-                                    when_col = kw.value.col_offset
-                            # Check for When.MANUAL attribute access
-                            elif isinstance(kw.value, ast.Attribute):
-                                if kw.value.attr == "MANUAL":
-                                    is_manual = True
-                                    when_lineno = kw.value.lineno
-                                    when_col = kw.value.col_offset
-                        elif kw.arg == "allow_failure":
-                            has_allow_failure = True
-
-                    if is_manual and not has_allow_failure:
-                        issues.append(
-                            LintIssue(
-                                code=self.code,
-                                message=self.message,
-                                file_path=str(file_path),
-                                line_number=when_lineno or node.lineno,
-                                column=when_col or node.col_offset,
-                            )
-                        )
+        for node in calls_to(tree, "Job"):
+            is_manual = False
+            has_allow_failure = False
+            when_lineno = 0
+            when_col = 0
+
+            for kw in node.keywords:
+                if kw.arg == "when":
+                    # Check for string "manual"
+                    if isinstance(kw.value, ast.Constant):
+                        if kw.value.value == "manual":
+                            is_manual = True
+                            when_lineno = kw.value.lineno
+                            when_col = kw.value.col_offset
+                    # Check for When.MANUAL attribute access
+                    elif isinstance(kw.value, ast.Attribute):
+                        if kw.value.attr == "MANUAL":
+                            is_manual = True
+                            when_lineno = kw.value.lineno
+                            when_col = kw.value.col_offset
+                elif kw.arg == "allow_failure":
+                    has_allow_failure = True
+
+            if is_manual and not has_allow_failure:
+                issues.append(
+                    LintIssue(
+                        code=self.code,
+                        message=self.message,
+                        file_path=str(file_path),
+                        line_number=when_lineno or node.lineno,
+                        column=when_col or node.col_offset,
+                    )
+                )
 
         return issues
 
@@ -234,29 +223,27 @@ class WGL020AvoidNestedJobConstructors:
         """Check for nested Job() calls in needs/dependencies lists."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    # Check needs and dependencies keywords
-                    for kw in node.keywords:
-                        if kw.arg in ("needs", "dependencies"):
-                            if isinstance(kw.value, ast.List):
-                                # Check each element in the list
-                                for elt in kw.value.elts:
-                                    if isinstance(elt, ast.Call):
-                                        if (
-                                            isinstance(elt.func, ast.Name)
-                                            and elt.func.id == "Job"
-                                        ):
-                                            issues.append(
-                                                LintIssue(
-                                                    code=self.code,
-                                                    message=self.message,
-                                                    file_path=str(file_path),
-                                                    line_number=elt.lineno,
-                                                    column=elt.col_offset,
-                                                )
-                                            )
+        for node in calls_to(tree, "Job"):
+            # Check needs and dependencies keywords
+            for kw in node.keywords:
+                if kw.arg in ("needs", "dependencies"):
+                    if isinstance(kw.value, ast.List):
+                        # Check each element in the list
+                        for elt in kw.value.elts:
+                            if isinstance(elt, ast.Call):
+                                if (
+                                    isinstance(elt.func, ast.Name)
+                                    and elt.func.id == "Job"
+                                ):
+                                    issues.append(
+                                        LintIssue(
+                                            code=self.code,
+                                            message=self.message,
+                                            file_path=str(file_path),
+                                            line_number=elt.lineno,
+                                            column=elt.col_offset,
+                                        )
+                                    )
 
         return issues
 
@@ -271,31 +258,29 @@ class WGL022AvoidDuplicateNeeds:
         """Check for duplicate entries in needs/dependencies lists."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    # Check needs and dependencies keywords
-                    for kw in node.keywords:
-                        if kw.arg in ("needs", "dependencies"):
-                            if isinstance(kw.value, ast.List):
-                                seen: set[str] = set()
-                                for elt in kw.value.elts:
-                                    # Only check string constants
-                                    if isinstance(elt, ast.Constant) and isinstance(
-                                        elt.value, str
-                                    ):
-                                        if elt.value in seen:
-                                            issues.append(
-                                                LintIssue(
-                                                    code=self.code,
-                                                    message=f"{self.message}: '{elt.value}' appears multiple times",
-                                                    file_path=str(file_path),
-                                                    line_number=elt.lineno,
-                                                    column=elt.col_offset,
-                                                )
-                                            )
-                                        else:
-                                            seen.add(elt.value)
+        for node in calls_to(tree, "Job"):
+            # Check needs and dependencies keywords
+            for kw in node.keywords:
+                if kw.arg in ("needs", "dependencies"):
+                    if isinstance(kw.value, ast.List):
+                        seen: set[str] = set()
+                        for elt in kw.value.elts:
+                            # Only check string constants
+                            if isinstance(elt, ast.Constant) and isinstance(
+                                elt.value, str
+                            ):
+                                if elt.value in seen:
+                                    issues.append(
+                                        LintIssue(
+                                            code=self.code,
+                                            message=f"{self.message}: '{elt.value}' appears multiple times",
+                                            file_path=str(file_path),
+                                            line_number=elt.lineno,
+                                            column=elt.col_offset,
+                                        )
+                                    )
+                                else:
+                                    seen.add(elt.value)
 
         return issues
 
@@ -310,33 +295,31 @@ class WGL023MissingImageForScriptJobs:
         """Check for jobs with script but no image."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    has_script = False
-                    has_trigger = False
-                    has_image = False
-
-                    for kw in node.keywords:
-                        if kw.arg == "script":
-                            has_script = True
-                        elif kw.arg == "trigger":
-                            has_trigger = True
-                        elif kw.arg == "image":
-                            has_image = True
-
-                    # Only flag if has script (not trigger) and no image
-                    if has_script and not has_trigger and not has_image:
-                        issues.append(
-                            LintIssue(
-                                code=self.code,
-                                message=self.message,
-                                file_path=str(file_path),
-                                line_number=node.lineno,
-                                column=node.col_offset,
-                                severity="info",
-                            )
-                        )
+        for node in calls_to(tree, "Job"):
+            has_script = False
+            has_trigger = False
+            has_image = False
+
+            for kw in node.keywords:
+                if kw.arg == "script":
+                    has_script = True
+                elif kw.arg == "trigger":
+                    has_trigger = True
+                elif kw.arg == "image":
+                    has_image = True
+
+            # Only flag if has script (not trigger) and no image
+            if has_script and not has_trigger and not has_image:
+                issues.append(
+                    LintIssue(
+                        code=self.code,
+                        message=self.message,
+                        file_path=str(file_path),
+                        line_number=node.lineno,
+                        column=node.col_offset,
+                        severity="info",
+                    )
+                )
 
         return issues
 
@@ -360,20 +343,19 @@ class WGL024CircularDependency:
         # Maps variable_name -> job_name
         var_to_job: dict[str, str] = {}
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                # Handle: job_a = Job(name="a", ...)
-                if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
-                    var_name = node.targets[0].id
-                    if isinstance(node.value, ast.Call):
-                        if (
-                            isinstance(node.value.func, ast.Name)
-                            and node.value.func.id == "Job"
-                        ):
-                            job_name = self._get_job_name(node.value)
-                            if job_name:
-                                jobs[job_name] = (node.value, var_name)
-                                var_to_job[var_name] = job_name
+        for node in nodes_of_type(tree, ast.Assign):
+            # Handle: job_a = Job(name="a", ...)
+            if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                var_name = node.targets[0].id
+                if isinstance(node.value, ast.Call):
+                    if (
+                        isinstance(node.value.func, ast.Name)
+                        and node.value.func.id == "Job"
+                    ):
+                        job_name = self._get_job_name(node.value)
+                        if job_name:
+                            jobs[job_name] = (node.value, var_name)
+                            var_to_job[var_name] = job_name
 
         # Second pass: build dependency graph
         # Maps job_name -> list of needed job names
@@ -515,38 +497,34 @@ class WGL025SecretPatternDetection:
         """
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    for kw in node.keywords:
-                        # Check script commands
-                        if kw.arg == "script" and isinstance(kw.value, ast.List):
-                            for elt in kw.value.elts:
-                                if isinstance(elt, ast.Constant) and isinstance(
-                                    elt.value, str
-                                ):
-                                    self._check_string_for_secrets(
-                                        elt.value,
-                                        file_path,
-                                        elt.lineno,
-                                        elt.col_offset,
-                                        issues,
-                                    )
+        for node in calls_to(tree, "Job"):
+            for kw in node.keywords:
+                # Check script commands
+                if kw.arg == "script" and isinstance(kw.value, ast.List):
+                    for elt in kw.value.elts:
+                        if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
+                            self._check_string_for_secrets(
+                                elt.value,
+                                file_path,
+                                elt.lineno,
+                                elt.col_offset,
+                                issues,
+                            )
 
-                        # Check variables dict
-                        if kw.arg == "variables" and isinstance(kw.value, ast.Dict):
-                            for key, value in zip(kw.value.keys, kw.value.values):
-                                # Only check string constant values
-                                if isinstance(value, ast.Constant) and isinstance(
-                                    value.value, str
-                                ):
-                                    self._check_string_for_secrets(
-                                        value.value,
-                                        file_path,
-                                        value.lineno,
-                                        value.col_offset,
-                                        issues,
-                                    )
+                # Check variables dict
+                if kw.arg == "variables" and isinstance(kw.value, ast.Dict):
+                    for key, value in zip(kw.value.keys, kw.value.values):
+                        # Only check string constant values
+                        if isinstance(value, ast.Constant) and isinstance(
+                            value.value, str
+                        ):
+                            self._check_string_for_secrets(
+                                value.value,
+                                file_path,
+                                value.lineno,
+                                value.col_offset,
+                                issues,
+                            )
 
         return issues
 
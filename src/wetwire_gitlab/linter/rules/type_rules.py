@@ -8,6 +8,8 @@ import re
 from pathlib import Path
 
 from ...contracts import LintIssue
+from .base import calls_to
+from .pattern_rules import WGL009UsePredefinedRules, predefined_rule_for
 
 
 class WGL001TypedComponentWrappers:
@@ -20,21 +22,19 @@ class WGL001TypedComponentWrappers:
         """Check for raw Include(component=...) usage."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Include":
-                    for kw in node.keywords:
-                        if kw.arg == "component":
-                            issues.append(
-                                LintIssue(
-                                    code=self.code,
-                                    message=self.message,
-                                    file_path=str(file_path),
-                                    line_number=node.lineno,
-                                    column=node.col_offset,
-                                )
-                            )
-                            break
+        for node in calls_to(tree, "Include"):
+            for kw in node.keywords:
+                if kw.arg == "component":
+                    issues.append(
+                        LintIssue(
+                            code=self.code,
+                            message=self.message,
+                            file_path=str(file_path),
+                            line_number=node.lineno,
+                            column=node.col_offset,
+                        )
+                    )
+                    break
 
         return issues
 
@@ -49,22 +49,20 @@ class WGL002UseRuleDataclass:
         """Check for raw dict usage in rules keyword."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    for kw in node.keywords:
-                        if kw.arg == "rules" and isinstance(kw.value, ast.List):
-                            for elt in kw.value.elts:
-                                if isinstance(elt, ast.Dict):
-                                    issues.append(
-                                        LintIssue(
-                                            code=self.code,
-                                            message=self.message,
-                                            file_path=str(file_path),
-                                            line_number=elt.lineno,
-                                            column=elt.col_offset,
-                                        )
-                                    )
+        for node in calls_to(tree, "Job"):
+            for kw in node.keywords:
+                if kw.arg == "rules" and isinstance(kw.value, ast.List):
+                    for elt in kw.value.elts:
+                        if isinstance(elt, ast.Dict):
+                            issues.append(
+                                LintIssue(
+                                    code=self.code,
+                                    message=self.message,
+                                    file_path=str(file_path),
+                                    line_number=elt.lineno,
+                                    column=elt.col_offset,
+                                )
+                            )
 
         return issues
 
@@ -79,9 +77,7 @@ class WGL003UsePredefinedVariables:
 
     # Patterns that should be handled by WGL009 instead
     WGL009_PATTERNS = [
-        r"^\$CI_COMMIT_BRANCH\s*==\s*\$CI_DEFAULT_BRANCH$",
-        r"^\$CI_COMMIT_TAG$",
-        r'^\$CI_PIPELINE_SOURCE\s*==\s*["\']merge_request_event["\']$',
+        pattern.pattern for pattern, _, _ in WGL009UsePredefinedRules.PATTERN_MAP
     ]
 
     # Map of CI variable strings to their intrinsic equivalents
@@ -127,110 +123,86 @@ class WGL003UsePredefinedVariables:
         """Check for raw CI variable strings."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Rule":
-                    for kw in node.keywords:
-                        if kw.arg == "if_" and isinstance(kw.value, ast.Constant):
-                            if isinstance(kw.value.value, str):
-                                original_value = kw.value.value
-
-                                # Skip if this pattern should be handled by WGL009
-                                skip_for_wgl009 = False
-                                for pattern in self.WGL009_PATTERNS:
-                                    if re.search(pattern, original_value):
-                                        skip_for_wgl009 = True
+        for node in calls_to(tree, "Rule"):
+            for kw in node.keywords:
+                if kw.arg == "if_" and isinstance(kw.value, ast.Constant):
+                    if isinstance(kw.value.value, str):
+                        original_value = kw.value.value
+
+                        # Skip if this pattern should be handled by WGL009
+                        if predefined_rule_for(original_value) is not None:
+                            continue
+
+                        if self.CI_VARIABLE_PATTERN.search(original_value):
+                            # Handle simple cases where entire value is just a variable
+                            if original_value in self.CI_VAR_MAP:
+                                suggestion_value = self.CI_VAR_MAP[original_value]
+                            else:
+                                # Build complex expression with string concatenation
+                                # Replace CI variables with Python expressions
+                                suggestion_parts = []
+                                remaining = original_value
+
+                                while remaining:
+                                    # Find the next CI variable
+                                    match = self.CI_VARIABLE_PATTERN.search(remaining)
+                                    if match:
+                                        # Add the part before the variable as a string literal
+                                        before = remaining[: match.start()]
+                                        if before:
+                                            suggestion_parts.append(f'"{before}"')
+
+                                        # Add the CI variable as a Python expression
+                                        ci_var = match.group()
+                                        if ci_var in self.CI_VAR_MAP:
+                                            suggestion_parts.append(
+                                                self.CI_VAR_MAP[ci_var]
+                                            )
+                                        else:
+                                            # Unknown variable, keep as is
+                                            suggestion_parts.append(f'"{ci_var}"')
+
+                                        # Continue with the rest
+                                        remaining = remaining[match.end() :]
+                                    else:
+                                        # No more variables, add the rest as a string literal
+                                        if remaining:
+                                            suggestion_parts.append(f'"{remaining}"')
                                         break
 
-                                if skip_for_wgl009:
-                                    continue
+                                # Join parts with +
+                                suggestion_value = " + ".join(suggestion_parts)
+
+                            # Build the original and suggestion strings
+                            # For complex strings with nested quotes, we need to handle both quote styles
+                            # If the value contains double quotes, it's likely single-quoted in source
+                            # If the value contains single quotes, it's likely double-quoted in source
+                            if '"' in original_value and "'" not in original_value:
+                                # Value has double quotes, use single quotes for outer
+                                original = f"if_='{original_value}'"
+                            elif "'" in original_value and '"' not in original_value:
+                                # Value has single quotes, use double quotes for outer
+                                original = f'if_="{original_value}"'
+                            else:
+                                # Either has both or neither, try double quotes first
+                                original = f'if_="{original_value}"'
+
+                            suggestion = f"if_={suggestion_value}"
 
-                                if self.CI_VARIABLE_PATTERN.search(original_value):
-                                    # Handle simple cases where entire value is just a variable
-                                    if original_value in self.CI_VAR_MAP:
-                                        suggestion_value = self.CI_VAR_MAP[
-                                            original_value
-                                        ]
-                                    else:
-                                        # Build complex expression with string concatenation
-                                        # Replace CI variables with Python expressions
-                                        suggestion_parts = []
-                                        remaining = original_value
-
-                                        while remaining:
-                                            # Find the next CI variable
-                                            match = self.CI_VARIABLE_PATTERN.search(
-                                                remaining
-                                            )
-                                            if match:
-                                                # Add the part before the variable as a string literal
-                                                before = remaining[: match.start()]
-                                                if before:
-                                                    suggestion_parts.append(
-                                                        f'"{before}"'
-                                                    )
-
-                                                # Add the CI variable as a Python expression
-                                                ci_var = match.group()
-                                                if ci_var in self.CI_VAR_MAP:
-                                                    suggestion_parts.append(
-                                                        self.CI_VAR_MAP[ci_var]
-                                                    )
-                                                else:
-                                                    # Unknown variable, keep as is
-                                                    suggestion_parts.append(
-                                                        f'"{ci_var}"'
-                                                    )
-
-                                                # Continue with the rest
-                                                remaining = remaining[match.end() :]
-                                            else:
-                                                # No more variables, add the rest as a string literal
-                                                if remaining:
-                                                    suggestion_parts.append(
-                                                        f'"{remaining}"'
-                                                    )
-                                                break
-
-                                        # Join parts with +
-                                        suggestion_value = " + ".join(suggestion_parts)
-
-                                    # Build the original and suggestion strings
-                                    # For complex strings with nested quotes, we need to handle both quote styles
-                                    # If the value contains double quotes, it's likely single-quoted in source
-                                    # If the value contains single quotes, it's likely double-quoted in source
-                                    if (
-                                        '"' in original_value
-                                        and "'" not in original_value
-                                    ):
-                                        # Value has double quotes, use single quotes for outer
-                                        original = f"if_='{original_value}'"
-                                    elif (
-                                        "'" in original_value
-                                        and '"' not in original_value
-                                    ):
-                                        # Value has single quotes, use double quotes for outer
-                                        original = f'if_="{original_value}"'
-                                    else:
-                                        # Either has both or neither, try double quotes first
-                                        original = f'if_="{original_value}"'
-
-                                    suggestion = f"if_={suggestion_value}"
-
-                                    issues.append(
-                                        LintIssue(
-                                            code=self.code,
-                                            message=f"{self.message}: replace with intrinsics",
-                                            file_path=str(file_path),
-                                            line_number=kw.value.lineno,
-                                            column=kw.value.col_offset,
-                                            original=original,
-                                            suggestion=suggestion,
-                                            fix_imports=[
-                                                "from wetwire_gitlab.intrinsics import CI"
-                                            ],
-                                        )
-                                    )
+                            issues.append(
+                                LintIssue(
+                                    code=self.code,
+                                    message=f"{self.message}: replace with intrinsics",
+                                    file_path=str(file_path),
+                                    line_number=kw.value.lineno,
+                                    column=kw.value.col_offset,
+                                    original=original,
+                                    suggestion=suggestion,
+                                    fix_imports=[
+                                        "from wetwire_gitlab.intrinsics import CI"
+                                    ],
+                                )
+                            )
 
         return issues
 
@@ -245,20 +217,18 @@ class WGL004UseCacheDataclass:
         """Check for raw dict usage in cache keyword."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    for kw in node.keywords:
-                        if kw.arg == "cache" and isinstance(kw.value, ast.Dict):
-                            issues.append(
-                                LintIssue(
-                                    code=self.code,
-                                    message=self.message,
-                                    file_path=str(file_path),
-                                    line_number=kw.value.lineno,
-                                    column=kw.value.col_offset,
-                                )
-                            )
+        for node in calls_to(tree, "Job"):
+            for kw in node.keywords:
+                if kw.arg == "cache" and isinstance(kw.value, ast.Dict):
+                    issues.append(
+                        LintIssue(
+                            code=self.code,
+                            message=self.message,
+                            file_path=str(file_path),
+                            line_number=kw.value.lineno,
+                            column=kw.value.col_offset,
+                        )
+                    )
 
         return issues
 
@@ -273,20 +243,18 @@ class WGL005UseArtifactsDataclass:
         """Check for raw dict usage in artifacts keyword."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    for kw in node.keywords:
-                        if kw.arg == "artifacts" and isinstance(kw.value, ast.Dict):
-                            issues.append(
-                                LintIssue(
-                                    code=self.code,
-                                    message=self.message,
-                                    file_path=str(file_path),
-                                    line_number=kw.value.lineno,
-                                    column=kw.value.col_offset,
-                                )
-                            )
+        for node in calls_to(tree, "Job"):
+            for kw in node.keywords:
+                if kw.arg == "artifacts" and isinstance(kw.value, ast.Dict):
+                    issues.append(
+                        LintIssue(
+                            code=self.code,
+                            message=self.message,
+                            file_path=str(file_path),
+                            line_number=kw.value.lineno,
+                            column=kw.value.col_offset,
+                        )
+                    )
 
         return issues
 
@@ -315,31 +283,31 @@ class WGL012UseCachePolicyConstants:
         """Check for string policy values that should use CachePolicy constants."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Cache":
-                    for kw in node.keywords:
-                        if kw.arg == "policy" and isinstance(kw.value, ast.Constant):
-                            if isinstance(kw.value.value, str):
-                                value = kw.value.value
-                                if value in self.POLICY_VALUES:
-                                    # Generate fix information
-                                    original = f'policy="{value}"'
-                                    suggestion = f"policy=CachePolicy.{value.upper().replace('-', '_')}"
-                                    issues.append(
-                                        LintIssue(
-                                            code=self.code,
-                                            message=f"{self.message}: use CachePolicy.{value.upper().replace('-', '_')} instead of '{value}'",
-                                            file_path=str(file_path),
-                                            line_number=kw.value.lineno,
-                                            column=kw.value.col_offset,
-                                            original=original,
-                                            suggestion=suggestion,
-                                            fix_imports=[
-                                                "from wetwire_gitlab.intrinsics import CachePolicy"
-                                            ],
-                                        )
-                                    )
+        for node in calls_to(tree, "Cache"):
+            for kw in node.keywords:
+                if kw.arg == "policy" and isinstance(kw.value, ast.Constant):
+                    if isinstance(kw.value.value, str):
+                        value = kw.value.value
+                        if value in self.POLICY_VALUES:
+                            # Generate fix information
+                            original = f'policy="{value}"'
+                            suggestion = (
+                                f"policy=CachePolicy.{value.upper().replace('-', '_')}"
+                            )
+                            issues.append(
+                                LintIssue(
+                                    code=self.code,
+                                    message=f"{self.message}: use CachePolicy.{value.upper().replace('-', '_')} instead of '{value}'",
+                                    file_path=str(file_path),
+                                    line_number=kw.value.lineno,
+                                    column=kw.value.col_offset,
+                                    original=original,
+                                    suggestion=suggestion,
+                                    fix_imports=[
+                                        "from wetwire_gitlab.intrinsics import CachePolicy"
+                                    ],
+                                )
+                            )
 
         return issues
 
@@ -356,31 +324,29 @@ class WGL013UseArtifactsWhenConstants:
         """Check for string when values in Artifacts that should use ArtifactsWhen constants."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Artifacts":
-                    for kw in node.keywords:
-                        if kw.arg == "when" and isinstance(kw.value, ast.Constant):
-                            if isinstance(kw.value.value, str):
-                                value = kw.value.value
-                                if value in self.WHEN_VALUES:
-                                    # Generate fix information
-                                    original = f'when="{value}"'
-                                    suggestion = f"when=ArtifactsWhen.{value.upper()}"
-                                    issues.append(
-                                        LintIssue(
-                                            code=self.code,
-                                            message=f"{self.message}: use ArtifactsWhen.{value.upper()} instead of '{value}'",
-                                            file_path=str(file_path),
-                                            line_number=kw.value.lineno,
-                                            column=kw.value.col_offset,
-                                            original=original,
-                                            suggestion=suggestion,
-                                            fix_imports=[
-                                                "from wetwire_gitlab.intrinsics import ArtifactsWhen"
-                                            ],
-                                        )
-                                    )
+        for node in calls_to(tree, "Artifacts"):
+            for kw in node.keywords:
+                if kw.arg == "when" and isinstance(kw.value, ast.Constant):
+                    if isinstance(kw.value.value, str):
+                        value = kw.value.value
+                        if value in self.WHEN_VALUES:
+                            # Generate fix information
+                            original = f'when="{value}"'
+                            suggestion = f"when=ArtifactsWhen.{value.upper()}"
+                            issues.append(
+                                LintIssue(
+                                    code=self.code,
+                                    message=f"{self.message}: use ArtifactsWhen.{value.upper()} instead of '{value}'",
+                                    file_path=str(file_path),
+                                    line_number=kw.value.lineno,
+                                    column=kw.value.col_offset,
+                                    original=original,
+                                    suggestion=suggestion,
+                                    fix_imports=[
+                                        "from wetwire_gitlab.intrinsics import ArtifactsWhen"
+                                    ],
+                                )
+                            )
 
         return issues
 
@@ -395,21 +361,19 @@ class WGL016UseImageDataclass:
         """Check for string image values that should use Image dataclass."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    for kw in node.keywords:
-                        if kw.arg == "image" and isinstance(kw.value, ast.Constant):
-                            if isinstance(kw.value.value, str):
-                                issues.append(
-                                    LintIssue(
-                                        code=self.code,
-                                        message=f'{self.message}: use Image(name="{kw.value.value}")',
-                                        file_path=str(file_path),
-                                        line_number=kw.value.lineno,
-                                        column=kw.value.col_offset,
-                                    )
-                                )
+        for node in calls_to(tree, "Job"):
+            for kw in node.keywords:
+                if kw.arg == "image" and isinstance(kw.value, ast.Constant):
+                    if isinstance(kw.value.value, str):
+                        issues.append(
+                            LintIssue(
+                                code=self.code,
+                                message=f'{self.message}: use Image(name="{kw.value.value}")',
+                                file_path=str(file_path),
+                                line_number=kw.value.lineno,
+                                column=kw.value.col_offset,
+                            )
+                        )
 
         return issues
 
@@ -424,24 +388,20 @@ class WGL021UseTypedServiceConstants:
         """Check for string service values that should use Service dataclass."""
         issues: list[LintIssue] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "Job":
-                    for kw in node.keywords:
-                        if kw.arg == "services" and isinstance(kw.value, ast.List):
-                            # Check each element in the services list
-                            for elt in kw.value.elts:
-                                if isinstance(elt, ast.Constant) and isinstance(
-                                    elt.value, str
-                                ):
-                                    issues.append(
-                                        LintIssue(
-                                            code=self.code,
-                                            message=f'{self.message}: use Service(name="{elt.value}")',
-                                            file_path=str(file_path),
-                                            line_number=elt.lineno,
-                                            column=elt.col_offset,
-                                        )
-                                    )
+        for node in calls_to(tree, "Job"):
+            for kw in node.keywords:
+                if kw.arg == "services" and isinstance(kw.value, ast.List):
+                    # Check each element in the services list
+                    for elt in kw.value.elts:
+                        if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
+                            issues.append(
+                                LintIssue(
+                                    code=self.code,
+                                    message=f'{self.message}: use Service(name="{elt.value}")',
+                                    file_path=str(file_path),
+                                    line_number=elt.lineno,
+                                    column=elt.col_offset,
+                                )
+                            )
 
         return issues
@@ -137,7 +137,7 @@ def _lint_path(path: str, fix: bool = False) -> dict[str, Any]:
     Returns:
         Dict with 'issues' list.
     """
-    from wetwire_gitlab.linter.linter import lint_file
+    from wetwire_gitlab.linter import iter_python_files, lint_file
 
     target = Path(path)
     if not target.exists():
@@ -147,14 +147,7 @@ def _lint_path(path: str, fix: bool = False) -> dict[str, Any]:
     if target.is_file():
         files = [target]
     else:
-        files = list(target.rglob("*.py"))
-        # Exclude __pycache__ and hidden directories
-        files = [
-            f
-            for f in files
-            if "__pycache__" not in str(f)
-            and not any(p.startswith(".") for p in f.parts)
-        ]
+        files = list(iter_python_files(target))
 
     if not files:
         return {"success": True, "issues": [], "message": "No Python files found."}
@@ -187,7 +180,10 @@ def _build_template(path: str, output_format: str = "yaml") -> dict[str, Any]:
     """
     from wetwire_gitlab.pipeline import Pipeline
     from wetwire_gitlab.runner.loader import extract_all_jobs, extract_all_pipelines
-    from wetwire_gitlab.serialize.yaml_builder import build_pipeline_yaml
+    from wetwire_gitlab.serialize.yaml_builder import (
+        build_pipeline_dict,
+        build_pipeline_yaml,
+    )
 
     package_path = Path(path).resolve()
     if not package_path.exists():
@@ -222,16 +218,11 @@ def _build_template(path: str, output_format: str = "yaml") -> dict[str, Any]:
         pipelines[0] if pipelines else Pipeline(stages=["build", "test", "deploy"])
     )
 
-    # Build output
-    yaml_str = build_pipeline_yaml(pipeline, jobs)
-
+    # Build output; JSON is dumped straight from the dict without a YAML pass
     if output_format == "json":
-        import yaml
-
-        data = yaml.safe_load(yaml_str)
-        output = json.dumps(data, indent=2)
+        output = json.dumps(build_pipeline_dict(pipeline, jobs), indent=2)
     else:
-        output = yaml_str
+        output = build_pipeline_yaml(pipeline, jobs)
 
     return {
         "success": True,
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from .trigger import Trigger
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Job configuration for a GitLab CI pipeline.
 
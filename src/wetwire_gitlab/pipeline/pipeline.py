@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from .workflow import Workflow
 
 
-@dataclass
+@dataclass(slots=True)
 class Pipeline:
     """Top-level pipeline configuration.
 
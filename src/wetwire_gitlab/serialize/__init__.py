@@ -1,11 +1,12 @@
 """Serialization module for GitLab CI YAML generation."""
 
 from .converter import convert_field_name, to_dict
-from .yaml_builder import build_pipeline_yaml, to_yaml
+from .yaml_builder import build_pipeline_dict, build_pipeline_yaml, to_yaml
 
 __all__ = [
     "convert_field_name",
     "to_dict",
     "to_yaml",
+    "build_pipeline_dict",
     "build_pipeline_yaml",
 ]
@@ -1,5 +1,6 @@
 """YAML serialization functions."""
 
+from collections.abc import Iterable
 from typing import Any
 
 import yaml
@@ -24,19 +25,19 @@ def to_yaml(obj: Any) -> str:
     )
 
 
-def build_pipeline_yaml(pipeline: Pipeline, jobs: list[Job]) -> str:
-    """Build a complete GitLab CI pipeline YAML.
+def build_pipeline_dict(pipeline: Pipeline, jobs: Iterable[Job]) -> dict[str, Any]:
+    """Build the dictionary for a complete GitLab CI pipeline.
 
-    Creates a properly structured .gitlab-ci.yml with:
+    Keys are ordered as in .gitlab-ci.yml:
     - Pipeline-level configuration (stages, workflow, includes, default, variables)
-    - All jobs with their names as YAML keys
+    - All jobs with their names as keys
 
     Args:
         pipeline: Pipeline configuration.
-        jobs: List of Job instances.
+        jobs: Job instances, iterated once.
 
     Returns:
-        Complete YAML string for .gitlab-ci.yml.
+        Dictionary ready to be dumped as YAML or JSON.
     """
     result: dict[str, Any] = {}
 
@@ -76,6 +77,22 @@ def build_pipeline_yaml(pipeline: Pipeline, jobs: list[Job]) -> str:
         job_dict = to_dict(job)
         result[job.name] = job_dict
 
+    return result
+
+
+def build_pipeline_yaml(pipeline: Pipeline, jobs: Iterable[Job]) -> str:
+    """Build a complete GitLab CI pipeline YAML.
+
+    Args:
+        pipeline: Pipeline configuration.
+        jobs: Job instances, iterated once.
+
+    Returns:
+        Complete YAML string for .gitlab-ci.yml.
+    """
     return yaml.dump(
-        result, default_flow_style=False, sort_keys=False, allow_unicode=True
+        build_pipeline_dict(pipeline, jobs),
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
     )
@@ -1,7 +1,15 @@
 """Testing utilities for wetwire-gitlab."""
 
-from .semantic_compare import compare_yaml_semantic
+from .semantic_compare import (
+    SemanticDifference,
+    compare_yaml_semantic,
+    compare_yaml_to_tree,
+    yaml_semantically_equal,
+)
 
 __all__ = [
+    "SemanticDifference",
     "compare_yaml_semantic",
+    "compare_yaml_to_tree",
+    "yaml_semantically_equal",
 ]
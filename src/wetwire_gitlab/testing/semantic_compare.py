@@ -5,15 +5,79 @@ equivalence, ignoring acceptable differences like whitespace, key ordering,
 and quote styles.
 """
 
-from typing import Any
+import functools
+import json
+import sys
+from typing import Any, Self
 
 import yaml
 
+from ..importer.parser import SafeLoader
 
-def compare_yaml_semantic(original: str, rebuilt: str) -> tuple[bool, list[str]]:
+try:
+    import orjson
+except ImportError:  # optional; the canonical form falls back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
+
+class _InterningLoader(SafeLoader):
+    """Safe loader that interns string scalars.
+
+    Both documents in a comparison share a small vocabulary of keys and values
+    (stage, script, build, ...); interning makes the dict lookups between the
+    two trees hit the identity fast path.
+    """
+
+    def construct_yaml_str(self, node: yaml.Node) -> str:
+        """Construct a string scalar and intern it."""
+        return sys.intern(super().construct_yaml_str(node))
+
+
+_InterningLoader.add_constructor(
+    "tag:yaml.org,2002:str", _InterningLoader.construct_yaml_str
+)
+
+
+class SemanticDifference(str):
+    """A difference found by compare_yaml_semantic.
+
+    The string value is the human-readable description, so differences can be
+    printed and searched like plain strings. ``kind`` and ``path`` allow
+    checks without matching on the message text.
+
+    Kinds:
+        parse_original, parse_rebuilt: A document failed to parse.
+        type: Values at ``path`` have different types.
+        missing: Key ``path`` exists only in the original.
+        extra: Key ``path`` exists only in the rebuilt document.
+        list_length: Lists at ``path`` have different lengths.
+        value: Scalar values at ``path`` differ.
+
+    Attributes:
+        kind: The kind of difference.
+        path: Location of the difference, e.g. ``build.artifacts.paths[0]``.
+    """
+
+    kind: str
+    path: str
+
+    def __new__(cls, kind: str, path: str, message: str) -> Self:
+        difference = super().__new__(cls, message)
+        difference.kind = kind
+        difference.path = path
+        return difference
+
+    def __getnewargs__(self) -> tuple[str, str, str]:
+        """Arguments for __new__ when copying or unpickling."""
+        return self.kind, self.path, str(self)
+
+
+def compare_yaml_semantic(
+    original: str, rebuilt: str, early_exit: bool = False
+) -> tuple[bool, list[SemanticDifference]]:
     """Compare two YAML strings for semantic equivalence.
 
-    This function parses both YAML strings and compares them recursively,
+    This function parses both YAML strings and compares them node by node,
     ignoring acceptable differences such as:
     - Whitespace and formatting
     - Key ordering in dictionaries
@@ -23,11 +87,14 @@ def compare_yaml_semantic(original: str, rebuilt: str) -> tuple[bool, list[str]]
     Args:
         original: The original YAML string
         rebuilt: The rebuilt YAML string to compare against
+        early_exit: Stop at the first difference instead of collecting all of
+            them. The result is the same; the list holds at most one entry.
 
     Returns:
         A tuple of (is_equivalent, list_of_differences) where:
         - is_equivalent is True if the YAMLs are semantically equivalent
-        - list_of_differences contains human-readable difference descriptions
+        - list_of_differences contains SemanticDifference entries, which are
+          human-readable difference descriptions carrying a kind and path
 
     Examples:
         >>> original = "stages:\\n  - build\\n  - test"
@@ -36,146 +103,291 @@ def compare_yaml_semantic(original: str, rebuilt: str) -> tuple[bool, list[str]]
         >>> is_eq
         True
     """
-    differences = []
+    differences: list[SemanticDifference] = []
 
     # Parse both YAML strings
     try:
-        original_data = yaml.safe_load(original)
+        original_data = _load_yaml(original)
+    except yaml.YAMLError as e:
+        differences.append(
+            SemanticDifference(
+                "parse_original", "root", f"Failed to parse original YAML: {e}"
+            )
+        )
+        return False, differences
+
+    # Identical text is equivalent once it is known to parse
+    if rebuilt == original:
+        return True, differences
+
+    try:
+        rebuilt_data = _load_yaml(rebuilt)
     except yaml.YAMLError as e:
-        differences.append(f"Failed to parse original YAML: {e}")
+        differences.append(
+            SemanticDifference(
+                "parse_rebuilt", "root", f"Failed to parse rebuilt YAML: {e}"
+            )
+        )
         return False, differences
 
+    return _compare_data(original_data, rebuilt_data, differences, early_exit)
+
+
+def compare_yaml_to_tree(
+    original: str, tree: Any, early_exit: bool = False
+) -> tuple[bool, list[SemanticDifference]]:
+    """Compare a YAML string with an already built data tree.
+
+    Same comparison as compare_yaml_semantic, for callers that hold the
+    rebuilt side as Python data (e.g. from build_pipeline_dict). The tree is
+    compared directly, so it is never dumped to YAML and parsed back.
+
+    Args:
+        original: The original YAML string
+        tree: The rebuilt data, as it would be loaded from YAML
+        early_exit: Stop at the first difference instead of collecting all of
+            them.
+
+    Returns:
+        A tuple of (is_equivalent, list_of_differences) as returned by
+        compare_yaml_semantic.
+    """
+    differences: list[SemanticDifference] = []
+
     try:
-        rebuilt_data = yaml.safe_load(rebuilt)
+        original_data = _load_yaml(original)
     except yaml.YAMLError as e:
-        differences.append(f"Failed to parse rebuilt YAML: {e}")
+        differences.append(
+            SemanticDifference(
+                "parse_original", "root", f"Failed to parse original YAML: {e}"
+            )
+        )
         return False, differences
 
+    return _compare_data(original_data, tree, differences, early_exit)
+
+
+def yaml_semantically_equal(original: str, rebuilt: str) -> bool:
+    """Check whether two YAML strings are semantically equivalent.
+
+    Same comparison as compare_yaml_semantic, but stops at the first
+    difference since no description is needed.
+
+    Args:
+        original: The original YAML string
+        rebuilt: The rebuilt YAML string to compare against
+
+    Returns:
+        True if the YAMLs are semantically equivalent
+    """
+    is_equivalent, _ = compare_yaml_semantic(original, rebuilt, early_exit=True)
+    return is_equivalent
+
+
+def _compare_data(
+    original_data: Any,
+    rebuilt_data: Any,
+    differences: list[SemanticDifference],
+    early_exit: bool,
+) -> tuple[bool, list[SemanticDifference]]:
+    """Compare two loaded documents.
+
+    Args:
+        original_data: Loaded original document
+        rebuilt_data: Loaded or built rebuilt document
+        differences: List to accumulate differences
+        early_exit: Stop at the first difference
+
+    Returns:
+        A tuple of (is_equivalent, differences).
+    """
     # Handle empty YAMLs
     if original_data is None:
         original_data = {}
     if rebuilt_data is None:
         rebuilt_data = {}
 
-    # Compare the structures recursively
-    _compare_structures(original_data, rebuilt_data, "root", differences)
+    # Equal trees need no walk; the walk only runs to describe a mismatch
+    if original_data == rebuilt_data:
+        canonical = _canonical_form(original_data)
+        if canonical is not None and canonical == _canonical_form(rebuilt_data):
+            return True, differences
+
+    # Compare the structures
+    _compare_structures(original_data, rebuilt_data, differences, early_exit)
 
     return len(differences) == 0, differences
 
 
-def _compare_structures(
-    original: Any, rebuilt: Any, path: str, differences: list[str]
-) -> None:
-    """Recursively compare two data structures.
+@functools.lru_cache(maxsize=512)
+def _load_yaml(content: str) -> Any:
+    """Load a YAML string, memoized by its content.
+
+    Round-trip checks often compare the same original YAML several times, so
+    repeated strings skip the parser. The returned object is shared between
+    calls and must not be mutated.
 
     Args:
-        original: Original data structure
-        rebuilt: Rebuilt data structure
-        path: Current path in the structure (for error reporting)
-        differences: List to accumulate differences
+        content: YAML string to load
+
+    Returns:
+        The loaded Python object
     """
-    # Normalize values before comparison
-    original = _normalize_value(original)
-    rebuilt = _normalize_value(rebuilt)
+    return yaml.load(content, Loader=_InterningLoader)
 
-    # If types differ, that's a difference
-    if type(original) is not type(rebuilt):
-        differences.append(
-            f"Type mismatch at {path}: "
-            f"{type(original).__name__} vs {type(rebuilt).__name__}"
-        )
-        return
-
-    # Compare based on type
-    if isinstance(original, dict):
-        _compare_dicts(original, rebuilt, path, differences)
-    elif isinstance(original, list):
-        _compare_lists(original, rebuilt, path, differences)
-    else:
-        # Primitive values (str, int, bool, None, etc.)
-        if original != rebuilt:
-            differences.append(
-                f"Value mismatch at {path}: {repr(original)} vs {repr(rebuilt)}"
-            )
 
+def _canonical_form(data: Any) -> bytes | str | None:
+    """Serialize data to canonical JSON with sorted keys.
 
-def _compare_dicts(
-    original: dict, rebuilt: dict, path: str, differences: list[str]
-) -> None:
-    """Compare two dictionaries.
+    ``==`` treats ``1``, ``1.0`` and ``True`` as equal while the comparison
+    reports them as different types; their JSON forms differ, so ``==``-equal
+    trees with equal canonical forms have no differences.
+
+    Uses orjson when installed and stdlib json otherwise. Both documents of a
+    comparison go through the same serializer, so either is consistent.
 
     Args:
-        original: Original dictionary
-        rebuilt: Rebuilt dictionary
-        path: Current path in the structure
-        differences: List to accumulate differences
+        data: Loaded YAML data
+
+    Returns:
+        The canonical JSON, or None if the data is not JSON serializable
+        (e.g. dates or mixed-type keys with stdlib json)
     """
-    # Check for keys in original that are missing in rebuilt
-    for key in original:
-        if key not in rebuilt:
-            differences.append(f"Missing key in rebuilt at {path}.{key}")
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            return None
+    try:
+        return json.dumps(data, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
 
-    # Check for keys in rebuilt that are missing in original
-    for key in rebuilt:
-        if key not in original:
-            differences.append(f"Extra key in rebuilt at {path}.{key}")
 
-    # Compare values for common keys
-    for key in original:
-        if key in rebuilt:
-            new_path = f"{path}.{key}" if path != "root" else key
-            _compare_structures(original[key], rebuilt[key], new_path, differences)
+class _Index(int):
+    """A list index in a walk path, as opposed to an integer mapping key."""
 
 
-def _compare_lists(
-    original: list, rebuilt: list, path: str, differences: list[str]
-) -> None:
-    """Compare two lists.
+def _format_path(path: tuple[Any, ...]) -> str:
+    """Format a walk path for a difference message.
 
     Args:
-        original: Original list
-        rebuilt: Rebuilt list
-        path: Current path in the structure
-        differences: List to accumulate differences
-    """
-    if len(original) != len(rebuilt):
-        differences.append(
-            f"List length mismatch at {path}: {len(original)} vs {len(rebuilt)}"
-        )
-        # Continue comparing up to the shorter length
-        min_len = min(len(original), len(rebuilt))
-    else:
-        min_len = len(original)
+        path: Mapping keys and _Index list positions from the document root
 
-    # Compare elements
-    for i in range(min_len):
-        new_path = f"{path}[{i}]"
-        _compare_structures(original[i], rebuilt[i], new_path, differences)
+    Returns:
+        The dotted path, e.g. ``build.artifacts.paths[0]``, or ``root``
+    """
+    if not path:
+        return "root"
+    first = path[0]
+    text = f"root[{first}]" if isinstance(first, _Index) else f"{first}"
+    for segment in path[1:]:
+        text += f"[{segment}]" if isinstance(segment, _Index) else f".{segment}"
+    return text
 
 
-def _normalize_value(value: Any) -> Any:
-    """Normalize a value for comparison.
+def _compare_structures(
+    original: Any,
+    rebuilt: Any,
+    differences: list[SemanticDifference],
+    early_exit: bool = False,
+) -> None:
+    """Compare two data structures and record every difference.
 
-    This handles:
-    - Stripping whitespace from strings
-    - Converting None to empty dict for top-level structures
-    - Standardizing boolean representations
+    Walks both trees depth-first with an explicit stack instead of recursion,
+    so deeply nested documents cost no Python call frames per node. Paths are
+    carried as tuples and only formatted when a difference is recorded.
+    Strings are compared with leading/trailing whitespace stripped.
 
     Args:
-        value: The value to normalize
-
-    Returns:
-        The normalized value
+        original: Original data structure
+        rebuilt: Rebuilt data structure
+        differences: List to accumulate differences
+        early_exit: Return as soon as one difference is recorded
     """
-    if isinstance(value, str):
-        # Strip leading/trailing whitespace from strings
-        return value.strip()
-    elif isinstance(value, dict):
-        # Recursively normalize dict values
-        return {k: _normalize_value(v) for k, v in value.items()}
-    elif isinstance(value, list):
-        # Recursively normalize list elements
-        return [_normalize_value(v) for v in value]
-    else:
-        # Return as-is for other types (int, bool, None, etc.)
-        return value
+    stack: list[tuple[Any, Any, tuple[Any, ...]]] = [(original, rebuilt, ())]
+
+    while stack:
+        original, rebuilt, path = stack.pop()
+
+        # Normalize string values before comparison
+        if isinstance(original, str):
+            original = original.strip()
+        if isinstance(rebuilt, str):
+            rebuilt = rebuilt.strip()
+
+        # If types differ, that's a difference
+        if type(original) is not type(rebuilt):
+            where = _format_path(path)
+            differences.append(
+                SemanticDifference(
+                    "type",
+                    where,
+                    f"Type mismatch at {where}: "
+                    f"{type(original).__name__} vs {type(rebuilt).__name__}",
+                )
+            )
+            if early_exit:
+                return
+            continue
+
+        # Children are pushed in reverse so they are visited in document order
+        if isinstance(original, dict):
+            for key in original:
+                if key not in rebuilt:
+                    where = f"{_format_path(path)}.{key}"
+                    differences.append(
+                        SemanticDifference(
+                            "missing", where, f"Missing key in rebuilt at {where}"
+                        )
+                    )
+                    if early_exit:
+                        return
+            for key in rebuilt:
+                if key not in original:
+                    where = f"{_format_path(path)}.{key}"
+                    differences.append(
+                        SemanticDifference(
+                            "extra", where, f"Extra key in rebuilt at {where}"
+                        )
+                    )
+                    if early_exit:
+                        return
+            stack.extend(
+                (original[key], rebuilt[key], (*path, key))
+                for key in reversed(original)
+                if key in rebuilt
+            )
+        elif isinstance(original, list):
+            if len(original) != len(rebuilt):
+                where = _format_path(path)
+                differences.append(
+                    SemanticDifference(
+                        "list_length",
+                        where,
+                        f"List length mismatch at {where}: "
+                        f"{len(original)} vs {len(rebuilt)}",
+                    )
+                )
+                if early_exit:
+                    return
+            # Compare up to the shorter length
+            min_len = min(len(original), len(rebuilt))
+            stack.extend(
+                (original[i], rebuilt[i], (*path, _Index(i)))
+                for i in reversed(range(min_len))
+            )
+        elif original != rebuilt:
+            # Primitive values (str, int, bool, None, etc.)
+            where = _format_path(path)
+            differences.append(
+                SemanticDifference(
+                    "value",
+                    where,
+                    f"Value mismatch at {where}: {repr(original)} vs {repr(rebuilt)}",
+                )
+            )
+            if early_exit:
+                return
@@ -3,159 +3,90 @@
 import subprocess
 import sys
 
+import pytest
+
+HELP_COMMANDS = [
+    "build",
+    "validate",
+    "list",
+    "lint",
+    "import",
+    "init",
+    "design",
+    "test",
+    "graph",
+]
+
+
+@pytest.fixture(scope="session")
+def cli_help_results() -> dict[str, tuple[int, bytes, bytes]]:
+    """Run ``--help`` for the CLI and every subcommand once per session.
+
+    The subprocesses are started together and then collected, so the
+    interpreter startup cost of the entry point is paid concurrently rather
+    than once per test. Maps the subcommand ("" for the top level) to its
+    exit code and raw stdout and stderr bytes.
+    """
+    processes = {
+        command: subprocess.Popen(
+            [sys.executable, "-m", "wetwire_gitlab.cli", command, "--help"]
+            if command
+            else [sys.executable, "-m", "wetwire_gitlab.cli", "--help"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        for command in ["", *HELP_COMMANDS]
+    }
+    results = {}
+    for command, process in processes.items():
+        stdout, stderr = process.communicate()
+        results[command] = (process.returncode, stdout, stderr)
+    return results
+
 
 class TestCLIEntry:
     """Tests for CLI entry point."""
 
-    def test_cli_help(self):
+    def test_cli_help(self, cli_help_results):
         """CLI shows help message."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-        assert (
-            "wetwire-gitlab" in result.stdout.lower()
-            or "usage" in result.stdout.lower()
-        )
+        returncode, stdout, stderr = cli_help_results[""]
+        assert returncode == 0, stderr
+        assert b"wetwire-gitlab" in stdout.lower() or b"usage" in stdout.lower()
 
     def test_cli_version(self):
         """CLI shows version."""
         result = subprocess.run(
             [sys.executable, "-m", "wetwire_gitlab.cli", "version"],
+            check=False,
             capture_output=True,
-            text=True,
         )
-        assert result.returncode == 0
-        assert "0.1.0" in result.stdout
+        assert result.returncode == 0, result.stderr
+        assert b"0.1.0" in result.stdout
 
 
 class TestBuildCommand:
     """Tests for build command."""
 
-    def test_build_help(self):
+    def test_build_help(self, cli_help_results):
         """Build command shows help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "build", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-        assert "build" in result.stdout.lower()
+        returncode, stdout, stderr = cli_help_results["build"]
+        assert returncode == 0, stderr
+        assert b"build" in stdout.lower()
 
-    def test_build_type_flag(self):
+    def test_build_type_flag(self, cli_help_results):
         """Build command accepts --type flag."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "build", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert "--type" in result.stdout or "-t" in result.stdout
-
-
-class TestValidateCommand:
-    """Tests for validate command."""
-
-    def test_validate_help(self):
-        """Validate command shows help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "validate", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-
-
-class TestListCommand:
-    """Tests for list command."""
-
-    def test_list_help(self):
-        """List command shows help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "list", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-
-
-class TestLintCommand:
-    """Tests for lint command."""
-
-    def test_lint_help(self):
-        """Lint command shows help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "lint", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-
+        _, stdout, _ = cli_help_results["build"]
+        assert b"--type" in stdout or b"-t" in stdout
 
-class TestImportCommand:
-    """Tests for import command."""
-
-    def test_import_help(self):
-        """Import command shows help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "import", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
 
+class TestSubcommandHelp:
+    """Tests that every subcommand shows help."""
 
-class TestInitCommand:
-    """Tests for init command."""
-
-    def test_init_help(self):
-        """Init command shows help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "init", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-
-
-class TestDesignCommand:
-    """Tests for design command."""
-
-    def test_design_help(self):
-        """Design command shows help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "design", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-
-
-class TestTestCommand:
-    """Tests for test command."""
-
-    def test_test_help(self):
-        """Test command shows help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "test", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-
-
-class TestGraphCommand:
-    """Tests for graph command."""
-
-    def test_graph_help(self):
-        """Graph command shows help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "graph", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
+    @pytest.mark.parametrize("command", HELP_COMMANDS)
+    def test_subcommand_help(self, cli_help_results, command):
+        """Subcommand shows help."""
+        returncode, _, stderr = cli_help_results[command]
+        assert returncode == 0, stderr
 
 
 class TestExitCodes:
@@ -165,10 +96,12 @@ class TestExitCodes:
         """Unknown command exits with error code."""
         result = subprocess.run(
             [sys.executable, "-m", "wetwire_gitlab.cli", "unknown_command"],
-            capture_output=True,
-            text=True,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
         assert result.returncode != 0
+        assert b"invalid choice" in result.stderr
 
 
 class TestParserAPI:
@@ -3,6 +3,8 @@
 import tempfile
 from pathlib import Path
 
+import yaml
+
 
 class TestImporterIR:
     """Tests for importer intermediate representation types."""
@@ -58,6 +60,23 @@ class TestImporterIR:
 
         assert len(pipeline.jobs) == 2
 
+    def test_ir_pipeline_to_jobs(self):
+        """IRPipeline converts its jobs to Job objects in order."""
+        from wetwire_gitlab.importer import IRJob, IRPipeline
+        from wetwire_gitlab.pipeline import Job
+
+        pipeline = IRPipeline(
+            jobs=[
+                IRJob(name="build", stage="build", script=["make"]),
+                IRJob(name="test", stage="test", script=["pytest"]),
+            ]
+        )
+
+        jobs = pipeline.to_jobs()
+
+        assert all(isinstance(job, Job) for job in jobs)
+        assert [job.name for job in jobs] == ["build", "test"]
+
     def test_ir_rule_creation(self):
         """Create IRRule with conditions."""
         from wetwire_gitlab.importer import IRRule
@@ -242,6 +261,60 @@ build:
         assert pipeline.default is not None
         assert pipeline.default.get("image") == "python:3.11"
 
+    def test_parser_uses_libyaml_when_available(self):
+        """Parser loads YAML with the C-backed safe loader if PyYAML has it."""
+        from wetwire_gitlab.importer import parser
+
+        if yaml.__with_libyaml__:
+            assert parser.SafeLoader is yaml.CSafeLoader
+        else:
+            assert parser.SafeLoader is yaml.SafeLoader
+
+
+class TestParseFromDict:
+    """Tests for parsing an already-loaded configuration dictionary."""
+
+    def test_parse_dict(self):
+        """Parse pipeline from a configuration dictionary."""
+        from wetwire_gitlab.importer import parse_gitlab_ci_dict
+
+        pipeline = parse_gitlab_ci_dict(
+            {
+                "stages": ["build"],
+                "build": {"stage": "build", "script": ["make build"]},
+            }
+        )
+
+        assert pipeline.stages == ["build"]
+        assert [job.name for job in pipeline.jobs] == ["build"]
+
+    def test_parse_dict_matches_yaml(self):
+        """Parsing a dictionary gives the same IR as parsing its YAML."""
+        from wetwire_gitlab.importer import parse_gitlab_ci, parse_gitlab_ci_dict
+
+        yaml_content = """
+stages:
+  - test
+
+test:
+  stage: test
+  script:
+    - pytest
+  rules:
+    - if: $CI_COMMIT_BRANCH
+"""
+
+        assert parse_gitlab_ci_dict(yaml.safe_load(yaml_content)) == parse_gitlab_ci(
+            yaml_content
+        )
+
+    def test_parse_empty_dict(self):
+        """Empty or missing configuration gives an empty pipeline."""
+        from wetwire_gitlab.importer import IRPipeline, parse_gitlab_ci_dict
+
+        assert parse_gitlab_ci_dict({}) == IRPipeline()
+        assert parse_gitlab_ci_dict(None) == IRPipeline()
+
 
 class TestYAMLParserFromFile:
     """Tests for parsing from file."""
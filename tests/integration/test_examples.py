@@ -1,32 +1,63 @@
 """Tests for example projects."""
 
 import importlib
+import importlib.machinery
+import importlib.util
 import sys
 from pathlib import Path
+from types import ModuleType
 
 import pytest
 
-# Add examples to path for import
+# Root directory holding the example projects
 EXAMPLES_DIR = Path(__file__).parent.parent.parent / "examples"
 
+# Synthetic parent package that every example is imported under, so each
+# example keeps a unique module name and stays cached in sys.modules.
+EXAMPLES_PACKAGE = "wetwire_examples"
+
+
+def _ensure_namespace(name: str) -> None:
+    """Register an empty parent package in sys.modules if missing."""
+    if name not in sys.modules:
+        spec = importlib.machinery.ModuleSpec(name, None, is_package=True)
+        module = importlib.util.module_from_spec(spec)
+        module.__path__ = []
+        sys.modules[name] = module
 
-def import_example_ci(example_name: str):
-    """Import the ci module from an example, handling sys.path correctly."""
-    example_path = str(EXAMPLES_DIR / example_name)
 
-    # Remove any existing ci module and example paths
-    if "ci" in sys.modules:
-        del sys.modules["ci"]
-    for key in list(sys.modules.keys()):
-        if key.startswith("ci."):
-            del sys.modules[key]
+def _import_package(qualname: str, package_dir: Path) -> ModuleType:
+    """Import the package at package_dir as qualname, once per session."""
+    if qualname in sys.modules:
+        return sys.modules[qualname]
 
-    # Remove old example paths from sys.path
-    sys.path = [p for p in sys.path if "examples" not in p]
+    parts = qualname.split(".")
+    for i in range(1, len(parts)):
+        _ensure_namespace(".".join(parts[:i]))
 
-    # Add new example path and import
-    sys.path.insert(0, example_path)
-    return importlib.import_module("ci")
+    spec = importlib.util.spec_from_file_location(
+        qualname,
+        package_dir / "__init__.py",
+        submodule_search_locations=[str(package_dir)],
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualname] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _slug(example_name: str) -> str:
+    """Convert an example directory name to a module name."""
+    return example_name.replace("-", "_")
+
+
+def import_example_ci(example_name: str):
+    """Import the ci package from an example."""
+    return _import_package(
+        f"{EXAMPLES_PACKAGE}.{_slug(example_name)}.ci",
+        EXAMPLES_DIR / example_name / "ci",
+    )
 
 
 @pytest.mark.slow
@@ -158,21 +189,11 @@ class TestMonorepoExample:
 
 def import_imported_example(example_name: str):
     """Import the pipeline.jobs module from an imported example."""
-    example_path = str(EXAMPLES_DIR / "imported" / example_name / "src")
-
-    # Remove any existing pipeline module
-    if "pipeline" in sys.modules:
-        del sys.modules["pipeline"]
-    for key in list(sys.modules.keys()):
-        if key.startswith("pipeline."):
-            del sys.modules[key]
-
-    # Remove old example paths from sys.path
-    sys.path = [p for p in sys.path if "imported" not in p]
-
-    # Add new example path and import the jobs module
-    sys.path.insert(0, example_path)
-    return importlib.import_module("pipeline.jobs")
+    package = _import_package(
+        f"{EXAMPLES_PACKAGE}.imported.{_slug(example_name)}.pipeline",
+        EXAMPLES_DIR / "imported" / example_name / "src" / "pipeline",
+    )
+    return importlib.import_module(f"{package.__name__}.jobs")
 
 
 @pytest.mark.slow
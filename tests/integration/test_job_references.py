@@ -9,14 +9,24 @@ from wetwire_gitlab.pipeline import Job
 from wetwire_gitlab.serialize import build_pipeline_yaml, to_dict
 
 
-@pytest.mark.slow
+@pytest.fixture(scope="module")
+def build_job() -> Job:
+    """Shared build job referenced by the tests below."""
+    return Job(name="build", stage="build", script=["make build"])
+
+
+@pytest.fixture(scope="module")
+def lint_job() -> Job:
+    """Shared lint job referenced by the tests below."""
+    return Job(name="lint", stage="test", script=["make lint"])
+
+
 class TestJobReferenceInNeeds:
     """Tests for using Job instances in needs field."""
 
-    def test_needs_with_job_instance(self):
+    def test_needs_with_job_instance(self, build_job):
         """needs can accept Job instance directly."""
-        build = Job(name="build", stage="build", script=["make build"])
-        test = Job(name="test", stage="test", script=["make test"], needs=[build])
+        test = Job(name="test", stage="test", script=["make test"], needs=[build_job])
 
         result = to_dict(test)
         assert result["needs"] == ["build"]
@@ -28,46 +38,41 @@ class TestJobReferenceInNeeds:
         result = to_dict(test)
         assert result["needs"] == ["build"]
 
-    def test_needs_with_mixed_references(self):
+    def test_needs_with_mixed_references(self, build_job):
         """needs can mix Job instances and strings."""
-        build = Job(name="build", stage="build", script=["make build"])
         test = Job(
             name="test",
             stage="test",
             script=["make test"],
-            needs=[build, "lint"],  # Mix of Job instance and string
+            needs=[build_job, "lint"],  # Mix of Job instance and string
         )
 
         result = to_dict(test)
         assert result["needs"] == ["build", "lint"]
 
-    def test_needs_with_multiple_jobs(self):
+    def test_needs_with_multiple_jobs(self, build_job, lint_job):
         """needs can accept multiple Job instances."""
-        build = Job(name="build", stage="build", script=["make build"])
-        lint = Job(name="lint", stage="test", script=["make lint"])
         deploy = Job(
             name="deploy",
             stage="deploy",
             script=["make deploy"],
-            needs=[build, lint],
+            needs=[build_job, lint_job],
         )
 
         result = to_dict(deploy)
         assert result["needs"] == ["build", "lint"]
 
 
-@pytest.mark.slow
 class TestJobReferenceInDependencies:
     """Tests for using Job instances in dependencies field."""
 
-    def test_dependencies_with_job_instance(self):
+    def test_dependencies_with_job_instance(self, build_job):
         """dependencies can accept Job instance directly."""
-        build = Job(name="build", stage="build", script=["make build"])
         test = Job(
             name="test",
             stage="test",
             script=["make test"],
-            dependencies=[build],
+            dependencies=[build_job],
         )
 
         result = to_dict(test)
@@ -86,35 +91,32 @@ class TestJobReferenceInDependencies:
         assert result["dependencies"] == ["build"]
 
 
-@pytest.mark.slow
 class TestJobReferenceInBuildYaml:
     """Tests for Job references in full YAML build."""
 
-    def test_build_yaml_with_job_references(self):
+    def test_build_yaml_with_job_references(self, build_job):
         """Build YAML with Job references produces correct output."""
         from wetwire_gitlab.pipeline import Pipeline
 
         pipeline = Pipeline(stages=["build", "test", "deploy"])
-        build = Job(name="build", stage="build", script=["make build"])
-        test = Job(name="test", stage="test", script=["make test"], needs=[build])
+        test = Job(name="test", stage="test", script=["make test"], needs=[build_job])
         deploy = Job(
             name="deploy", stage="deploy", script=["make deploy"], needs=[test]
         )
 
-        yaml_output = build_pipeline_yaml(pipeline, [build, test, deploy])
+        yaml_output = build_pipeline_yaml(pipeline, [build_job, test, deploy])
 
         assert "needs:" in yaml_output
         assert "- build" in yaml_output
 
-    def test_build_yaml_preserves_job_order(self):
+    def test_build_yaml_preserves_job_order(self, build_job):
         """Build YAML respects job definition order."""
         from wetwire_gitlab.pipeline import Pipeline
 
         pipeline = Pipeline(stages=["build", "test"])
-        build = Job(name="build", stage="build", script=["make build"])
-        test = Job(name="test", stage="test", script=["make test"], needs=[build])
+        test = Job(name="test", stage="test", script=["make test"], needs=[build_job])
 
-        yaml_output = build_pipeline_yaml(pipeline, [build, test])
+        yaml_output = build_pipeline_yaml(pipeline, [build_job, test])
 
         # "build" should appear before "test" in the output
         build_pos = yaml_output.find("build:")
@@ -122,7 +124,6 @@ class TestJobReferenceInBuildYaml:
         assert build_pos < test_pos
 
 
-@pytest.mark.slow
 class TestJobReferenceExtractsName:
     """Tests for extracting job name from Job instance."""
 
@@ -3,112 +3,88 @@
 Tests for Issue #67: Kiro Provider Support
 """
 
-import subprocess
-import sys
-import tempfile
+import contextlib
+import io
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from wetwire_gitlab.cli import create_parser
+
+
+def format_cli_help(command: str) -> str:
+    """Format ``<command> --help`` from the parser without running the CLI."""
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout), pytest.raises(SystemExit) as exc_info:
+        create_parser().parse_args([command, "--help"])
+    assert exc_info.value.code == 0
+    return stdout.getvalue()
+
+
+@pytest.fixture(scope="session")
+def help_design() -> str:
+    """Help text of the design command, formatted once per session."""
+    return format_cli_help("design")
+
+
+@pytest.fixture(scope="session")
+def help_test() -> str:
+    """Help text of the test command, formatted once per session."""
+    return format_cli_help("test")
+
 
-@pytest.mark.slow
 class TestKiroProviderFlag:
     """Tests for --provider flag in CLI commands."""
 
-    def test_design_help_shows_provider_flag(self):
+    def test_design_help_shows_provider_flag(self, help_design):
         """Design command shows --provider option in help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "design", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-        assert "--provider" in result.stdout
-
-    def test_design_provider_accepts_anthropic(self):
+        assert "--provider" in help_design
+
+    def test_design_provider_accepts_anthropic(self, help_design):
         """Design command accepts --provider anthropic."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "design", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert "anthropic" in result.stdout
-
-    def test_design_provider_accepts_kiro(self):
+        assert "anthropic" in help_design
+
+    def test_design_provider_accepts_kiro(self, help_design):
         """Design command accepts --provider kiro."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "design", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert "kiro" in result.stdout
-
-    def test_test_help_shows_provider_flag(self):
+        assert "kiro" in help_design
+
+    def test_test_help_shows_provider_flag(self, help_test):
         """Test command shows --provider option in help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "test", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-        assert "--provider" in result.stdout
-
-    def test_test_provider_accepts_kiro(self):
+        assert "--provider" in help_test
+
+    def test_test_provider_accepts_kiro(self, help_test):
         """Test command accepts --provider kiro."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "test", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert "kiro" in result.stdout
-
-    def test_test_help_shows_timeout_flag(self):
+        assert "kiro" in help_test
+
+    def test_test_help_shows_timeout_flag(self, help_test):
         """Test command shows --timeout option for kiro provider."""
-        result = subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "test", "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert "--timeout" in result.stdout
+        assert "--timeout" in help_test
 
 
-@pytest.mark.slow
 class TestKiroModuleImports:
     """Tests for kiro module imports and structure."""
 
     def test_kiro_module_importable(self):
         """Kiro module is importable."""
+        import wetwire_gitlab.kiro  # noqa: F401
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "check_kiro_installed",
+            "install_kiro_configs",
+            "launch_kiro",
+            "run_kiro_scenario",
+        ],
+    )
+    def test_kiro_exports_function(self, name):
+        """Kiro module exports the expected functions."""
         from wetwire_gitlab import kiro
 
-        assert kiro is not None
-
-    def test_check_kiro_installed_function(self):
-        """check_kiro_installed function exists."""
-        from wetwire_gitlab.kiro import check_kiro_installed
-
-        assert callable(check_kiro_installed)
-
-    def test_install_kiro_configs_function(self):
-        """install_kiro_configs function exists."""
-        from wetwire_gitlab.kiro import install_kiro_configs
-
-        assert callable(install_kiro_configs)
-
-    def test_launch_kiro_function(self):
-        """launch_kiro function exists."""
-        from wetwire_gitlab.kiro import launch_kiro
-
-        assert callable(launch_kiro)
-
-    def test_run_kiro_scenario_function(self):
-        """run_kiro_scenario function exists."""
-        from wetwire_gitlab.kiro import run_kiro_scenario
-
-        assert callable(run_kiro_scenario)
+        assert callable(getattr(kiro, name))
 
 
-@pytest.mark.slow
 class TestKiroCheckInstalled:
     """Tests for check_kiro_installed function."""
 
@@ -129,23 +105,32 @@ class TestKiroCheckInstalled:
         assert check_kiro_installed() is False
 
 
-@pytest.mark.slow
+@pytest.fixture(scope="session")
+def kiro_installed_dir(tmp_path_factory) -> tuple[Path, dict]:
+    """Project directory with Kiro configs installed once per session.
+
+    Returns the directory and the result of ``install_kiro_configs``. Tests
+    that only inspect the installed files share it; tests that write to a
+    project directory should use their own ``tmp_path``.
+    """
+    from wetwire_gitlab.kiro import install_kiro_configs
+
+    project_dir = tmp_path_factory.mktemp("kiro")
+    return project_dir, install_kiro_configs(project_dir=project_dir)
+
+
 class TestKiroInstallConfigs:
     """Tests for installing Kiro configurations."""
 
-    def test_install_kiro_configs_creates_files(self):
+    def test_install_kiro_configs_creates_files(self, kiro_installed_dir):
         """install_kiro_configs creates config files in temp directory."""
-        from wetwire_gitlab.kiro import install_kiro_configs
-
-        with tempfile.TemporaryDirectory() as tmp:
-            result = install_kiro_configs(project_dir=Path(tmp))
-            assert isinstance(result, dict)
-            # Should have mcp config in project dir
-            mcp_config = Path(tmp) / ".kiro" / "mcp.json"
-            assert mcp_config.exists()
+        project_dir, result = kiro_installed_dir
+        assert isinstance(result, dict)
+        # Should have mcp config in project dir
+        mcp_config = project_dir / ".kiro" / "mcp.json"
+        assert mcp_config.exists()
 
 
-@pytest.mark.slow
 class TestLaunchKiro:
     """Tests for launch_kiro function."""
 
@@ -163,67 +148,79 @@ class TestLaunchKiro:
             pass  # Expected if kiro-cli not installed
 
 
-@pytest.mark.slow
+@pytest.fixture
+def kiro_cli_mocks():
+    """Patch kiro-cli detection and launch for run_kiro_scenario tests."""
+    with (
+        patch("wetwire_gitlab.kiro.check_kiro_installed") as mock_check,
+        patch("wetwire_gitlab.kiro.launch_kiro") as mock_launch,
+    ):
+        mock_launch.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        yield mock_check, mock_launch
+
+
+RESULT_KEYS = {
+    "success",
+    "exit_code",
+    "stdout",
+    "stderr",
+    "package_path",
+    "template_valid",
+}
+
+
 class TestRunKiroScenario:
     """Tests for run_kiro_scenario function."""
 
-    @patch("wetwire_gitlab.kiro.check_kiro_installed")
-    def test_run_kiro_scenario_not_installed_returns_error(self, mock_check):
-        """run_kiro_scenario returns error dict if kiro-cli not installed."""
+    @pytest.mark.parametrize("installed", [True, False])
+    def test_run_kiro_scenario_result(self, kiro_cli_mocks, installed, tmp_path):
+        """run_kiro_scenario returns a result dict, or an error if not installed."""
         from wetwire_gitlab.kiro import run_kiro_scenario
 
-        mock_check.return_value = False
-        result = run_kiro_scenario("Create a pipeline")
-        assert result["success"] is False
-        assert "not found" in result["stderr"].lower()
+        mock_check, mock_launch = kiro_cli_mocks
+        mock_check.return_value = installed
 
-    @patch("wetwire_gitlab.kiro.check_kiro_installed")
-    @patch("wetwire_gitlab.kiro.launch_kiro")
-    def test_run_kiro_scenario_returns_result_dict(self, mock_launch, mock_check):
-        """run_kiro_scenario returns a properly structured result dict."""
-        from wetwire_gitlab.kiro import run_kiro_scenario
+        result = run_kiro_scenario("Create a pipeline", project_dir=tmp_path)
+
+        assert set(result) == RESULT_KEYS
+        assert mock_launch.called is installed
+        if not installed:
+            assert result["success"] is False
+            assert "not found" in result["stderr"].lower()
 
-        mock_check.return_value = True
-        mock_launch.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
-        with tempfile.TemporaryDirectory() as tmp:
-            result = run_kiro_scenario("Create a pipeline", project_dir=Path(tmp))
+@pytest.fixture(scope="session")
+def gitlab_kiro_config():
+    """GITLAB_KIRO_CONFIG, imported once per session."""
+    from wetwire_gitlab.kiro import GITLAB_KIRO_CONFIG
 
-            assert "success" in result
-            assert "exit_code" in result
-            assert "stdout" in result
-            assert "stderr" in result
-            assert "package_path" in result
-            assert "template_valid" in result
+    return GITLAB_KIRO_CONFIG
+
+
+@pytest.fixture(scope="session")
+def gitlab_agent_prompt_lower(gitlab_kiro_config) -> str:
+    """Lowercased GitLab agent prompt, computed once per session."""
+    return gitlab_kiro_config.agent_prompt.lower()
 
 
-@pytest.mark.slow
 class TestGitLabKiroConfig:
     """Tests for GitLab-specific Kiro configuration."""
 
-    def test_gitlab_kiro_config_exists(self):
+    def test_gitlab_kiro_config_exists(self, gitlab_kiro_config):
         """GITLAB_KIRO_CONFIG exists with correct values."""
-        from wetwire_gitlab.kiro import GITLAB_KIRO_CONFIG
-
-        assert GITLAB_KIRO_CONFIG is not None
-        assert GITLAB_KIRO_CONFIG.agent_name == "wetwire-gitlab-runner"
-        assert GITLAB_KIRO_CONFIG.mcp_command == "wetwire-gitlab-mcp"
+        assert gitlab_kiro_config is not None
+        assert gitlab_kiro_config.agent_name == "wetwire-gitlab-runner"
+        assert gitlab_kiro_config.mcp_command == "wetwire-gitlab-mcp"
 
-    def test_gitlab_kiro_config_has_gitlab_prompt(self):
+    def test_gitlab_kiro_config_has_gitlab_prompt(self, gitlab_agent_prompt_lower):
         """GITLAB_KIRO_CONFIG has GitLab-specific prompt content."""
-        from wetwire_gitlab.kiro import GITLAB_KIRO_CONFIG
+        assert "gitlab" in gitlab_agent_prompt_lower
 
-        prompt = GITLAB_KIRO_CONFIG.agent_prompt
-        assert "GitLab" in prompt or "gitlab" in prompt.lower()
-
-    def test_gitlab_kiro_config_references_mcp_tools(self):
+    def test_gitlab_kiro_config_references_mcp_tools(self, gitlab_agent_prompt_lower):
         """GITLAB_KIRO_CONFIG prompt references MCP tools."""
-        from wetwire_gitlab.kiro import GITLAB_KIRO_CONFIG
-
-        prompt = GITLAB_KIRO_CONFIG.agent_prompt
-        # Should mention lint and build tools
-        assert "lint" in prompt.lower() or "wetwire_lint" in prompt
-        assert "build" in prompt.lower() or "wetwire_build" in prompt
+        # Should mention lint and build tools (e.g. wetwire_lint, wetwire_build)
+        assert "lint" in gitlab_agent_prompt_lower
+        assert "build" in gitlab_agent_prompt_lower
 
     def test_gitlab_agent_prompt_exported(self):
         """GITLAB_AGENT_PROMPT is exported from the module."""
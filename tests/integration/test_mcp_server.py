@@ -3,10 +3,141 @@
 from __future__ import annotations
 
 import json
+import subprocess
+import sys
+import textwrap
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
+import yaml
+
+# Runs in a fresh interpreter so blocking the mcp package cannot leave a
+# reloaded mcp_server module behind for the rest of the session.
+WITHOUT_MCP_SCRIPT = textwrap.dedent(
+    """
+    import sys
+
+    sys.modules["mcp"] = None
+    sys.modules["mcp.server"] = None
+
+    from wetwire_gitlab import mcp_server
+
+    try:
+        mcp_server.create_server()
+    except ImportError as e:
+        print(e)
+    else:
+        sys.exit(1)
+    """
+)
+
+
+LINT_FILE_SOURCE = """
+from wetwire_gitlab.pipeline import Job
+
+job = Job(
+    name="test",
+    stage="test",
+    script=["echo test"],
+    rules=[{"if": "$CI_PIPELINE_SOURCE == 'merge_request_event'"}],
+)
+"""
+
+PACKAGE_INIT_SOURCE = """
+from .jobs import *
+"""
+
+TEST_JOB_SOURCE = """
+from wetwire_gitlab.pipeline import Job
+
+test = Job(
+    name="test",
+    stage="test",
+    script=["pytest"],
+)
+"""
+
+BUILD_JOB_SOURCE = """
+from wetwire_gitlab.pipeline import Job
+
+build = Job(
+    name="build",
+    stage="build",
+    script=["make build"],
+)
+"""
+
+VALIDATE_YAML = """
+stages:
+  - test
+
+test:
+  stage: test
+  script:
+    - echo "test"
+"""
+
+IMPORT_YAML = """
+test:
+  stage: test
+  script:
+    - pytest
+"""
+
+# Layout of the shared workspace; each test owns one top-level directory.
+SHARED_WS_DIRS = ["init", "init_existing/existing", "not_package"]
+SHARED_WS_FILES = {
+    "lint_file/pipeline.py": LINT_FILE_SOURCE,
+    "lint_dir/ci/jobs.py": "# empty file\n",
+    "lint_dir/ci/pipeline.py": "# empty file\n",
+    "lint_dir/ci/__pycache__/cached.py": "# skipped\n",
+    "lint_dir/.hidden/skipped.py": "# skipped\n",
+    "build_yaml/ci/__init__.py": PACKAGE_INIT_SOURCE,
+    "build_yaml/ci/jobs.py": TEST_JOB_SOURCE,
+    "build_json/ci/__init__.py": PACKAGE_INIT_SOURCE,
+    "build_json/ci/jobs.py": BUILD_JOB_SOURCE,
+    "validate/.gitlab-ci.yml": VALIDATE_YAML,
+    "import/.gitlab-ci.yml": IMPORT_YAML,
+}
+
+
+@pytest.fixture(scope="module")
+def mcp_server():
+    """The mcp_server module, imported once for this test module.
+
+    Imported here rather than at module level: mcp_server needs wetwire-core
+    (a dev dependency), and a failed module-level import would stop the
+    whole test session at collection instead of failing these tests.
+    """
+    from wetwire_gitlab import mcp_server
+
+    return mcp_server
+
+
+@pytest.fixture(scope="module")
+def shared_ws(tmp_path_factory) -> Path:
+    """Workspace holding the files the tool tests read.
+
+    Built once for this test module. Tests only read from it; a test that
+    writes (such as creating a package with the init tool) uses its own
+    ``tmp_path`` so reruns start clean.
+    """
+    root = tmp_path_factory.mktemp("mcp_ws")
+    for directory in SHARED_WS_DIRS:
+        (root / directory).mkdir(parents=True)
+    for relpath, content in SHARED_WS_FILES.items():
+        path = root / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return root
+
+
+@pytest.fixture(scope="session")
+def glab_available() -> bool:
+    """Whether the glab CLI is installed, probed once per session."""
+    from wetwire_gitlab.validation.glab import is_glab_installed
+
+    return is_glab_installed()
 
 
 @pytest.mark.slow
@@ -15,24 +146,21 @@ class TestMCPServer:
 
     def test_create_server_without_mcp_raises(self):
         """Creating server without MCP package raises ImportError."""
-        with patch.dict("sys.modules", {"mcp": None, "mcp.server": None}):
-            # Force reimport to trigger ImportError check
-            import importlib
-
-            from wetwire_gitlab import mcp_server
-
-            importlib.reload(mcp_server)
+        result = subprocess.run(
+            [sys.executable, "-c", WITHOUT_MCP_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
 
-            with pytest.raises(ImportError, match="MCP package required"):
-                mcp_server.create_server()
+        assert result.returncode == 0, result.stderr
+        assert "MCP package required" in result.stdout
 
-    def test_create_server_returns_server(self):
+    def test_create_server_returns_server(self, mcp_server):
         """create_server returns configured MCP Server."""
         pytest.importorskip("mcp")
 
-        from wetwire_gitlab.mcp_server import create_server
-
-        server = create_server()
+        server = mcp_server.create_server()
         assert server is not None
         assert server.name == "wetwire-gitlab-mcp"
 
@@ -41,11 +169,9 @@ class TestMCPServer:
 class TestInitTool:
     """Tests for wetwire_init tool."""
 
-    def test_init_creates_package(self, tmp_path: Path):
+    def test_init_creates_package(self, mcp_server, tmp_path: Path):
         """Init tool creates package directory structure."""
-        from wetwire_gitlab.mcp_server import _create_package
-
-        result = _create_package(str(tmp_path), "my_pipeline")
+        result = mcp_server._create_package(str(tmp_path), "my_pipeline")
 
         assert result["success"] is True
         assert "my_pipeline" in result["message"]
@@ -56,31 +182,25 @@ class TestInitTool:
         assert (package_dir / "pipeline.py").exists()
         assert (package_dir / "jobs.py").exists()
 
-    def test_init_invalid_name(self, tmp_path: Path):
+    def test_init_invalid_name(self, mcp_server, shared_ws: Path):
         """Init tool rejects invalid module names."""
-        from wetwire_gitlab.mcp_server import _create_package
-
-        result = _create_package(str(tmp_path), "my-pipeline")
+        result = mcp_server._create_package(str(shared_ws / "init"), "my-pipeline")
 
         assert result["success"] is False
         assert "Invalid module name" in result["error"]
 
-    def test_init_nonexistent_path(self):
+    def test_init_nonexistent_path(self, mcp_server):
         """Init tool reports error for nonexistent path."""
-        from wetwire_gitlab.mcp_server import _create_package
-
-        result = _create_package("/nonexistent/path", "my_pipeline")
+        result = mcp_server._create_package("/nonexistent/path", "my_pipeline")
 
         assert result["success"] is False
         assert "does not exist" in result["error"]
 
-    def test_init_existing_package(self, tmp_path: Path):
+    def test_init_existing_package(self, mcp_server, shared_ws: Path):
         """Init tool reports error if package exists."""
-        from wetwire_gitlab.mcp_server import _create_package
-
-        (tmp_path / "existing").mkdir()
-
-        result = _create_package(str(tmp_path), "existing")
+        result = mcp_server._create_package(
+            str(shared_ws / "init_existing"), "existing"
+        )
 
         assert result["success"] is False
         assert "already exists" in result["error"]
@@ -90,26 +210,12 @@ class TestInitTool:
 class TestLintTool:
     """Tests for wetwire_lint tool."""
 
-    def test_lint_file(self, tmp_path: Path):
+    def test_lint_file(self, mcp_server, shared_ws: Path):
         """Lint tool checks Python file for issues."""
-        from wetwire_gitlab.mcp_server import _lint_path
+        # File with a lint issue (raw dict instead of Rule)
+        test_file = shared_ws / "lint_file" / "pipeline.py"
 
-        # Create a file with a lint issue (raw dict instead of Rule)
-        test_file = tmp_path / "pipeline.py"
-        test_file.write_text(
-            """
-from wetwire_gitlab.pipeline import Job
-
-job = Job(
-    name="test",
-    stage="test",
-    script=["echo test"],
-    rules=[{"if": "$CI_PIPELINE_SOURCE == 'merge_request_event'"}],
-)
-"""
-        )
-
-        result = _lint_path(str(test_file))
+        result = mcp_server._lint_path(str(test_file))
 
         assert result["success"] is True
         assert "issues" in result
@@ -118,26 +224,18 @@ job = Job(
             result["issue_count"] >= 0
         )  # May or may not have issues depending on impl
 
-    def test_lint_directory(self, tmp_path: Path):
+    def test_lint_directory(self, mcp_server, shared_ws: Path):
         """Lint tool scans directory for Python files."""
-        from wetwire_gitlab.mcp_server import _lint_path
-
-        # Create subdirectory with Python files
-        subdir = tmp_path / "ci"
-        subdir.mkdir()
-        (subdir / "jobs.py").write_text("# empty file\n")
-        (subdir / "pipeline.py").write_text("# empty file\n")
-
-        result = _lint_path(str(tmp_path))
+        # Subdirectory ci/ holds two Python files; __pycache__ and hidden
+        # directories are skipped
+        result = mcp_server._lint_path(str(shared_ws / "lint_dir"))
 
         assert result["success"] is True
         assert result["file_count"] == 2
 
-    def test_lint_nonexistent_path(self):
+    def test_lint_nonexistent_path(self, mcp_server):
         """Lint tool reports error for nonexistent path."""
-        from wetwire_gitlab.mcp_server import _lint_path
-
-        result = _lint_path("/nonexistent/file.py")
+        result = mcp_server._lint_path("/nonexistent/file.py")
 
         assert result["success"] is False
         assert "does not exist" in result["error"]
@@ -147,62 +245,25 @@ job = Job(
 class TestBuildTool:
     """Tests for wetwire_build tool."""
 
-    def test_build_generates_yaml(self, tmp_path: Path):
+    def test_build_generates_yaml(self, mcp_server, shared_ws: Path):
         """Build tool generates YAML from package."""
-        from wetwire_gitlab.mcp_server import _build_template
-
-        # Create a minimal package with a job
-        package = tmp_path / "ci"
-        package.mkdir()
-        (package / "__init__.py").write_text(
-            """
-from .jobs import *
-"""
-        )
-        (package / "jobs.py").write_text(
-            """
-from wetwire_gitlab.pipeline import Job
+        # Minimal package with a job
+        package = shared_ws / "build_yaml" / "ci"
 
-test = Job(
-    name="test",
-    stage="test",
-    script=["pytest"],
-)
-"""
-        )
-
-        result = _build_template(str(package), output_format="yaml")
+        result = mcp_server._build_template(str(package), output_format="yaml")
 
         assert result["success"] is True
         assert "template" in result
-        assert "test:" in result["template"]
+        data = yaml.safe_load(result["template"])
+        assert data["test"]["script"] == ["pytest"]
         assert result["format"] == "yaml"
 
-    def test_build_generates_json(self, tmp_path: Path):
+    def test_build_generates_json(self, mcp_server, shared_ws: Path):
         """Build tool generates JSON from package."""
-        from wetwire_gitlab.mcp_server import _build_template
-
-        # Create a minimal package
-        package = tmp_path / "ci"
-        package.mkdir()
-        (package / "__init__.py").write_text(
-            """
-from .jobs import *
-"""
-        )
-        (package / "jobs.py").write_text(
-            """
-from wetwire_gitlab.pipeline import Job
+        # Minimal package
+        package = shared_ws / "build_json" / "ci"
 
-build = Job(
-    name="build",
-    stage="build",
-    script=["make build"],
-)
-"""
-        )
-
-        result = _build_template(str(package), output_format="json")
+        result = mcp_server._build_template(str(package), output_format="json")
 
         assert result["success"] is True
         assert "template" in result
@@ -211,24 +272,19 @@ build = Job(
         assert "build" in data
         assert result["format"] == "json"
 
-    def test_build_nonexistent_path(self):
+    def test_build_nonexistent_path(self, mcp_server):
         """Build tool reports error for nonexistent path."""
-        from wetwire_gitlab.mcp_server import _build_template
-
-        result = _build_template("/nonexistent/package")
+        result = mcp_server._build_template("/nonexistent/package")
 
         assert result["success"] is False
         assert "does not exist" in result["error"]
 
-    def test_build_not_package(self, tmp_path: Path):
+    def test_build_not_package(self, mcp_server, shared_ws: Path):
         """Build tool reports error if path is not a package."""
-        from wetwire_gitlab.mcp_server import _build_template
-
-        # Create directory without __init__.py
-        pkg = tmp_path / "not_package"
-        pkg.mkdir()
+        # Directory without __init__.py
+        pkg = shared_ws / "not_package"
 
-        result = _build_template(str(pkg))
+        result = mcp_server._build_template(str(pkg))
 
         assert result["success"] is False
         assert "not a Python package" in result["error"]
@@ -238,40 +294,26 @@ build = Job(
 class TestValidateTool:
     """Tests for wetwire_validate tool."""
 
-    def test_validate_yaml_file(self, tmp_path: Path):
+    def test_validate_yaml_file(
+        self, mcp_server, shared_ws: Path, glab_available: bool
+    ):
         """Validate tool checks YAML syntax."""
-        from wetwire_gitlab.mcp_server import _validate_pipeline
-        from wetwire_gitlab.validation.glab import is_glab_installed
-
-        # Create a valid YAML file
-        yaml_file = tmp_path / ".gitlab-ci.yml"
-        yaml_file.write_text(
-            """
-stages:
-  - test
-
-test:
-  stage: test
-  script:
-    - echo "test"
-"""
-        )
+        # Valid YAML file
+        yaml_file = shared_ws / "validate" / ".gitlab-ci.yml"
 
-        result = _validate_pipeline(str(yaml_file))
+        result = mcp_server._validate_pipeline(str(yaml_file))
 
         # If glab is not installed, we expect an error message
-        if not is_glab_installed():
+        if not glab_available:
             assert result["success"] is False
             assert "glab" in result["error"].lower()
         else:
             # If glab is installed, validation should work
             assert "success" in result
 
-    def test_validate_nonexistent_file(self):
+    def test_validate_nonexistent_file(self, mcp_server):
         """Validate tool reports error for nonexistent file."""
-        from wetwire_gitlab.mcp_server import _validate_pipeline
-
-        result = _validate_pipeline("/nonexistent/.gitlab-ci.yml")
+        result = mcp_server._validate_pipeline("/nonexistent/.gitlab-ci.yml")
 
         assert result["success"] is False
         assert "does not exist" in result["error"]
@@ -281,32 +323,19 @@ test:
 class TestImportTool:
     """Tests for wetwire_import tool."""
 
-    def test_import_yaml(self, tmp_path: Path):
+    def test_import_yaml(self, mcp_server, shared_ws: Path):
         """Import tool converts YAML to Python."""
-        from wetwire_gitlab.mcp_server import _import_yaml
+        yaml_file = shared_ws / "import" / ".gitlab-ci.yml"
 
-        # Create a YAML file
-        yaml_file = tmp_path / ".gitlab-ci.yml"
-        yaml_file.write_text(
-            """
-test:
-  stage: test
-  script:
-    - pytest
-"""
-        )
-
-        result = _import_yaml(str(yaml_file))
+        result = mcp_server._import_yaml(str(yaml_file))
 
         assert result["success"] is True
         assert "code" in result
         assert "Job" in result["code"]
 
-    def test_import_nonexistent_file(self):
+    def test_import_nonexistent_file(self, mcp_server):
         """Import tool reports error for nonexistent file."""
-        from wetwire_gitlab.mcp_server import _import_yaml
-
-        result = _import_yaml("/nonexistent/.gitlab-ci.yml")
+        result = mcp_server._import_yaml("/nonexistent/.gitlab-ci.yml")
 
         assert result["success"] is False
         assert "does not exist" in result["error"]
@@ -316,11 +345,9 @@ test:
 class TestToolCalls:
     """Tests for async tool call handling."""
 
-    def test_create_server_returns_named_server(self):
+    def test_create_server_returns_named_server(self, mcp_server):
         """Server has correct name when MCP is available."""
         pytest.importorskip("mcp")
 
-        from wetwire_gitlab.mcp_server import create_server
-
-        server = create_server()
+        server = mcp_server.create_server()
         assert server.name == "wetwire-gitlab-mcp"
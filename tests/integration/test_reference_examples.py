@@ -4,7 +4,16 @@ These tests fetch real .gitlab-ci.yml files from GitLab repositories
 and test the import/rebuild cycle.
 """
 
+from types import CodeType
+
 import pytest
+import yaml
+
+from wetwire_gitlab.importer import (
+    generate_python_code,
+    parse_gitlab_ci,
+    parse_gitlab_ci_dict,
+)
 
 # Sample GitLab CI configurations for testing
 SIMPLE_PIPELINE = """
@@ -93,16 +102,75 @@ build:
     - make build
 """
 
+# Sample configurations loaded once at import; tests build IR from these
+# dictionaries so only the canary test below goes through the YAML loader.
+SIMPLE_PIPELINE_DATA = yaml.safe_load(SIMPLE_PIPELINE)
+COMPLEX_PIPELINE_DATA = yaml.safe_load(COMPLEX_PIPELINE)
+PIPELINE_WITH_INCLUDES_DATA = yaml.safe_load(PIPELINE_WITH_INCLUDES)
+
+
+@pytest.fixture(scope="session")
+def parsed_simple():
+    """SIMPLE_PIPELINE, parsed once per session."""
+    return parse_gitlab_ci_dict(SIMPLE_PIPELINE_DATA)
+
+
+@pytest.fixture(scope="session")
+def parsed_complex():
+    """COMPLEX_PIPELINE, parsed once per session."""
+    return parse_gitlab_ci_dict(COMPLEX_PIPELINE_DATA)
+
+
+@pytest.fixture(scope="session")
+def parsed_includes():
+    """PIPELINE_WITH_INCLUDES, parsed once per session."""
+    return parse_gitlab_ci_dict(PIPELINE_WITH_INCLUDES_DATA)
+
+
+@pytest.fixture(scope="session")
+def generated_simple_code(parsed_simple) -> str:
+    """Python code generated from SIMPLE_PIPELINE, once per session."""
+    return generate_python_code(parsed_simple)
+
+
+@pytest.fixture(scope="session")
+def generated_complex_code(parsed_complex) -> str:
+    """Python code generated from COMPLEX_PIPELINE, once per session."""
+    return generate_python_code(parsed_complex)
+
+
+@pytest.fixture(scope="session")
+def compiled_simple(generated_simple_code) -> CodeType:
+    """Generated SIMPLE_PIPELINE code, compiled once per session."""
+    return compile(generated_simple_code, "<test>", "exec")
+
+
+@pytest.fixture(scope="session")
+def compiled_complex(generated_complex_code) -> CodeType:
+    """Generated COMPLEX_PIPELINE code, compiled once per session."""
+    return compile(generated_complex_code, "<test>", "exec")
+
+
+SAMPLE_PIPELINES = [
+    pytest.param(SIMPLE_PIPELINE, id="simple"),
+    pytest.param(COMPLEX_PIPELINE, id="complex"),
+    pytest.param(PIPELINE_WITH_INCLUDES, id="includes"),
+]
+
+
+@pytest.fixture(scope="session")
+def sample_pipeline(request):
+    """Sample pipeline parsed from YAML, once per session per sample."""
+    return parse_gitlab_ci(request.param)
+
 
 @pytest.mark.slow
 class TestParseRealPipelines:
     """Test parsing real pipeline configurations."""
 
-    def test_parse_simple_pipeline(self):
+    def test_parse_simple_pipeline(self, parsed_simple):
         """Parse a simple pipeline."""
-        from wetwire_gitlab.importer import parse_gitlab_ci
-
-        pipeline = parse_gitlab_ci(SIMPLE_PIPELINE)
+        pipeline = parsed_simple
 
         assert pipeline.stages == ["build", "test"]
         assert len(pipeline.jobs) == 2
@@ -111,11 +179,13 @@ class TestParseRealPipelines:
         assert "build" in job_names
         assert "test" in job_names
 
-    def test_parse_complex_pipeline(self):
-        """Parse a complex pipeline with all features."""
-        from wetwire_gitlab.importer import parse_gitlab_ci
+    def test_parse_simple_pipeline_from_yaml_string(self, parsed_simple):
+        """Parsing the YAML string matches parsing the loaded dictionary."""
+        assert parse_gitlab_ci(SIMPLE_PIPELINE) == parsed_simple
 
-        pipeline = parse_gitlab_ci(COMPLEX_PIPELINE)
+    def test_parse_complex_pipeline(self, parsed_complex):
+        """Parse a complex pipeline with all features."""
+        pipeline = parsed_complex
 
         assert pipeline.stages == ["build", "test", "deploy"]
         assert pipeline.variables is not None
@@ -130,11 +200,9 @@ class TestParseRealPipelines:
         assert deploy_job.rules is not None
         assert deploy_job.environment is not None
 
-    def test_parse_pipeline_with_includes(self):
+    def test_parse_pipeline_with_includes(self, parsed_includes):
         """Parse pipeline with include statements."""
-        from wetwire_gitlab.importer import parse_gitlab_ci
-
-        pipeline = parse_gitlab_ci(PIPELINE_WITH_INCLUDES)
+        pipeline = parsed_includes
 
         assert len(pipeline.includes) == 2
         assert any(inc.local == "/templates/build.yml" for inc in pipeline.includes)
@@ -147,36 +215,24 @@ class TestParseRealPipelines:
 class TestRoundTripConversion:
     """Test round-trip: YAML -> Python -> YAML."""
 
-    def test_simple_round_trip(self):
+    def test_simple_round_trip(self, generated_simple_code, compiled_simple):
         """Simple pipeline survives round-trip."""
-        from wetwire_gitlab.importer import generate_python_code, parse_gitlab_ci
-
-        # Parse YAML
-        pipeline = parse_gitlab_ci(SIMPLE_PIPELINE)
-
-        # Generate Python code
-        code = generate_python_code(pipeline)
+        code = generated_simple_code
 
         # Code should be valid Python
-        compile(code, "<test>", "exec")
+        assert isinstance(compiled_simple, CodeType)
 
         # Code should contain expected elements
         assert "from wetwire_gitlab.pipeline import" in code
         assert 'name="build"' in code
         assert 'name="test"' in code
 
-    def test_complex_round_trip(self):
+    def test_complex_round_trip(self, generated_complex_code, compiled_complex):
         """Complex pipeline survives round-trip."""
-        from wetwire_gitlab.importer import generate_python_code, parse_gitlab_ci
-
-        # Parse YAML
-        pipeline = parse_gitlab_ci(COMPLEX_PIPELINE)
-
-        # Generate Python code
-        code = generate_python_code(pipeline)
+        code = generated_complex_code
 
         # Code should be valid Python
-        compile(code, "<test>", "exec")
+        assert isinstance(compiled_complex, CodeType)
 
         # Code should contain expected elements
         assert "Rule" in code
@@ -187,41 +243,29 @@ class TestRoundTripConversion:
 class TestCodeGenerationQuality:
     """Test quality of generated Python code."""
 
-    def test_generated_code_has_docstring(self):
+    def test_generated_code_has_docstring(self, generated_simple_code):
         """Generated code has a docstring."""
-        from wetwire_gitlab.importer import generate_python_code, parse_gitlab_ci
-
-        pipeline = parse_gitlab_ci(SIMPLE_PIPELINE)
-        code = generate_python_code(pipeline)
+        code = generated_simple_code
 
         assert '"""' in code
 
-    def test_generated_code_has_imports(self):
+    def test_generated_code_has_imports(self, generated_simple_code):
         """Generated code has proper imports."""
-        from wetwire_gitlab.importer import generate_python_code, parse_gitlab_ci
-
-        pipeline = parse_gitlab_ci(SIMPLE_PIPELINE)
-        code = generate_python_code(pipeline)
+        code = generated_simple_code
 
         assert "from wetwire_gitlab.pipeline import" in code
         assert "Job" in code
 
-    def test_generated_code_creates_pipeline(self):
+    def test_generated_code_creates_pipeline(self, generated_simple_code):
         """Generated code creates Pipeline if stages exist."""
-        from wetwire_gitlab.importer import generate_python_code, parse_gitlab_ci
-
-        pipeline = parse_gitlab_ci(SIMPLE_PIPELINE)
-        code = generate_python_code(pipeline)
+        code = generated_simple_code
 
         assert "Pipeline" in code
         assert 'stages=["build", "test"]' in code
 
-    def test_generated_code_preserves_needs(self):
+    def test_generated_code_preserves_needs(self, generated_simple_code):
         """Generated code preserves job dependencies."""
-        from wetwire_gitlab.importer import generate_python_code, parse_gitlab_ci
-
-        pipeline = parse_gitlab_ci(SIMPLE_PIPELINE)
-        code = generate_python_code(pipeline)
+        code = generated_simple_code
 
         # Test job needs build (may use single or double quotes)
         assert "needs=" in code
@@ -234,8 +278,6 @@ class TestEdgeCases:
 
     def test_empty_pipeline(self):
         """Handle empty pipeline."""
-        from wetwire_gitlab.importer import parse_gitlab_ci
-
         pipeline = parse_gitlab_ci("")
 
         assert pipeline.stages == []
@@ -243,8 +285,6 @@ class TestEdgeCases:
 
     def test_pipeline_with_only_stages(self):
         """Handle pipeline with only stages."""
-        from wetwire_gitlab.importer import parse_gitlab_ci
-
         yaml_content = "stages:\n  - build\n  - test"
         pipeline = parse_gitlab_ci(yaml_content)
 
@@ -253,8 +293,6 @@ class TestEdgeCases:
 
     def test_job_with_all_fields(self):
         """Parse job with many fields."""
-        from wetwire_gitlab.importer import parse_gitlab_ci
-
         yaml_content = """
 job:
   stage: test
@@ -284,47 +322,17 @@ job:
 class TestSuccessRateTracking:
     """Test success rate tracking for round-trip tests."""
 
-    @pytest.fixture
-    def sample_pipelines(self):
-        """Return sample pipelines for testing."""
-        return [
-            SIMPLE_PIPELINE,
-            COMPLEX_PIPELINE,
-            PIPELINE_WITH_INCLUDES,
-        ]
-
-    def test_all_samples_parse(self, sample_pipelines):
-        """All sample pipelines should parse successfully."""
-        from wetwire_gitlab.importer import parse_gitlab_ci
-
-        success_count = 0
-        for yaml_content in sample_pipelines:
-            try:
-                pipeline = parse_gitlab_ci(yaml_content)
-                if pipeline is not None:
-                    success_count += 1
-            except Exception:
-                pass
-
-        # All should succeed
-        assert success_count == len(sample_pipelines)
-
-    def test_all_samples_generate_code(self, sample_pipelines):
-        """All sample pipelines should generate valid Python."""
-        from wetwire_gitlab.importer import generate_python_code, parse_gitlab_ci
-
-        success_count = 0
-        for yaml_content in sample_pipelines:
-            try:
-                pipeline = parse_gitlab_ci(yaml_content)
-                code = generate_python_code(pipeline)
-                compile(code, "<test>", "exec")
-                success_count += 1
-            except Exception:
-                pass
-
-        # All should succeed
-        assert success_count == len(sample_pipelines)
+    @pytest.mark.parametrize("sample_pipeline", SAMPLE_PIPELINES, indirect=True)
+    def test_sample_parses(self, sample_pipeline):
+        """Each sample pipeline parses successfully."""
+        assert sample_pipeline is not None
+
+    @pytest.mark.parametrize("sample_pipeline", SAMPLE_PIPELINES, indirect=True)
+    def test_sample_generates_code(self, sample_pipeline):
+        """Each sample pipeline generates valid Python."""
+        code = generate_python_code(sample_pipeline)
+
+        assert isinstance(compile(code, "<test>", "exec"), CodeType)
 
 
 @pytest.mark.slow
@@ -333,8 +341,6 @@ class TestRealWorldPatterns:
 
     def test_matrix_jobs(self):
         """Parse matrix/parallel job configuration."""
-        from wetwire_gitlab.importer import parse_gitlab_ci
-
         yaml_content = """
 test:
   script: pytest
@@ -349,8 +355,6 @@ test:
 
     def test_dag_dependencies(self):
         """Parse DAG-style dependencies."""
-        from wetwire_gitlab.importer import parse_gitlab_ci
-
         yaml_content = """
 stages:
   - build
@@ -380,8 +384,6 @@ test:
 
     def test_trigger_child_pipeline(self):
         """Parse child pipeline trigger."""
-        from wetwire_gitlab.importer import parse_gitlab_ci
-
         yaml_content = """
 trigger-child:
   trigger:
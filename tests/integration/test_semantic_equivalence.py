@@ -4,12 +4,307 @@ This module tests that YAML imports and exports maintain semantic equivalence,
 which is critical for the wetwire round-trip requirement.
 """
 
+import copy
+import pickle
+
 import pytest
 
 from wetwire_gitlab.importer import generate_python_code, parse_gitlab_ci
 from wetwire_gitlab.pipeline import Job, Pipeline
-from wetwire_gitlab.serialize import build_pipeline_yaml
-from wetwire_gitlab.testing import compare_yaml_semantic
+from wetwire_gitlab.serialize import build_pipeline_dict, build_pipeline_yaml
+from wetwire_gitlab.testing import (
+    compare_yaml_semantic,
+    compare_yaml_to_tree,
+    yaml_semantically_equal,
+)
+
+SIMPLE_PIPELINE_YAML = """
+stages:
+  - build
+  - test
+
+build:
+  stage: build
+  script:
+    - make build
+
+test:
+  stage: test
+  script:
+    - make test
+"""
+
+PIPELINE_WITH_VARIABLES_YAML = """
+variables:
+  BUILD_DIR: dist
+  NODE_ENV: production
+
+stages:
+  - build
+
+build:
+  stage: build
+  script:
+    - echo $BUILD_DIR
+"""
+
+PIPELINE_WITH_ARTIFACTS_YAML = """
+stages:
+  - build
+
+build:
+  stage: build
+  script:
+    - make build
+  artifacts:
+    paths:
+      - dist/
+    expire_in: 1 week
+"""
+
+PIPELINE_WITH_RULES_YAML = """
+stages:
+  - deploy
+
+deploy:
+  stage: deploy
+  script:
+    - deploy.sh
+  rules:
+    - if: $CI_COMMIT_BRANCH == $CI_DEFAULT_BRANCH
+      when: manual
+"""
+
+PIPELINE_WITH_NEEDS_YAML = """
+stages:
+  - build
+  - test
+
+build:
+  stage: build
+  script:
+    - make build
+
+test:
+  stage: test
+  script:
+    - make test
+  needs:
+    - build
+"""
+
+PIPELINE_WITH_CACHE_YAML = """
+stages:
+  - test
+
+test:
+  stage: test
+  script:
+    - pytest
+  cache:
+    paths:
+      - .cache/
+    key: test-cache
+"""
+
+PIPELINE_WITH_INCLUDES_YAML = """
+include:
+  - local: /.gitlab/ci/build.yml
+  - template: Security/SAST.gitlab-ci.yml
+
+stages:
+  - build
+"""
+
+PIPELINE_WITH_DEFAULT_YAML = """
+default:
+  image: python:3.11
+
+stages:
+  - test
+
+test:
+  script:
+    - pytest
+"""
+
+PYTHON_TEMPLATE_YAML = """
+stages:
+  - test
+  - deploy
+
+default:
+  image: python:3.11
+
+variables:
+  PIP_CACHE_DIR: "$CI_PROJECT_DIR/.pip-cache"
+
+cache:
+  paths:
+    - .pip-cache/
+
+test:
+  stage: test
+  script:
+    - pip install -r requirements.txt
+    - pytest --cov=src tests/
+  coverage: '/TOTAL.*\\s+(\\d+%)/'
+  artifacts:
+    reports:
+      coverage_report:
+        coverage_format: cobertura
+        path: coverage.xml
+
+lint:
+  stage: test
+  script:
+    - pip install ruff
+    - ruff check .
+  allow_failure: true
+
+deploy:
+  stage: deploy
+  script:
+    - pip install twine
+    - python -m build
+    - twine upload dist/*
+  rules:
+    - if: $CI_COMMIT_TAG
+"""
+
+DOCKER_TEMPLATE_YAML = """
+stages:
+  - build
+  - test
+  - release
+
+default:
+  image: docker:24.0
+
+services:
+  - docker:24.0-dind
+
+variables:
+  DOCKER_TLS_CERTDIR: "/certs"
+  DOCKER_HOST: tcp://docker:2376
+  DOCKER_DRIVER: overlay2
+
+build:
+  stage: build
+  script:
+    - docker login -u $CI_REGISTRY_USER -p $CI_REGISTRY_PASSWORD $CI_REGISTRY
+    - docker build -t $CI_REGISTRY_IMAGE:$CI_COMMIT_SHA .
+    - docker push $CI_REGISTRY_IMAGE:$CI_COMMIT_SHA
+
+test:
+  stage: test
+  script:
+    - docker run --rm $CI_REGISTRY_IMAGE:$CI_COMMIT_SHA test
+  needs:
+    - build
+
+release:
+  stage: release
+  script:
+    - docker login -u $CI_REGISTRY_USER -p $CI_REGISTRY_PASSWORD $CI_REGISTRY
+    - docker pull $CI_REGISTRY_IMAGE:$CI_COMMIT_SHA
+    - docker tag $CI_REGISTRY_IMAGE:$CI_COMMIT_SHA $CI_REGISTRY_IMAGE:latest
+    - docker push $CI_REGISTRY_IMAGE:latest
+  needs:
+    - test
+  rules:
+    - if: $CI_COMMIT_BRANCH == $CI_DEFAULT_BRANCH
+"""
+
+NODEJS_TEMPLATE_YAML = """
+stages:
+  - build
+  - test
+  - deploy
+
+default:
+  image: node:20
+
+variables:
+  npm_config_cache: "$CI_PROJECT_DIR/.npm"
+
+cache:
+  paths:
+    - .npm/
+    - node_modules/
+
+build:
+  stage: build
+  script:
+    - npm ci
+    - npm run build
+  artifacts:
+    paths:
+      - dist/
+    expire_in: 1 week
+
+test:
+  stage: test
+  script:
+    - npm ci
+    - npm run test
+  needs:
+    - build
+
+lint:
+  stage: test
+  script:
+    - npm ci
+    - npm run lint
+  needs:
+    - build
+
+deploy:
+  stage: deploy
+  script:
+    - npm ci
+    - npm run deploy
+  needs:
+    - test
+  rules:
+    - if: $CI_COMMIT_BRANCH == $CI_DEFAULT_BRANCH
+      when: manual
+  environment:
+    name: production
+"""
+
+ROUND_TRIP_CASES = [
+    pytest.param(SIMPLE_PIPELINE_YAML, id="simple_pipeline"),
+    pytest.param(PIPELINE_WITH_VARIABLES_YAML, id="pipeline_with_variables"),
+    pytest.param(PIPELINE_WITH_ARTIFACTS_YAML, id="pipeline_with_artifacts"),
+    pytest.param(PIPELINE_WITH_RULES_YAML, id="pipeline_with_rules"),
+    pytest.param(PIPELINE_WITH_NEEDS_YAML, id="pipeline_with_needs"),
+    pytest.param(PIPELINE_WITH_CACHE_YAML, id="pipeline_with_cache"),
+    pytest.param(PIPELINE_WITH_INCLUDES_YAML, id="pipeline_with_includes"),
+    pytest.param(PIPELINE_WITH_DEFAULT_YAML, id="pipeline_with_default"),
+]
+
+TEMPLATE_CASES = [
+    pytest.param(PYTHON_TEMPLATE_YAML, id="python_template"),
+    pytest.param(DOCKER_TEMPLATE_YAML, id="docker_template"),
+    pytest.param(NODEJS_TEMPLATE_YAML, id="nodejs_template"),
+]
+
+
+@pytest.fixture(scope="session")
+def parsed_corpus() -> dict[str, tuple[Pipeline, list[Job]]]:
+    """Typed Pipeline and Jobs for every round-trip case, keyed by its YAML.
+
+    Each case is parsed and converted once per session; the round-trip tests
+    only rebuild and compare.
+    """
+    corpus = {}
+    for case in ROUND_TRIP_CASES + TEMPLATE_CASES:
+        (original_yaml,) = case.values
+        ir_pipeline = parse_gitlab_ci(original_yaml)
+        jobs = ir_pipeline.to_jobs()
+        corpus[original_yaml] = (ir_pipeline.to_pipeline(), jobs)
+    return corpus
 
 
 @pytest.mark.slow
@@ -100,7 +395,7 @@ build:
 
         assert is_eq is False
         assert len(diffs) > 0
-        assert any("Missing key" in diff for diff in diffs)
+        assert any(diff.kind == "missing" for diff in diffs)
 
     def test_extra_key_detected(self):
         """Extra keys are detected as differences."""
@@ -119,7 +414,7 @@ build:
 
         assert is_eq is False
         assert len(diffs) > 0
-        assert any("Extra key" in diff for diff in diffs)
+        assert any(diff.kind == "extra" for diff in diffs)
 
     def test_value_difference_detected(self):
         """Different values are detected."""
@@ -137,7 +432,7 @@ build:
 
         assert is_eq is False
         assert len(diffs) > 0
-        assert any("Value mismatch" in diff for diff in diffs)
+        assert any(diff.kind == "value" for diff in diffs)
 
     def test_list_length_difference_detected(self):
         """Different list lengths are detected."""
@@ -154,7 +449,7 @@ stages:
 
         assert is_eq is False
         assert len(diffs) > 0
-        assert any("List length mismatch" in diff for diff in diffs)
+        assert any(diff.kind == "list_length" for diff in diffs)
 
     def test_type_difference_detected(self):
         """Different types are detected."""
@@ -173,6 +468,13 @@ build:
         assert len(diffs) > 0
         assert any("Type mismatch" in diff for diff in diffs)
 
+    def test_bool_and_int_values_differ(self):
+        """Values that compare equal in Python but differ in type are detected."""
+        is_eq, diffs = compare_yaml_semantic("retry: 1", "retry: true")
+
+        assert is_eq is False
+        assert any("Type mismatch" in diff for diff in diffs)
+
     def test_empty_yaml_comparison(self):
         """Empty YAML strings are equivalent."""
         is_eq, diffs = compare_yaml_semantic("", "")
@@ -189,7 +491,7 @@ build:
 
         assert is_eq is False
         assert len(diffs) > 0
-        assert any("Failed to parse original YAML" in diff for diff in diffs)
+        assert any(diff.kind == "parse_original" for diff in diffs)
 
     def test_invalid_yaml_rebuilt(self):
         """Invalid rebuilt YAML is detected."""
@@ -200,7 +502,7 @@ build:
 
         assert is_eq is False
         assert len(diffs) > 0
-        assert any("Failed to parse rebuilt YAML" in diff for diff in diffs)
+        assert any(diff.kind == "parse_rebuilt" for diff in diffs)
 
     def test_nested_structure_comparison(self):
         """Nested structures are compared correctly."""
@@ -244,455 +546,137 @@ build:
         # Should report path to the difference
         assert any("artifacts.paths[0]" in diff for diff in diffs)
 
+    def test_differences_carry_kind_and_path(self):
+        """Differences expose their kind and path alongside the message."""
+        is_eq, diffs = compare_yaml_semantic(
+            "build:\n  stage: build\n  tags: [docker]",
+            "build:\n  stage: test\n  when: manual",
+        )
 
-@pytest.mark.slow
-class TestRoundTripSemanticEquivalence:
-    """Tests for complete round-trip semantic equivalence.
-
-    These tests verify: YAML -> parse -> generate Python -> execute -> serialize -> YAML
-    and that the output YAML is semantically equivalent to the input.
-    """
-
-    def test_simple_pipeline_round_trip(self):
-        """Simple pipeline maintains semantic equivalence through round-trip."""
-        original_yaml = """
-stages:
-  - build
-  - test
-
-build:
-  stage: build
-  script:
-    - make build
-
-test:
-  stage: test
-  script:
-    - make test
-"""
-        # Parse the YAML
-        ir_pipeline = parse_gitlab_ci(original_yaml)
-
-        # Generate Python code (verify it compiles)
-        _python_code = generate_python_code(ir_pipeline)
-        compile(_python_code, "<test>", "exec")
-
-        # Note: The generated code creates variables but doesn't export them in a way
-        # we can easily execute. For now, we'll rebuild from the parsed IR directly.
-
-        # Convert IR to typed objects
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
-
-        # Rebuild YAML from typed objects
-        rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
-
-        # Compare for semantic equivalence
-        is_eq, diffs = compare_yaml_semantic(original_yaml, rebuilt_yaml)
-
-        # If not equivalent, print diffs for debugging
-        if not is_eq:
-            print("\nDifferences found:")
-            for diff in diffs:
-                print(f"  - {diff}")
-            print(f"\nOriginal YAML:\n{original_yaml}")
-            print(f"\nRebuilt YAML:\n{rebuilt_yaml}")
-
-        assert is_eq is True, f"Round-trip failed with differences: {diffs}"
-
-    def test_pipeline_with_variables_round_trip(self):
-        """Pipeline with variables maintains equivalence."""
-        original_yaml = """
-variables:
-  BUILD_DIR: dist
-  NODE_ENV: production
-
-stages:
-  - build
-
-build:
-  stage: build
-  script:
-    - echo $BUILD_DIR
-"""
-        ir_pipeline = parse_gitlab_ci(original_yaml)
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
-        rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
-
-        is_eq, diffs = compare_yaml_semantic(original_yaml, rebuilt_yaml)
-
-        if not is_eq:
-            print(f"\nDifferences: {diffs}")
-            print(f"\nOriginal:\n{original_yaml}")
-            print(f"\nRebuilt:\n{rebuilt_yaml}")
-
-        assert is_eq is True, f"Round-trip failed: {diffs}"
-
-    def test_pipeline_with_artifacts_round_trip(self):
-        """Pipeline with artifacts maintains equivalence."""
-        original_yaml = """
-stages:
-  - build
-
-build:
-  stage: build
-  script:
-    - make build
-  artifacts:
-    paths:
-      - dist/
-    expire_in: 1 week
-"""
-        ir_pipeline = parse_gitlab_ci(original_yaml)
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
-        rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
+        assert is_eq is False
+        assert [(diff.kind, diff.path) for diff in diffs] == [
+            ("missing", "build.tags"),
+            ("extra", "build.when"),
+            ("value", "build.stage"),
+        ]
+        assert diffs[2] == "Value mismatch at build.stage: 'build' vs 'test'"
 
-        is_eq, diffs = compare_yaml_semantic(original_yaml, rebuilt_yaml)
+    def test_differences_copy_and_pickle(self):
+        """Differences keep their kind and path when copied or pickled."""
+        _, diffs = compare_yaml_semantic("retry: 1", "retry: 2")
 
-        if not is_eq:
-            print(f"\nDifferences: {diffs}")
-            print(f"\nOriginal:\n{original_yaml}")
-            print(f"\nRebuilt:\n{rebuilt_yaml}")
+        for clone in (copy.copy(diffs[0]), pickle.loads(pickle.dumps(diffs[0]))):
+            assert clone == diffs[0]
+            assert (clone.kind, clone.path) == ("value", "retry")
 
-        assert is_eq is True, f"Round-trip failed: {diffs}"
+    def test_early_exit_stops_at_first_difference(self):
+        """early_exit reports only the first difference found."""
+        original = "build:\n  stage: build\n  tags: [docker]"
+        rebuilt = "build:\n  stage: test\n  when: manual"
 
-    def test_pipeline_with_rules_round_trip(self):
-        """Pipeline with rules maintains equivalence."""
-        original_yaml = """
-stages:
-  - deploy
+        is_eq, diffs = compare_yaml_semantic(original, rebuilt, early_exit=True)
 
-deploy:
-  stage: deploy
-  script:
-    - deploy.sh
-  rules:
-    - if: $CI_COMMIT_BRANCH == $CI_DEFAULT_BRANCH
-      when: manual
-"""
-        ir_pipeline = parse_gitlab_ci(original_yaml)
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
-        rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
+        assert is_eq is False
+        assert [(diff.kind, diff.path) for diff in diffs] == [("missing", "build.tags")]
 
-        is_eq, diffs = compare_yaml_semantic(original_yaml, rebuilt_yaml)
+    def test_non_json_keys_and_values_compare_equal(self):
+        """Dates and non-string keys do not break the equal-tree fast path."""
+        content = "1: one\n2024-01-01: new year\nreleased: 2024-06-30"
 
-        if not is_eq:
-            print(f"\nDifferences: {diffs}")
-            print(f"\nOriginal:\n{original_yaml}")
-            print(f"\nRebuilt:\n{rebuilt_yaml}")
+        is_eq, diffs = compare_yaml_semantic(content, content)
 
-        assert is_eq is True, f"Round-trip failed: {diffs}"
+        assert is_eq is True
+        assert diffs == []
 
-    def test_pipeline_with_needs_round_trip(self):
-        """Pipeline with needs maintains equivalence."""
-        original_yaml = """
-stages:
-  - build
-  - test
+    def test_compare_yaml_to_tree(self):
+        """YAML can be compared directly with a built data tree."""
+        original = "stages: [build]\nbuild:\n  script: [make]"
 
-build:
-  stage: build
-  script:
-    - make build
-
-test:
-  stage: test
-  script:
-    - make test
-  needs:
-    - build
-"""
-        ir_pipeline = parse_gitlab_ci(original_yaml)
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
-        rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
+        assert compare_yaml_to_tree(
+            original, {"stages": ["build"], "build": {"script": ["make"]}}
+        ) == (True, [])
 
-        is_eq, diffs = compare_yaml_semantic(original_yaml, rebuilt_yaml)
+        is_eq, diffs = compare_yaml_to_tree(original, {"stages": ["build"]})
 
-        if not is_eq:
-            print(f"\nDifferences: {diffs}")
-            print(f"\nOriginal:\n{original_yaml}")
-            print(f"\nRebuilt:\n{rebuilt_yaml}")
+        assert is_eq is False
+        assert [(diff.kind, diff.path) for diff in diffs] == [("missing", "root.build")]
 
-        assert is_eq is True, f"Round-trip failed: {diffs}"
+    def test_yaml_semantically_equal(self):
+        """yaml_semantically_equal returns only the verdict."""
+        assert yaml_semantically_equal("stages:\n  - build", "stages: [build]")
+        assert not yaml_semantically_equal("retry: 1", "retry: true")
+        assert not yaml_semantically_equal("key: [", "key: value")
 
-    def test_pipeline_with_cache_round_trip(self):
-        """Pipeline with cache maintains equivalence."""
-        original_yaml = """
-stages:
-  - test
+    def test_identical_invalid_yaml_is_not_equivalent(self):
+        """Identical text still has to parse to be equivalent."""
+        is_eq, diffs = compare_yaml_semantic("key: [", "key: [")
 
-test:
-  stage: test
-  script:
-    - pytest
-  cache:
-    paths:
-      - .cache/
-    key: test-cache
-"""
-        ir_pipeline = parse_gitlab_ci(original_yaml)
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
-        rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
+        assert is_eq is False
+        assert [diff.kind for diff in diffs] == ["parse_original"]
 
-        is_eq, diffs = compare_yaml_semantic(original_yaml, rebuilt_yaml)
 
-        if not is_eq:
-            print(f"\nDifferences: {diffs}")
-            print(f"\nOriginal:\n{original_yaml}")
-            print(f"\nRebuilt:\n{rebuilt_yaml}")
+@pytest.mark.slow
+class TestRoundTripSemanticEquivalence:
+    """Tests for complete round-trip semantic equivalence.
 
-        assert is_eq is True, f"Round-trip failed: {diffs}"
+    These tests verify YAML -> parse -> typed Pipeline and Jobs -> serialize,
+    and that the result is semantically equivalent to the input. Generated
+    Python code is only compiled. test_round_trip compares the dict that
+    build_pipeline_dict returns; test_round_trip_through_yaml also emits YAML
+    with build_pipeline_yaml and parses it back.
+    """
 
-    def test_pipeline_with_includes_round_trip(self):
-        """Pipeline with includes maintains equivalence."""
-        original_yaml = """
-include:
-  - local: /.gitlab/ci/build.yml
-  - template: Security/SAST.gitlab-ci.yml
+    def test_generated_code_compiles(self):
+        """Python code generated from the simple pipeline compiles."""
+        ir_pipeline = parse_gitlab_ci(SIMPLE_PIPELINE_YAML)
 
-stages:
-  - build
-"""
-        ir_pipeline = parse_gitlab_ci(original_yaml)
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
-        rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
+        # Note: The generated code creates variables but doesn't export them in a way
+        # we can easily execute, so the round-trip rebuilds from the parsed IR.
+        compile(generate_python_code(ir_pipeline), "<test>", "exec")
 
-        is_eq, diffs = compare_yaml_semantic(original_yaml, rebuilt_yaml)
+    @pytest.mark.parametrize("original_yaml", ROUND_TRIP_CASES)
+    def test_round_trip(self, original_yaml, parsed_corpus):
+        """Pipeline maintains semantic equivalence through round-trip."""
+        rebuilt = build_pipeline_dict(*parsed_corpus[original_yaml])
 
-        if not is_eq:
-            print(f"\nDifferences: {diffs}")
-            print(f"\nOriginal:\n{original_yaml}")
-            print(f"\nRebuilt:\n{rebuilt_yaml}")
+        is_eq, diffs = compare_yaml_to_tree(original_yaml, rebuilt)
 
-        assert is_eq is True, f"Round-trip failed: {diffs}"
+        assert is_eq is True, (
+            f"Round-trip failed: {diffs}\n"
+            f"Original:\n{original_yaml}\n"
+            f"Rebuilt:\n{rebuilt}"
+        )
 
-    def test_pipeline_with_default_round_trip(self):
-        """Pipeline with default settings maintains equivalence."""
-        original_yaml = """
-default:
-  image: python:3.11
-
-stages:
-  - test
-
-test:
-  script:
-    - pytest
-"""
-        ir_pipeline = parse_gitlab_ci(original_yaml)
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
-        rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
+    @pytest.mark.parametrize("original_yaml", ROUND_TRIP_CASES)
+    def test_round_trip_through_yaml(self, original_yaml, parsed_corpus):
+        """Pipeline stays equivalent when emitted as YAML and parsed back."""
+        rebuilt_yaml = build_pipeline_yaml(*parsed_corpus[original_yaml])
 
         is_eq, diffs = compare_yaml_semantic(original_yaml, rebuilt_yaml)
 
-        if not is_eq:
-            print(f"\nDifferences: {diffs}")
-            print(f"\nOriginal:\n{original_yaml}")
-            print(f"\nRebuilt:\n{rebuilt_yaml}")
-
-        assert is_eq is True, f"Round-trip failed: {diffs}"
+        assert is_eq is True, (
+            f"Round-trip failed: {diffs}\n"
+            f"Original:\n{original_yaml}\n"
+            f"Rebuilt:\n{rebuilt_yaml}"
+        )
 
 
 @pytest.mark.slow
 class TestComplexTemplateRoundTrip:
     """Tests for complex GitLab templates from test_gitlab_templates.py."""
 
-    def test_python_template_round_trip(self):
-        """Python template maintains semantic equivalence."""
-        original_yaml = """
-stages:
-  - test
-  - deploy
-
-default:
-  image: python:3.11
-
-variables:
-  PIP_CACHE_DIR: "$CI_PROJECT_DIR/.pip-cache"
-
-cache:
-  paths:
-    - .pip-cache/
-
-test:
-  stage: test
-  script:
-    - pip install -r requirements.txt
-    - pytest --cov=src tests/
-  coverage: '/TOTAL.*\\s+(\\d+%)/'
-  artifacts:
-    reports:
-      coverage_report:
-        coverage_format: cobertura
-        path: coverage.xml
-
-lint:
-  stage: test
-  script:
-    - pip install ruff
-    - ruff check .
-  allow_failure: true
-
-deploy:
-  stage: deploy
-  script:
-    - pip install twine
-    - python -m build
-    - twine upload dist/*
-  rules:
-    - if: $CI_COMMIT_TAG
-"""
-        ir_pipeline = parse_gitlab_ci(original_yaml)
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
-        rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
-
-        is_eq, diffs = compare_yaml_semantic(original_yaml, rebuilt_yaml)
-
-        if not is_eq:
-            print(f"\nDifferences: {diffs}")
-            print(f"\nOriginal:\n{original_yaml}")
-            print(f"\nRebuilt:\n{rebuilt_yaml}")
-
-        assert is_eq is True, f"Round-trip failed: {diffs}"
-
-    def test_docker_template_round_trip(self):
-        """Docker template maintains semantic equivalence."""
-        original_yaml = """
-stages:
-  - build
-  - test
-  - release
+    @pytest.mark.parametrize("original_yaml", TEMPLATE_CASES)
+    def test_template_round_trip(self, original_yaml, parsed_corpus):
+        """Template maintains semantic equivalence."""
+        rebuilt = build_pipeline_dict(*parsed_corpus[original_yaml])
 
-default:
-  image: docker:24.0
+        is_eq, diffs = compare_yaml_to_tree(original_yaml, rebuilt)
 
-services:
-  - docker:24.0-dind
-
-variables:
-  DOCKER_TLS_CERTDIR: "/certs"
-  DOCKER_HOST: tcp://docker:2376
-  DOCKER_DRIVER: overlay2
-
-build:
-  stage: build
-  script:
-    - docker login -u $CI_REGISTRY_USER -p $CI_REGISTRY_PASSWORD $CI_REGISTRY
-    - docker build -t $CI_REGISTRY_IMAGE:$CI_COMMIT_SHA .
-    - docker push $CI_REGISTRY_IMAGE:$CI_COMMIT_SHA
-
-test:
-  stage: test
-  script:
-    - docker run --rm $CI_REGISTRY_IMAGE:$CI_COMMIT_SHA test
-  needs:
-    - build
-
-release:
-  stage: release
-  script:
-    - docker login -u $CI_REGISTRY_USER -p $CI_REGISTRY_PASSWORD $CI_REGISTRY
-    - docker pull $CI_REGISTRY_IMAGE:$CI_COMMIT_SHA
-    - docker tag $CI_REGISTRY_IMAGE:$CI_COMMIT_SHA $CI_REGISTRY_IMAGE:latest
-    - docker push $CI_REGISTRY_IMAGE:latest
-  needs:
-    - test
-  rules:
-    - if: $CI_COMMIT_BRANCH == $CI_DEFAULT_BRANCH
-"""
-        ir_pipeline = parse_gitlab_ci(original_yaml)
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
-        rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
-
-        is_eq, diffs = compare_yaml_semantic(original_yaml, rebuilt_yaml)
-
-        if not is_eq:
-            print(f"\nDifferences: {diffs}")
-            print(f"\nOriginal:\n{original_yaml}")
-            print(f"\nRebuilt:\n{rebuilt_yaml}")
-
-        assert is_eq is True, f"Round-trip failed: {diffs}"
-
-    def test_nodejs_template_round_trip(self):
-        """Node.js template maintains semantic equivalence."""
-        original_yaml = """
-stages:
-  - build
-  - test
-  - deploy
-
-default:
-  image: node:20
-
-variables:
-  npm_config_cache: "$CI_PROJECT_DIR/.npm"
-
-cache:
-  paths:
-    - .npm/
-    - node_modules/
-
-build:
-  stage: build
-  script:
-    - npm ci
-    - npm run build
-  artifacts:
-    paths:
-      - dist/
-    expire_in: 1 week
-
-test:
-  stage: test
-  script:
-    - npm ci
-    - npm run test
-  needs:
-    - build
-
-lint:
-  stage: test
-  script:
-    - npm ci
-    - npm run lint
-  needs:
-    - build
-
-deploy:
-  stage: deploy
-  script:
-    - npm ci
-    - npm run deploy
-  needs:
-    - test
-  rules:
-    - if: $CI_COMMIT_BRANCH == $CI_DEFAULT_BRANCH
-      when: manual
-  environment:
-    name: production
-"""
-        ir_pipeline = parse_gitlab_ci(original_yaml)
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
-        rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
-
-        is_eq, diffs = compare_yaml_semantic(original_yaml, rebuilt_yaml)
-
-        if not is_eq:
-            print(f"\nDifferences: {diffs}")
-            print(f"\nOriginal:\n{original_yaml}")
-            print(f"\nRebuilt:\n{rebuilt_yaml}")
-
-        assert is_eq is True, f"Round-trip failed: {diffs}"
+        assert is_eq is True, (
+            f"Round-trip failed: {diffs}\n"
+            f"Original:\n{original_yaml}\n"
+            f"Rebuilt:\n{rebuilt}"
+        )
 
 
 @pytest.mark.slow
@@ -720,12 +704,11 @@ build:
         # Compare
         is_eq, diffs = compare_yaml_semantic(expected_yaml, rebuilt_yaml)
 
-        if not is_eq:
-            print(f"\nDifferences: {diffs}")
-            print(f"\nExpected:\n{expected_yaml}")
-            print(f"\nRebuilt:\n{rebuilt_yaml}")
-
-        assert is_eq is True, f"Construction failed: {diffs}"
+        assert is_eq is True, (
+            f"Construction failed: {diffs}\n"
+            f"Expected:\n{expected_yaml}\n"
+            f"Rebuilt:\n{rebuilt_yaml}"
+        )
 
     def test_multiple_jobs_direct_construction(self):
         """Multiple jobs constructed directly serialize correctly."""
@@ -765,9 +748,8 @@ deploy:
 
         is_eq, diffs = compare_yaml_semantic(expected_yaml, rebuilt_yaml)
 
-        if not is_eq:
-            print(f"\nDifferences: {diffs}")
-            print(f"\nExpected:\n{expected_yaml}")
-            print(f"\nRebuilt:\n{rebuilt_yaml}")
-
-        assert is_eq is True, f"Construction failed: {diffs}"
+        assert is_eq is True, (
+            f"Construction failed: {diffs}\n"
+            f"Expected:\n{expected_yaml}\n"
+            f"Rebuilt:\n{rebuilt_yaml}"
+        )
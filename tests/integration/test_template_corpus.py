@@ -7,173 +7,223 @@ This module tests the import functionality by:
 4. Reporting success rates and feature support
 """
 
+import functools
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import pytest
-
-from wetwire_gitlab.importer import generate_python_code, parse_gitlab_ci
+import yaml
+
+from wetwire_gitlab.importer import (
+    IRPipeline,
+    generate_python_code,
+    parse_gitlab_ci,
+    parse_gitlab_ci_dict,
+)
+from wetwire_gitlab.importer.parser import SafeLoader
 from wetwire_gitlab.serialize import build_pipeline_yaml
-from wetwire_gitlab.testing import compare_yaml_semantic
+from wetwire_gitlab.testing import compare_yaml_semantic, yaml_semantically_equal
 
 # Template fixture directory
 TEMPLATES_DIR = Path(__file__).parent.parent / "fixtures" / "templates"
 
 
-def get_all_templates() -> list[Path]:
-    """Get all YAML template files from the fixtures directory."""
+@functools.lru_cache(maxsize=1)
+def get_all_templates() -> tuple[Path, ...]:
+    """Get all YAML template files from the fixtures directory.
+
+    The directory is scanned once; parametrize decorators and the aggregate
+    tests share the cached result.
+    """
     if not TEMPLATES_DIR.exists():
-        return []
-    return sorted(TEMPLATES_DIR.glob("*.yml"))
+        return ()
+    return tuple(sorted(TEMPLATES_DIR.glob("*.yml")))
+
+
+# One parametrize case per template, with the file name as its id
+TEMPLATE_CASES = [pytest.param(path, id=path.name) for path in get_all_templates()]
+
+
+# Keys whose presence marks a feature, at the top level and within a job
+TOP_LEVEL_FEATURES = frozenset(
+    {"stages", "variables", "include", "default", "cache", "services"}
+)
+JOB_FEATURES = frozenset(
+    {
+        "stage",
+        "image",
+        "artifacts",
+        "cache",
+        "rules",
+        "needs",
+        "dependencies",
+        "environment",
+        "parallel",
+        "tags",
+        "retry",
+        "timeout",
+        "allow_failure",
+        "before_script",
+        "after_script",
+        "coverage",
+        "trigger",
+        "interruptible",
+    }
+)
+
+
+def analyze_template(data: Any) -> tuple[set[str], int]:
+    """Extract GitLab CI features and count jobs in a loaded YAML template.
+
+    Jobs are mappings with a ``script`` or ``trigger`` key; job-level
+    features are only collected from jobs with a ``script``.
+
+    Returns a tuple of (set of feature names, number of jobs).
+    """
+    features: set[str] = set()
+    job_count = 0
+
+    # Empty and non-mapping documents have no features or jobs
+    if type(data) is not dict or not data:
+        return features, job_count
+
+    # Top-level features
+    features.update(TOP_LEVEL_FEATURES & data.keys())
+
+    # Job-level features
+    for value in data.values():
+        if type(value) is not dict or not value:
+            continue
+        if "script" in value:
+            # This is a job
+            job_count += 1
+            features.update(f"job.{key}" for key in JOB_FEATURES & value.keys())
+        elif "trigger" in value:
+            # Trigger jobs have no script
+            job_count += 1
+
+    return features, job_count
+
+
+@dataclass(frozen=True)
+class TemplateRecord:
+    """A corpus template, read, analyzed and parsed once.
+
+    Attributes:
+        path: Template file.
+        yaml_text: The template's YAML text.
+        features: GitLab CI features used by the template.
+        job_count: Number of jobs defined in the template.
+        ir_pipeline: Parsed IR, or the exception raised while loading or
+            parsing.
+    """
+
+    path: Path
+    yaml_text: str
+    features: frozenset[str]
+    job_count: int
+    ir_pipeline: IRPipeline | Exception
 
 
-def extract_features(yaml_content: str) -> set[str]:
-    """Extract GitLab CI features present in a YAML template.
+@pytest.fixture(scope="session")
+def corpus() -> dict[Path, TemplateRecord]:
+    """Every template's record, keyed by its path.
 
-    Returns a set of feature names found in the YAML.
+    Built once per session (per xdist worker) and shared by every test. The
+    records are frozen and their feature sets immutable; tests must not
+    mutate the parsed IR.
     """
-    features = set()
-
-    # Parse as dict to check for top-level keys
-    import yaml
-
-    try:
-        data = yaml.safe_load(yaml_content)
-        if not data:
-            return features
-
-        # Top-level features
-        if "stages" in data:
-            features.add("stages")
-        if "variables" in data:
-            features.add("variables")
-        if "include" in data:
-            features.add("include")
-        if "default" in data:
-            features.add("default")
-        if "cache" in data:
-            features.add("cache")
-        if "services" in data:
-            features.add("services")
-
-        # Job-level features
-        for key, value in data.items():
-            if isinstance(value, dict) and "script" in value:
-                # This is a job
-                if "stage" in value:
-                    features.add("job.stage")
-                if "image" in value:
-                    features.add("job.image")
-                if "artifacts" in value:
-                    features.add("job.artifacts")
-                if "cache" in value:
-                    features.add("job.cache")
-                if "rules" in value:
-                    features.add("job.rules")
-                if "needs" in value:
-                    features.add("job.needs")
-                if "dependencies" in value:
-                    features.add("job.dependencies")
-                if "environment" in value:
-                    features.add("job.environment")
-                if "parallel" in value:
-                    features.add("job.parallel")
-                if "tags" in value:
-                    features.add("job.tags")
-                if "retry" in value:
-                    features.add("job.retry")
-                if "timeout" in value:
-                    features.add("job.timeout")
-                if "allow_failure" in value:
-                    features.add("job.allow_failure")
-                if "before_script" in value:
-                    features.add("job.before_script")
-                if "after_script" in value:
-                    features.add("job.after_script")
-                if "coverage" in value:
-                    features.add("job.coverage")
-                if "trigger" in value:
-                    features.add("job.trigger")
-                if "interruptible" in value:
-                    features.add("job.interruptible")
-
-    except Exception:
-        pass
-
-    return features
+    records = {}
+    for template_path in get_all_templates():
+        raw = template_path.read_bytes()
+        # A template that fails to load or parse is recorded with its error,
+        # so the aggregate tests can report it; features found before the
+        # failure are kept
+        features: frozenset[str] = frozenset()
+        job_count = 0
+        try:
+            data = yaml.load(raw, Loader=SafeLoader)
+            found, job_count = analyze_template(data)
+            features = frozenset(found)
+            ir_pipeline: IRPipeline | Exception = parse_gitlab_ci_dict(data)
+        except Exception as e:
+            ir_pipeline = e
+        records[template_path] = TemplateRecord(
+            path=template_path,
+            yaml_text=raw.decode("utf-8"),
+            features=features,
+            job_count=job_count,
+            ir_pipeline=ir_pipeline,
+        )
+    return records
+
+
+def _parsed(record: TemplateRecord) -> IRPipeline:
+    """Return a record's parsed IR, raising its parse error if it failed."""
+    if isinstance(record.ir_pipeline, Exception):
+        raise record.ir_pipeline
+    return record.ir_pipeline
 
 
 @pytest.mark.slow
 class TestTemplateImport:
     """Test basic import functionality for all templates."""
 
-    @pytest.mark.parametrize("template_path", get_all_templates(), ids=lambda p: p.name)
-    def test_template_parses_successfully(self, template_path: Path):
+    @pytest.mark.parametrize("template_path", TEMPLATE_CASES)
+    def test_template_parses_successfully(self, template_path: Path, corpus):
         """Each template should parse without errors."""
-        yaml_content = template_path.read_text()
-
         # Should not raise
-        pipeline = parse_gitlab_ci(yaml_content)
+        pipeline = _parsed(corpus[template_path])
 
         # Basic validation
         assert pipeline is not None
         assert isinstance(pipeline.stages, list)
         assert isinstance(pipeline.jobs, list)
 
-    @pytest.mark.parametrize("template_path", get_all_templates(), ids=lambda p: p.name)
-    def test_template_generates_valid_python(self, template_path: Path):
+    @pytest.mark.parametrize("template_path", TEMPLATE_CASES)
+    def test_template_generates_valid_python(self, template_path: Path, corpus):
         """Each template should generate valid Python code."""
-        yaml_content = template_path.read_text()
-        pipeline = parse_gitlab_ci(yaml_content)
+        python_code = generate_python_code(_parsed(corpus[template_path]))
 
-        # Generate Python code
-        python_code = generate_python_code(pipeline)
-
-        # Should be valid Python
+        # Generated code should be valid Python
         compile(python_code, f"<{template_path.name}>", "exec")
 
         # Should contain expected imports
         assert "from wetwire_gitlab.pipeline import" in python_code
 
-    @pytest.mark.parametrize("template_path", get_all_templates(), ids=lambda p: p.name)
-    def test_template_has_expected_structure(self, template_path: Path):
+    @pytest.mark.parametrize("template_path", TEMPLATE_CASES)
+    def test_template_has_expected_structure(self, template_path: Path, corpus):
         """Each template should have expected structure after parsing."""
-        yaml_content = template_path.read_text()
-        pipeline = parse_gitlab_ci(yaml_content)
+        record = corpus[template_path]
+        pipeline = _parsed(record)
 
         # If YAML has stages, pipeline should have them
-        import yaml
-
-        data = yaml.safe_load(yaml_content)
-        if data and "stages" in data:
+        if "stages" in record.features:
             assert len(pipeline.stages) > 0
 
         # If YAML has jobs, pipeline should have them
         # Note: Jobs can have either 'script' or 'trigger' (but not necessarily both)
-        if data:
-            job_count = sum(
-                1
-                for k, v in data.items()
-                if isinstance(v, dict) and ("script" in v or "trigger" in v)
-            )
-            if job_count > 0:
-                assert len(pipeline.jobs) == job_count
+        if record.job_count > 0:
+            assert len(pipeline.jobs) == record.job_count
 
 
 @pytest.mark.slow
 class TestTemplateRoundTrip:
     """Test round-trip conversion: YAML -> parse -> build -> YAML."""
 
-    @pytest.mark.parametrize("template_path", get_all_templates(), ids=lambda p: p.name)
-    def test_template_round_trip_semantic_equivalence(self, template_path: Path):
+    @pytest.mark.parametrize("template_path", TEMPLATE_CASES)
+    def test_template_round_trip_semantic_equivalence(
+        self, template_path: Path, corpus
+    ):
         """Each template should maintain semantic equivalence through round-trip."""
-        original_yaml = template_path.read_text()
+        record = corpus[template_path]
+        original_yaml = record.yaml_text
 
-        # Parse the YAML
-        ir_pipeline = parse_gitlab_ci(original_yaml)
-
-        # Convert IR to typed objects
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
+        # Parse the YAML and convert the IR to typed objects
+        ir_pipeline = _parsed(record)
+        pipeline, jobs = ir_pipeline.to_pipeline(), ir_pipeline.to_jobs()
 
         # Rebuild YAML from typed objects
         rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
@@ -181,41 +231,30 @@ class TestTemplateRoundTrip:
         # Compare for semantic equivalence
         is_eq, diffs = compare_yaml_semantic(original_yaml, rebuilt_yaml)
 
-        # If not equivalent, print diffs for debugging
-        if not is_eq:
-            print(f"\n=== Template: {template_path.name} ===")
-            print("Differences found:")
-            for diff in diffs:
-                print(f"  - {diff}")
-            print(f"\nOriginal YAML:\n{original_yaml}")
-            print(f"\nRebuilt YAML:\n{rebuilt_yaml}")
-
-        assert (
-            is_eq is True
-        ), f"Round-trip failed for {template_path.name} with differences: {diffs}"
+        assert is_eq is True, (
+            f"Round-trip failed for {template_path.name} with differences: {diffs}\n"
+            f"Original YAML:\n{original_yaml}\n"
+            f"Rebuilt YAML:\n{rebuilt_yaml}"
+        )
 
 
 @pytest.mark.slow
 class TestFeatureCoverage:
     """Test and track coverage of GitLab CI features."""
 
-    def test_feature_coverage_report(self):
+    def test_feature_coverage_report(self, corpus):
         """Generate a report of GitLab CI features covered by test corpus."""
         all_features = set()
-        feature_counts: dict[str, int] = {}
+        feature_counts: Counter[str] = Counter()
         template_features: dict[str, set[str]] = {}
 
-        templates = get_all_templates()
-
-        for template_path in templates:
-            yaml_content = template_path.read_text()
-            features = extract_features(yaml_content)
+        templates = corpus
 
-            all_features.update(features)
-            template_features[template_path.name] = features
+        for template_path, record in corpus.items():
+            all_features.update(record.features)
+            template_features[template_path.name] = set(record.features)
 
-            for feature in features:
-                feature_counts[feature] = feature_counts.get(feature, 0) + 1
+            feature_counts.update(record.features)
 
         # Generate report
         print("\n" + "=" * 70)
@@ -270,23 +309,20 @@ class TestFeatureCoverage:
 class TestSuccessRate:
     """Test and report success rates for import operations."""
 
-    def test_import_success_rate(self):
+    def test_import_success_rate(self, corpus):
         """Calculate and report import success rate."""
-        templates = get_all_templates()
+        templates = corpus
         success_count = 0
         failures = []
 
-        for template_path in templates:
-            try:
-                yaml_content = template_path.read_text()
-                pipeline = parse_gitlab_ci(yaml_content)
-
-                if pipeline is not None:
-                    success_count += 1
-                else:
-                    failures.append((template_path.name, "Returned None"))
-            except Exception as e:
-                failures.append((template_path.name, str(e)))
+        for template_path, record in corpus.items():
+            pipeline = record.ir_pipeline
+            if isinstance(pipeline, Exception):
+                failures.append((template_path.name, str(pipeline)))
+            elif pipeline is not None:
+                success_count += 1
+            else:
+                failures.append((template_path.name, "Returned None"))
 
         success_rate = (success_count / len(templates)) * 100 if templates else 0
 
@@ -308,19 +344,20 @@ class TestSuccessRate:
         # We should have at least 95% success rate
         assert success_rate >= 95.0, f"Import success rate too low: {success_rate:.1f}%"
 
-    def test_code_generation_success_rate(self):
+    def test_code_generation_success_rate(self, corpus):
         """Calculate and report Python code generation success rate."""
-        templates = get_all_templates()
+        templates = corpus
         success_count = 0
         failures = []
 
-        for template_path in templates:
+        for template_path, record in corpus.items():
+            pipeline = record.ir_pipeline
+            if isinstance(pipeline, Exception):
+                failures.append((template_path.name, str(pipeline)))
+                continue
             try:
-                yaml_content = template_path.read_text()
-                pipeline = parse_gitlab_ci(yaml_content)
+                # Generate and compile
                 python_code = generate_python_code(pipeline)
-
-                # Try to compile
                 compile(python_code, f"<{template_path.name}>", "exec")
                 success_count += 1
             except Exception as e:
@@ -348,26 +385,25 @@ class TestSuccessRate:
             success_rate >= 95.0
         ), f"Code generation success rate too low: {success_rate:.1f}%"
 
-    def test_round_trip_success_rate(self):
+    def test_round_trip_success_rate(self, corpus):
         """Calculate and report round-trip success rate."""
-        templates = get_all_templates()
+        templates = corpus
         success_count = 0
         failures = []
 
-        for template_path in templates:
+        for template_path, record in corpus.items():
+            original_yaml, ir_pipeline = record.yaml_text, record.ir_pipeline
+            if isinstance(ir_pipeline, Exception):
+                failures.append((template_path.name, str(ir_pipeline)))
+                continue
             try:
-                original_yaml = template_path.read_text()
-                ir_pipeline = parse_gitlab_ci(original_yaml)
-                pipeline = ir_pipeline.to_pipeline()
-                jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
+                pipeline, jobs = ir_pipeline.to_pipeline(), ir_pipeline.to_jobs()
                 rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
 
-                is_eq, diffs = compare_yaml_semantic(original_yaml, rebuilt_yaml)
-
-                if is_eq:
+                if yaml_semantically_equal(original_yaml, rebuilt_yaml):
                     success_count += 1
                 else:
-                    failures.append((template_path.name, f"{len(diffs)} differences"))
+                    failures.append((template_path.name, "not equivalent"))
             except Exception as e:
                 failures.append((template_path.name, str(e)))
 
@@ -395,13 +431,8 @@ class TestSuccessRate:
         ), f"Round-trip success rate too low: {success_rate:.1f}%"
 
 
-@pytest.mark.slow
-class TestSpecificPatterns:
-    """Test specific GitLab CI patterns that are common or complex."""
-
-    def test_dag_pattern_with_needs(self):
-        """Test DAG-style dependencies with needs."""
-        yaml_content = """
+# Common or complex GitLab CI patterns, each round-tripped on its own
+DAG_PATTERN_YAML = """
 stages:
   - build
   - test
@@ -418,17 +449,8 @@ test:
   needs:
     - build
 """
-        ir_pipeline = parse_gitlab_ci(yaml_content)
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
-        rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
 
-        is_eq, diffs = compare_yaml_semantic(yaml_content, rebuilt_yaml)
-        assert is_eq is True, f"DAG pattern failed: {diffs}"
-
-    def test_complex_needs_with_artifacts(self):
-        """Test complex needs with artifact control."""
-        yaml_content = """
+NEEDS_WITH_ARTIFACTS_PATTERN_YAML = """
 stages:
   - build
   - test
@@ -446,17 +468,8 @@ test:
     - job: build
       artifacts: true
 """
-        ir_pipeline = parse_gitlab_ci(yaml_content)
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
-        rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
-
-        is_eq, diffs = compare_yaml_semantic(yaml_content, rebuilt_yaml)
-        assert is_eq is True, f"Complex needs pattern failed: {diffs}"
 
-    def test_multiple_rules_pattern(self):
-        """Test job with multiple rules."""
-        yaml_content = """
+MULTIPLE_RULES_PATTERN_YAML = """
 deploy:
   script:
     - deploy.sh
@@ -466,17 +479,8 @@ deploy:
     - if: $CI_COMMIT_TAG
       when: on_success
 """
-        ir_pipeline = parse_gitlab_ci(yaml_content)
-        pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
-        rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
 
-        is_eq, diffs = compare_yaml_semantic(yaml_content, rebuilt_yaml)
-        assert is_eq is True, f"Multiple rules pattern failed: {diffs}"
-
-    def test_matrix_parallel_pattern(self):
-        """Test parallel matrix pattern."""
-        yaml_content = """
+MATRIX_PARALLEL_PATTERN_YAML = """
 test:
   script:
     - pytest
@@ -484,55 +488,69 @@ test:
     matrix:
       - PYTHON_VERSION: ["3.9", "3.10", "3.11"]
 """
+
+PATTERN_CASES = [
+    pytest.param(DAG_PATTERN_YAML, id="dag_with_needs"),
+    pytest.param(NEEDS_WITH_ARTIFACTS_PATTERN_YAML, id="needs_with_artifacts"),
+    pytest.param(MULTIPLE_RULES_PATTERN_YAML, id="multiple_rules"),
+    pytest.param(MATRIX_PARALLEL_PATTERN_YAML, id="matrix_parallel"),
+]
+
+
+@pytest.mark.slow
+class TestSpecificPatterns:
+    """Test specific GitLab CI patterns that are common or complex."""
+
+    @pytest.mark.parametrize("yaml_content", PATTERN_CASES)
+    def test_pattern_round_trip(self, yaml_content: str):
+        """Each pattern maintains semantic equivalence through round-trip."""
         ir_pipeline = parse_gitlab_ci(yaml_content)
         pipeline = ir_pipeline.to_pipeline()
-        jobs = [ir_job.to_job() for ir_job in ir_pipeline.jobs]
+        jobs = ir_pipeline.to_jobs()
         rebuilt_yaml = build_pipeline_yaml(pipeline, jobs)
 
         is_eq, diffs = compare_yaml_semantic(yaml_content, rebuilt_yaml)
-        assert is_eq is True, f"Matrix parallel pattern failed: {diffs}"
+        assert is_eq is True, f"Pattern failed: {diffs}"
+
+
+# File name prefixes ("NN_") of each template category
+BASIC_PREFIXES = frozenset(f"{i:02d}_" for i in range(1, 8))
+ADVANCED_PREFIXES = frozenset(f"{i:02d}_" for i in range(8, 21))
+REAL_WORLD_PREFIXES = frozenset(f"{i:02d}_" for i in range(21, 30))
 
 
 @pytest.mark.slow
 class TestTemplateCategories:
     """Test templates organized by category."""
 
-    def test_basic_templates(self):
+    def test_basic_templates(self, corpus):
         """Test basic template patterns (01-07)."""
         basic_templates = [
-            p
-            for p in get_all_templates()
-            if p.name.startswith(("01_", "02_", "03_", "04_", "05_", "06_", "07_"))
+            p for p in get_all_templates() if p.name[:3] in BASIC_PREFIXES
         ]
 
         assert len(basic_templates) >= 7, "Expected at least 7 basic templates"
 
         for template_path in basic_templates:
-            yaml_content = template_path.read_text()
-            pipeline = parse_gitlab_ci(yaml_content)
+            pipeline = _parsed(corpus[template_path])
             assert pipeline is not None, f"Failed to parse {template_path.name}"
 
-    def test_advanced_templates(self):
+    def test_advanced_templates(self, corpus):
         """Test advanced template patterns (08-20)."""
         advanced_templates = [
-            p
-            for p in get_all_templates()
-            if any(p.name.startswith(f"{i:02d}_") for i in range(8, 21))
+            p for p in get_all_templates() if p.name[:3] in ADVANCED_PREFIXES
         ]
 
         assert len(advanced_templates) >= 10, "Expected at least 10 advanced templates"
 
         for template_path in advanced_templates:
-            yaml_content = template_path.read_text()
-            pipeline = parse_gitlab_ci(yaml_content)
+            pipeline = _parsed(corpus[template_path])
             assert pipeline is not None, f"Failed to parse {template_path.name}"
 
-    def test_real_world_templates(self):
+    def test_real_world_templates(self, corpus):
         """Test real-world project templates (21+)."""
         real_world_templates = [
-            p
-            for p in get_all_templates()
-            if any(p.name.startswith(f"{i:02d}_") for i in range(21, 30))
+            p for p in get_all_templates() if p.name[:3] in REAL_WORLD_PREFIXES
         ]
 
         assert (
@@ -540,6 +558,5 @@ class TestTemplateCategories:
         ), "Expected at least 3 real-world templates"
 
         for template_path in real_world_templates:
-            yaml_content = template_path.read_text()
-            pipeline = parse_gitlab_ci(yaml_content)
+            pipeline = _parsed(corpus[template_path])
             assert pipeline is not None, f"Failed to parse {template_path.name}"
@@ -1,62 +1,142 @@
 """Tests for the pipeline linter module."""
 
-import tempfile
-from pathlib import Path
+import ast
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from wetwire_gitlab.contracts import LintIssue
+from wetwire_gitlab.linter import (
+    fix_code,
+    lint_code,
+    lint_directory,
+    lint_file,
+    lint_source,
+    linter,
+)
+from wetwire_gitlab.linter.linter import _add_imports
+from wetwire_gitlab.linter.rules import RULE_REGISTRY
+from wetwire_gitlab.linter.rules.base import calls_to, nodes_of_type
+from wetwire_gitlab.linter.rules.pattern_rules import WGL009UsePredefinedRules
+from wetwire_gitlab.linter.rules.type_rules import WGL003UsePredefinedVariables
 
 
 class TestLinterFramework:
     """Tests for the linter framework."""
 
-    def test_lint_file(self):
+    def test_lint_file(self, tmp_path):
         """Lint a single Python file."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job
 
 job = Job(name="test", stage="test", script=["echo test"])
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        path = tmp_path / "sample.py"
+        path.write_text(code)
+        result = lint_file(path)
 
         assert result.files_checked == 1
         assert isinstance(result.issues, list)
 
-    def test_lint_directory(self):
+    def test_lint_directory(self, tmp_path):
         """Lint all Python files in a directory."""
-        from wetwire_gitlab.linter import lint_directory
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir)
-
-            (path / "jobs.py").write_text("""
+        (tmp_path / "jobs.py").write_text("""
 from wetwire_gitlab.pipeline import Job
 job = Job(name="test", stage="test", script=["echo test"])
 """)
 
-            (path / "pipelines.py").write_text("""
+        (tmp_path / "pipelines.py").write_text("""
 from wetwire_gitlab.pipeline import Pipeline
 pipeline = Pipeline(stages=["test"])
 """)
 
-            result = lint_directory(path)
+        result = lint_directory(tmp_path)
 
         assert result.files_checked == 2
 
+    def test_lint_source_with_syntax_error(self):
+        """Source that does not parse counts as no file checked."""
+        result = lint_source("def broken(\n", filename="broken.py")
+
+        assert result.success is True
+        assert result.files_checked == 0
+
+    def test_lint_directory_in_worker_processes(self, tmp_path, monkeypatch):
+        """Linting in a process pool gives the same result as serial linting."""
+        for i in range(4):
+            (tmp_path / f"jobs{i}.py").write_text(
+                f"""
+from wetwire_gitlab.pipeline import Job
+job = Job(name="build{i}", stage="build", script=["make"], when="manual")
+"""
+            )
+
+        serial = linter.lint_directory(tmp_path)
+        monkeypatch.setattr(linter, "_PARALLEL_MIN_FILES", 0)
+        monkeypatch.setattr(linter.os, "cpu_count", lambda: 2)
+        parallel = linter.lint_directory(tmp_path)
+
+        assert parallel.files_checked == serial.files_checked == 4
+        assert parallel.issues == serial.issues
+
+    def test_lint_directory_uses_threads_without_gil(self, monkeypatch):
+        """Free-threaded builds lint in threads instead of processes."""
+        monkeypatch.setattr(linter.sys, "_is_gil_enabled", lambda: False, raising=False)
+        assert linter._executor_class() is ThreadPoolExecutor
+
+        monkeypatch.setattr(linter.sys, "_is_gil_enabled", lambda: True, raising=False)
+        assert linter._executor_class() is ProcessPoolExecutor
+
+    def test_lint_file_result_cache(self, tmp_path, monkeypatch):
+        """Unchanged files are answered from the result cache."""
+        path = tmp_path / "jobs.py"
+        path.write_text('job = Job(name="build", stage="build", when="manual")\n')
+        cache_dir = tmp_path / "cache"
+
+        first = lint_file(path, cache_dir=cache_dir)
+        assert len(list(cache_dir.glob("*/*/*.json"))) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("cached file was linted again")
+
+        monkeypatch.setattr(linter, "lint_source", fail)
+        assert lint_file(path, cache_dir=cache_dir) == first
+
+        monkeypatch.undo()
+        path.write_text('job = Job(name="build", stage="build")\n')
+        changed = lint_file(path, cache_dir=cache_dir)
+        assert "WGL010" not in changed.issues_by_code()
+        # The edit replaced the file's entry rather than adding one
+        assert len(list(cache_dir.glob("*/*/*.json"))) == 1
+
+    def test_lint_file_result_cache_ignores_bad_entries(self, tmp_path):
+        """Unreadable cache entries are misses, and old versions are removed."""
+        path = tmp_path / "jobs.py"
+        path.write_text('job = Job(name="build", stage="build", when="manual")\n')
+        cache_dir = tmp_path / "cache"
+        stale = cache_dir / linter._CACHE_SUBDIR / ("0" * 64)
+        stale.mkdir(parents=True)
+        # Directories the linter did not write are left alone, whatever
+        # their name
+        foreign = cache_dir / ("1" * 64)
+        foreign.mkdir()
+        linter._cache_namespace.cache_clear()
+
+        expected = lint_file(path)
+        lint_file(path, cache_dir=cache_dir)
+        assert not stale.exists()
+        assert foreign.exists()
+
+        (entry,) = cache_dir.glob("*/*/*.json")
+        for garbage in ("not json", '{"source": 1}', "[]"):
+            entry.write_text(garbage)
+            assert lint_file(path, cache_dir=cache_dir) == expected
+
     def test_lint_with_rules(self):
         """Lint with specific rules enabled."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job
 job = Job(name="test", stage="test", script=["echo test"])
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name), rules=["WGL007"])
+        result = lint_source(code, rules=["WGL007"])
 
         assert isinstance(result.issues, list)
 
@@ -66,19 +146,14 @@ class TestLintRuleWGL001:
 
     def test_wgl001_detects_raw_include_component(self):
         """Detect raw include component usage instead of typed wrapper."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Include
 
 include = Include(component="gitlab.com/components/sast@main")
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
-        wgl001_issues = [i for i in result.issues if i.code == "WGL001"]
+        wgl001_issues = result.issues_by_code().get("WGL001", [])
         assert len(wgl001_issues) > 0
 
 
@@ -87,8 +162,6 @@ class TestLintRuleWGL002:
 
     def test_wgl002_detects_raw_dict_rules(self):
         """Detect raw dict rules instead of Rule dataclass."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job
 
@@ -99,12 +172,9 @@ job = Job(
     rules=[{"if": "$CI_COMMIT_BRANCH == $CI_DEFAULT_BRANCH"}]
 )
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
-        wgl002_issues = [i for i in result.issues if i.code == "WGL002"]
+        wgl002_issues = result.issues_by_code().get("WGL002", [])
         assert len(wgl002_issues) > 0
 
 
@@ -113,30 +183,30 @@ class TestLintRuleWGL003:
 
     def test_wgl003_detects_raw_ci_variable_strings(self):
         """Detect raw CI variable strings instead of intrinsics."""
-        from wetwire_gitlab.linter import lint_file
-
         # Use a pattern that won't trigger WGL009
         code = """
 from wetwire_gitlab.pipeline import Rule
 
 rule = Rule(if_="$CI_COMMIT_SHA")
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
-        wgl003_issues = [i for i in result.issues if i.code == "WGL003"]
+        wgl003_issues = result.issues_by_code().get("WGL003", [])
         assert len(wgl003_issues) > 0
 
+    def test_wgl003_wgl009_patterns_follow_wgl009(self):
+        """WGL009_PATTERNS lists the patterns WGL003 leaves to WGL009."""
+        assert WGL003UsePredefinedVariables.WGL009_PATTERNS == [
+            pattern.pattern for pattern, _, _ in WGL009UsePredefinedRules.PATTERN_MAP
+        ]
+        assert r"^\$CI_COMMIT_TAG$" in WGL003UsePredefinedVariables.WGL009_PATTERNS
+
 
 class TestLintRuleWGL004:
     """Tests for WGL004: Use Cache dataclass."""
 
     def test_wgl004_detects_raw_dict_cache(self):
         """Detect raw dict cache instead of Cache dataclass."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job
 
@@ -147,12 +217,9 @@ job = Job(
     cache={"paths": [".cache"]}
 )
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
-        wgl004_issues = [i for i in result.issues if i.code == "WGL004"]
+        wgl004_issues = result.issues_by_code().get("WGL004", [])
         assert len(wgl004_issues) > 0
 
 
@@ -161,8 +228,6 @@ class TestLintRuleWGL005:
 
     def test_wgl005_detects_raw_dict_artifacts(self):
         """Detect raw dict artifacts instead of Artifacts dataclass."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job
 
@@ -173,12 +238,9 @@ job = Job(
     artifacts={"paths": ["build/"]}
 )
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
-        wgl005_issues = [i for i in result.issues if i.code == "WGL005"]
+        wgl005_issues = result.issues_by_code().get("WGL005", [])
         assert len(wgl005_issues) > 0
 
 
@@ -187,17 +249,12 @@ class TestLintRuleWGL006:
 
     def test_wgl006_detects_string_stage(self):
         """Detect string literals for stage instead of constants."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job
 
 job = Job(name="test", stage="test", script=["echo test"])
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
         # WGL006 should not trigger if there's no Stage enum defined
         # This is a placeholder for when Stage constants are added
@@ -209,20 +266,15 @@ class TestLintRuleWGL007:
 
     def test_wgl007_detects_duplicate_job_names(self):
         """Detect duplicate job names in the same file."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job
 
 job1 = Job(name="build", stage="build", script=["make"])
 job2 = Job(name="build", stage="test", script=["test"])
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
-        wgl007_issues = [i for i in result.issues if i.code == "WGL007"]
+        wgl007_issues = result.issues_by_code().get("WGL007", [])
         assert len(wgl007_issues) > 0
 
 
@@ -231,8 +283,6 @@ class TestLintRuleWGL008:
 
     def test_wgl008_detects_too_many_jobs(self):
         """Detect files with too many jobs."""
-        from wetwire_gitlab.linter import lint_file
-
         # Create a file with many jobs
         jobs = []
         for i in range(15):
@@ -245,12 +295,9 @@ from wetwire_gitlab.pipeline import Job
 
 """ + "\n".join(jobs)
 
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name), max_jobs=10)
+        result = lint_source(code, max_jobs=10)
 
-        wgl008_issues = [i for i in result.issues if i.code == "WGL008"]
+        wgl008_issues = result.issues_by_code().get("WGL008", [])
         assert len(wgl008_issues) > 0
 
 
@@ -259,34 +306,38 @@ class TestLinterConfig:
 
     def test_exclude_rules(self):
         """Exclude specific rules from linting."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job
 
 job1 = Job(name="build", stage="build", script=["make"])
 job2 = Job(name="build", stage="test", script=["test"])
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name), exclude_rules=["WGL007"])
+        result = lint_source(code, exclude_rules=["WGL007"])
 
-        wgl007_issues = [i for i in result.issues if i.code == "WGL007"]
+        wgl007_issues = result.issues_by_code().get("WGL007", [])
         assert len(wgl007_issues) == 0
 
+    def test_rule_registry_changes_apply(self, monkeypatch):
+        """Rules added to RULE_REGISTRY run on the next lint call."""
+
+        class Custom:
+            code = "XX001"
+
+            def check(self, tree, file_path):
+                return [LintIssue(self.code, "custom", str(file_path), 1)]
+
+        lint_source("x = 1")
+        monkeypatch.setitem(RULE_REGISTRY, "XX001", Custom)
+
+        assert [i.code for i in lint_source("x = 1").issues] == ["XX001"]
+
     def test_lint_success_returns_true(self):
         """Lint success returns True."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 # A simple Python file with no issues
 x = 1
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
         assert result.success is True
         assert len(result.issues) == 0
@@ -297,18 +348,13 @@ class TestLinterOutput:
 
     def test_lint_issue_has_required_fields(self):
         """Lint issues have all required fields."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job
 
 job1 = Job(name="build", stage="build", script=["make"])
 job2 = Job(name="build", stage="test", script=["test"])
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
         if result.issues:
             issue = result.issues[0]
@@ -323,8 +369,6 @@ class TestLintRuleWGL009:
 
     def test_wgl009_detects_common_rule_patterns(self):
         """Detect Rule() with common patterns that have predefined constants."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job, Rule
 
@@ -335,18 +379,13 @@ job = Job(
     rules=[Rule(if_="$CI_COMMIT_BRANCH == $CI_DEFAULT_BRANCH")]
 )
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
-        wgl009_issues = [i for i in result.issues if i.code == "WGL009"]
+        wgl009_issues = result.issues_by_code().get("WGL009", [])
         assert len(wgl009_issues) > 0
 
     def test_wgl009_detects_tag_pattern(self):
         """Detect Rule() with tag pattern."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job, Rule
 
@@ -357,18 +396,13 @@ job = Job(
     rules=[Rule(if_="$CI_COMMIT_TAG")]
 )
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
-        wgl009_issues = [i for i in result.issues if i.code == "WGL009"]
+        wgl009_issues = result.issues_by_code().get("WGL009", [])
         assert len(wgl009_issues) > 0
 
     def test_wgl009_allows_custom_rules(self):
         """Allow custom Rule() without predefined patterns."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job, Rule
 
@@ -379,12 +413,9 @@ job = Job(
     rules=[Rule(if_="$CUSTOM_VAR == 'yes'")]
 )
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
-        wgl009_issues = [i for i in result.issues if i.code == "WGL009"]
+        wgl009_issues = result.issues_by_code().get("WGL009", [])
         assert len(wgl009_issues) == 0
 
 
@@ -393,8 +424,6 @@ class TestLintRuleWGL010:
 
     def test_wgl010_detects_string_when_manual(self):
         """Detect when='manual' string instead of When.MANUAL."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job
 
@@ -405,18 +434,13 @@ job = Job(
     when="manual"
 )
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
-        wgl010_issues = [i for i in result.issues if i.code == "WGL010"]
+        wgl010_issues = result.issues_by_code().get("WGL010", [])
         assert len(wgl010_issues) > 0
 
     def test_wgl010_detects_string_when_always(self):
         """Detect when='always' string instead of When.ALWAYS."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job
 
@@ -427,18 +451,13 @@ job = Job(
     when="always"
 )
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
-        wgl010_issues = [i for i in result.issues if i.code == "WGL010"]
+        wgl010_issues = result.issues_by_code().get("WGL010", [])
         assert len(wgl010_issues) > 0
 
     def test_wgl010_allows_when_constant(self):
         """Allow When.MANUAL constant usage."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job
 from wetwire_gitlab.intrinsics import When
@@ -450,12 +469,9 @@ job = Job(
     when=When.MANUAL
 )
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
-        wgl010_issues = [i for i in result.issues if i.code == "WGL010"]
+        wgl010_issues = result.issues_by_code().get("WGL010", [])
         assert len(wgl010_issues) == 0
 
 
@@ -464,8 +480,6 @@ class TestLintRuleWGL011:
 
     def test_wgl011_detects_missing_stage(self):
         """Detect Job() without stage keyword."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job
 
@@ -474,18 +488,13 @@ job = Job(
     script=["make build"],
 )
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
-        wgl011_issues = [i for i in result.issues if i.code == "WGL011"]
+        wgl011_issues = result.issues_by_code().get("WGL011", [])
         assert len(wgl011_issues) > 0
 
     def test_wgl011_allows_explicit_stage(self):
         """Allow Job() with explicit stage keyword."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 from wetwire_gitlab.pipeline import Job
 
@@ -495,107 +504,104 @@ job = Job(
     script=["make build"],
 )
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        result = lint_source(code)
 
-        wgl011_issues = [i for i in result.issues if i.code == "WGL011"]
+        wgl011_issues = result.issues_by_code().get("WGL011", [])
         assert len(wgl011_issues) == 0
 
 
 class TestLinterEdgeCases:
     """Tests for linter edge cases and error handling."""
 
-    def test_lint_file_with_syntax_error(self):
+    def test_lint_file_with_syntax_error(self, tmp_path):
         """Lint file with Python syntax error returns empty result."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 def broken(
     # Missing closing paren
 x = 1
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name))
+        path = tmp_path / "sample.py"
+        path.write_text(code)
+        result = lint_file(path)
 
         assert result.success is True
         assert result.files_checked == 0
         assert len(result.issues) == 0
 
-    def test_lint_file_non_python_skipped(self):
+    def test_lint_file_non_python_skipped(self, tmp_path):
         """Lint non-Python files are skipped."""
-        from wetwire_gitlab.linter import lint_file
-
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False, mode="w") as f:
-            f.write("not python code")
-            f.flush()
-            result = lint_file(Path(f.name))
+        path = tmp_path / "sample.txt"
+        path.write_text("not python code")
+        result = lint_file(path)
 
         assert result.success is True
         assert result.files_checked == 0
 
     def test_lint_file_unknown_rule(self):
         """Lint with unknown rule code is ignored."""
-        from wetwire_gitlab.linter import lint_file
-
         code = """
 x = 1
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = lint_file(Path(f.name), rules=["UNKNOWN_RULE_999"])
+        result = lint_source(code, rules=["UNKNOWN_RULE_999"])
 
         assert result.success is True
         assert len(result.issues) == 0
 
-    def test_lint_directory_skips_pycache(self):
+    def test_lint_directory_skips_pycache(self, tmp_path):
         """Lint directory skips __pycache__ directories."""
-        from wetwire_gitlab.linter import lint_directory
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir)
-
-            # Create a normal Python file
-            (path / "jobs.py").write_text("""
+        # Create a normal Python file
+        (tmp_path / "jobs.py").write_text("""
 from wetwire_gitlab.pipeline import Job
 job = Job(name="test", stage="test", script=["echo test"])
 """)
 
-            # Create a __pycache__ directory with a Python file
-            pycache = path / "__pycache__"
-            pycache.mkdir()
-            (pycache / "cached.py").write_text("""
+        # Create a __pycache__ directory with a Python file
+        pycache = tmp_path / "__pycache__"
+        pycache.mkdir()
+        (pycache / "cached.py").write_text("""
 from wetwire_gitlab.pipeline import Job
 job = Job(name="cached", stage="test", script=["echo cached"])
 """)
 
-            result = lint_directory(path)
+        result = lint_directory(tmp_path)
 
         # Should only count jobs.py, not the cached file
         assert result.files_checked == 1
 
-    def test_lint_directory_skips_hidden_dirs(self):
+    def test_lint_directory_skips_hidden_dirs(self, tmp_path):
         """Lint directory skips hidden directories."""
-        from wetwire_gitlab.linter import lint_directory
+        # Create a normal Python file
+        (tmp_path / "jobs.py").write_text("x = 1")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir)
+        # Create a hidden directory with a Python file
+        hidden = tmp_path / ".hidden"
+        hidden.mkdir()
+        (hidden / "secret.py").write_text("y = 2")
 
-            # Create a normal Python file
-            (path / "jobs.py").write_text("x = 1")
+        result = lint_directory(tmp_path)
 
-            # Create a hidden directory with a Python file
-            hidden = path / ".hidden"
-            hidden.mkdir()
-            (hidden / "secret.py").write_text("y = 2")
+        # Should only count jobs.py, not the hidden file
+        assert result.files_checked == 1
 
-            result = lint_directory(path)
+    def test_lint_directory_skips_unreadable_dirs(self, tmp_path, monkeypatch):
+        """Lint directory skips subdirectories that cannot be listed."""
+        (tmp_path / "jobs.py").write_text("x = 1")
+        locked = tmp_path / "locked"
+        locked.mkdir()
+        (locked / "hidden.py").write_text("y = 2")
+
+        real_scandir = linter.os.scandir
+
+        def scandir(path):
+            if path == locked:
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        # chmod does not stop root, so refuse the listing directly
+        monkeypatch.setattr(linter.os, "scandir", scandir)
+
+        result = lint_directory(tmp_path)
 
-        # Should only count jobs.py, not the hidden file
         assert result.files_checked == 1
 
 
@@ -604,8 +610,6 @@ class TestLintCodeFunction:
 
     def test_lint_code_basic(self):
         """Lint code string works."""
-        from wetwire_gitlab.linter import lint_code
-
         code = """
 from wetwire_gitlab.pipeline import Job
 job = Job(name="test", stage="test", script=["echo test"])
@@ -615,8 +619,6 @@ job = Job(name="test", stage="test", script=["echo test"])
 
     def test_lint_code_with_syntax_error(self):
         """Lint code with syntax error returns empty list."""
-        from wetwire_gitlab.linter import lint_code
-
         code = """
 def broken(
     # Missing closing paren
@@ -626,8 +628,6 @@ def broken(
 
     def test_lint_code_with_exclude_rules(self):
         """Lint code with excluded rules."""
-        from wetwire_gitlab.linter import lint_code
-
         code = """
 from wetwire_gitlab.pipeline import Job
 job1 = Job(name="build", stage="build", script=["make"])
@@ -639,20 +639,37 @@ job2 = Job(name="build", stage="test", script=["test"])
 
     def test_lint_code_with_unknown_rule(self):
         """Lint code with unknown rule code is ignored."""
-        from wetwire_gitlab.linter import lint_code
-
         code = "x = 1"
         issues = lint_code(code, rules=["UNKNOWN_RULE_999"])
         assert issues == []
 
 
+class TestNodeIndex:
+    """Tests for the shared per-tree node indexes."""
+
+    def test_nodes_of_type_matches_walk(self):
+        """Nodes come back in ast.walk order, indexed once per tree."""
+        tree = ast.parse("job = Job(name=f(x), stage=g())")
+        calls = [n for n in ast.walk(tree) if isinstance(n, ast.Call)]
+
+        assert nodes_of_type(tree, ast.Call) == calls
+        assert nodes_of_type(tree, ast.Call) is nodes_of_type(tree, ast.Call)
+        assert nodes_of_type(tree, ast.Dict) == []
+
+    def test_calls_to_indexes_plain_name_calls(self):
+        """Calls are grouped by the bare name they call."""
+        tree = ast.parse("a = Job(rules=[Rule()])\nb = Job()\nc = ci.Job()")
+
+        assert [call.lineno for call in calls_to(tree, "Job")] == [1, 2]
+        assert len(calls_to(tree, "Rule")) == 1
+        assert calls_to(tree, "Include") == []
+
+
 class TestFixCodeFunction:
     """Tests for the fix_code function."""
 
     def test_fix_code_no_issues(self):
         """Fix code with no issues returns source unchanged."""
-        from wetwire_gitlab.linter import fix_code
-
         code = """
 from wetwire_gitlab.intrinsics import When
 from wetwire_gitlab.pipeline import Job
@@ -669,8 +686,6 @@ job = Job(
 
     def test_fix_code_with_insertions(self):
         """Fix code handles line insertions."""
-        from wetwire_gitlab.linter import fix_code
-
         # This test verifies insertion handling works
         # The actual fix behavior depends on rules that produce insertions
         code = """
@@ -693,8 +708,6 @@ class TestAddImportsFunction:
 
     def test_add_imports_after_existing(self):
         """Add imports after existing imports."""
-        from wetwire_gitlab.linter.linter import _add_imports
-
         source = """import os
 import sys
 
@@ -708,8 +721,6 @@ x = 1
 
     def test_add_imports_no_existing(self):
         """Add imports when no existing imports."""
-        from wetwire_gitlab.linter.linter import _add_imports
-
         source = """x = 1
 y = 2
 """
@@ -721,16 +732,12 @@ y = 2
 
     def test_add_imports_empty_set(self):
         """Add imports with empty set returns source unchanged."""
-        from wetwire_gitlab.linter.linter import _add_imports
-
         source = "x = 1"
         result = _add_imports(source, set())
         assert result == source
 
     def test_add_imports_after_docstring(self):
         """Add imports after module docstring."""
-        from wetwire_gitlab.linter.linter import _add_imports
-
         source = '''"""Module docstring."""
 
 x = 1
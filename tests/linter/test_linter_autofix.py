@@ -1,7 +1,5 @@
 """Tests for linter auto-fix functionality."""
 
-import tempfile
-
 
 class TestFixCode:
     """Tests for fix_code function."""
@@ -73,7 +71,7 @@ class TestFixFile:
 
         assert callable(fix_file)
 
-    def test_fix_file_reads_and_fixes_code(self):
+    def test_fix_file_reads_and_fixes_code(self, tmp_path):
         """fix_file reads file, applies fixes, and returns fixed code."""
         from wetwire_gitlab.linter import fix_file
 
@@ -81,15 +79,14 @@ class TestFixFile:
 
 job = Job(name="deploy", stage="deploy", script=["deploy"], when="manual")
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            result = fix_file(f.name)
+        path = tmp_path / "jobs.py"
+        path.write_text(code)
+        result = fix_file(str(path))
 
         assert 'when="manual"' not in result
         assert "When.MANUAL" in result
 
-    def test_fix_file_write_mode(self):
+    def test_fix_file_write_mode(self, tmp_path):
         """fix_file with write=True writes fixed code to file."""
         from wetwire_gitlab.linter import fix_file
 
@@ -97,15 +94,12 @@ job = Job(name="deploy", stage="deploy", script=["deploy"], when="manual")
 
 job = Job(name="deploy", stage="deploy", script=["deploy"], when="manual")
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            filepath = f.name
+        path = tmp_path / "jobs.py"
+        path.write_text(code)
 
-        fix_file(filepath, write=True)
+        fix_file(str(path), write=True)
 
-        with open(filepath) as f:
-            result = f.read()
+        result = path.read_text()
 
         assert 'when="manual"' not in result
         assert "When.MANUAL" in result
@@ -403,7 +397,7 @@ class TestAutoFixCLI:
         assert result.returncode == 0
         assert "--fix" in result.stdout
 
-    def test_lint_fix_applies_changes(self):
+    def test_lint_fix_applies_changes(self, tmp_path):
         """Lint with --fix applies fixes to files."""
         import subprocess
         import sys
@@ -412,19 +406,16 @@ class TestAutoFixCLI:
 
 job = Job(name="deploy", stage="deploy", script=["deploy"], when="manual")
 """
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False, mode="w") as f:
-            f.write(code)
-            f.flush()
-            filepath = f.name
+        path = tmp_path / "jobs.py"
+        path.write_text(code)
 
         subprocess.run(
-            [sys.executable, "-m", "wetwire_gitlab.cli", "lint", "--fix", filepath],
+            [sys.executable, "-m", "wetwire_gitlab.cli", "lint", "--fix", str(path)],
             capture_output=True,
             text=True,
         )
 
-        with open(filepath) as f:
-            fixed = f.read()
+        fixed = path.read_text()
 
         # Should have been fixed
         assert 'when="manual"' not in fixed, "Fix should have been applied"
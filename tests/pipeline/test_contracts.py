@@ -154,6 +154,26 @@ class TestResultTypes:
         )
         assert len(result.issues) == 1
         assert result.issues[0].code == "WGL001"
+        assert result.issues_by_code() == {"WGL001": result.issues}
+
+    def test_lint_issue_pickles_by_position(self):
+        """LintIssue round-trips through pickle without its field names."""
+        import pickle
+
+        from wetwire_gitlab.contracts import LintIssue
+
+        issue = LintIssue(
+            code="WGL010",
+            message="Use typed When constants",
+            file_path="/path/to/file.py",
+            line_number=3,
+            column=4,
+            fix_imports=["from wetwire_gitlab.intrinsics import When"],
+        )
+        data = pickle.dumps(issue)
+
+        assert pickle.loads(data) == issue
+        assert b"fix_imports" not in data
 
     def test_validate_result(self):
         """ValidateResult can be created."""
@@ -366,6 +366,22 @@ class TestBuildPipeline:
         assert "my-build-job" in parsed
         assert "name" not in parsed["my-build-job"]
 
+    def test_build_pipeline_dict_matches_yaml(self):
+        """build_pipeline_dict returns the data that build_pipeline_yaml dumps."""
+        from wetwire_gitlab.pipeline import Job, Pipeline
+        from wetwire_gitlab.serialize import build_pipeline_dict, build_pipeline_yaml
+
+        pipeline = Pipeline(stages=["build", "test"], variables={"CI_DEBUG": "true"})
+        jobs = [
+            Job(name="build", stage="build", script=["make build"]),
+            Job(name="test", stage="test", script=["make test"], needs=["build"]),
+        ]
+
+        result = build_pipeline_dict(pipeline, jobs)
+
+        assert list(result) == ["stages", "variables", "build", "test"]
+        assert result == yaml.safe_load(build_pipeline_yaml(pipeline, jobs))
+
 
 class TestFieldNameConversion:
     """Tests for field name conversion."""